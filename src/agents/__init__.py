@@ -2,9 +2,29 @@
 Agents module for JobHunterAI.
 
 This module contains AI agent configurations and instruction generators.
+
+Exports are resolved lazily (PEP 562) so importing a single submodule, e.g.
+``src.agents.application_guide_generator``, does not also load the
+instruction generator and platform templates.
 """
 
-from .instruction_generator import InstructionGenerator
-from .platform_configs import PLATFORM_INSTRUCTIONS
+from importlib import import_module
+
+_EXPORTS = {
+    'InstructionGenerator': '.instruction_generator',
+    'PLATFORM_INSTRUCTIONS': '.platform_configs',
+}
 
 __all__ = ['InstructionGenerator', 'PLATFORM_INSTRUCTIONS']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,18 +4,104 @@ Application Guide Generator
 Generates JSON instructions for Antigravity to auto-apply to approved jobs.
 """
 
-import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
-from src.core.database import Database
+from src.core.database import Database, Job
 from src.utils.config import ConfigLoader
+from src.utils.json_io import ensure_dir, write_json
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# (URL substring, platform type) pairs, checked in order
+_PLATFORM_NEEDLES = (
+    ('greenhouse.io', 'greenhouse'),
+    ('lever.co', 'lever'),
+    ('ashbyhq.com', 'ashby'),
+    ('workable.com', 'workable'),
+    ('linkedin.com', 'linkedin'),
+    ('indeed.com', 'indeed'),
+    ('glassdoor.com', 'glassdoor'),
+)
+
+# Form-filling instruction templates keyed by platform type
+_FORM_TEMPLATES = {
+    'greenhouse': """
+1. Navigate to {url}
+2. Click "Apply" or "Submit Application" button
+3. Fill form fields:
+   - First Name: {first_name}
+   - Last Name: {last_name}
+   - Email: {email}
+   - Phone: {phone}
+   - Resume: Upload file "{resume_path}"
+   - LinkedIn: {linkedin}
+4. Answer any screening questions (use best judgment or skip optional)
+5. **PAUSE at Submit button** - Wait for user confirmation
+""",
+    'lever': """
+1. Navigate to {url}
+2. Click "Apply for this job" button
+3. Fill form fields:
+   - Full Name: {name}
+   - Email: {email}
+   - Phone: {phone}
+   - Resume: Upload file "{resume_path}"
+   - Additional Information: "Please see my resume for detailed experience"
+4. **PAUSE at Submit button** - Wait for user confirmation
+""",
+    'ashby': """
+1. Navigate to {url}
+2. Click "Apply" button
+3. Fill form fields:
+   - Name: {name}
+   - Email: {email}
+   - Phone: {phone}
+   - Resume: Upload file "{resume_path}"
+4. Answer any required questions
+5. **PAUSE at Submit button** - Wait for user confirmation
+""",
+    'workable': """
+1. Navigate to {url}
+2. Click "Apply" button
+3. Fill form fields:
+   - Full Name: {name}
+   - Email: {email}
+   - Phone: {phone}
+   - Resume: Upload file "{resume_path}"
+4. Fill any additional required fields
+5. **PAUSE at Submit button** - Wait for user confirmation
+""",
+    'linkedin': """
+1. Navigate to {url}
+2. Click "Easy Apply" button (if available) or "Apply" button
+3. For Easy Apply:
+   - Resume: Upload file "{resume_path}"
+   - Answer screening questions
+   - Step through wizard
+4. For External Apply:
+   - Fill form on company website
+   - Use Email: {email}, Phone: {phone}
+5. **PAUSE at final Submit/Review step** - Wait for user confirmation
+""",
+    # Generic / other platforms (indeed, glassdoor, company career pages)
+    'generic': """
+1. Navigate to {url}
+2. Look for "Apply" or "Submit Application" button
+3. Fill standard form fields:
+   - Name: {name}
+   - Email: {email}
+   - Phone: {phone}
+   - Resume: Upload file "{resume_path}"
+4. Complete any additional required fields
+5. **PAUSE before final submit** - Wait for user confirmation
+""",
+}
+
 
 class ApplicationGuideGenerator:
     """
@@ -42,7 +128,6 @@ class ApplicationGuideGenerator:
         self.db = db or Database()
         self.config_loader = config_loader or ConfigLoader()
         self.output_dir = Path("instructions")
-        self.output_dir.mkdir(exist_ok=True)
     
     def generate_application_guide(
         self,
@@ -57,16 +142,14 @@ class ApplicationGuideGenerator:
         Returns:
             dict with instruction_file, applications_count, etc.
         """
+        now = datetime.now()
         if not campaign_date:
-            campaign_date = datetime.now().strftime('%Y-%m-%d')
+            campaign_date = now.strftime('%Y-%m-%d')
         
         logger.info(f"Generating application guide for {campaign_date}")
         
-        # Get approved jobs
-        high_match = self._get_high_match_jobs(campaign_date)
-        medium_approved = self._get_approved_medium_jobs(campaign_date)
-        
-        all_approved = high_match + medium_approved
+        # Get approved jobs (HIGH auto matches + approved MEDIUM) in one query
+        all_approved = self.db.get_application_candidates(campaign_date)
         
         if not all_approved:
             logger.warning("No approved jobs found for application guide")
@@ -77,33 +160,31 @@ class ApplicationGuideGenerator:
                 "message": "No approved jobs found. Run GLM filtering first."
             }
         
-        # Load credentials for form filling
-        credentials_obj = self.config_loader.get_credentials()
+        high_match = [job for job in all_approved if job.status == 'matched']
+        medium_approved = [job for job in all_approved if job.status == 'approved']
+        
+        # Load personal info for form filling
         resume_obj = self.config_loader.get_resume()
         
         # Generate instructions for each job
         applications = []
-        for job_obj in all_approved:
-            # Convert Job dataclass to dict
-            job = {
-                'id': job_obj.id,
-                'company': job_obj.company,
-                'title': job_obj.title,
-                'url': job_obj.url,
-                'source': job_obj.source,
-                'match_score': job_obj.match_score or 0
-            }
+        for job in all_approved:
+            # Derive per-job values once and share them with the form builder
+            platform = self._detect_platform_type(job.url)
+            resume_path = self._get_resume_path(job)
 
             app_instruction = {
-                "job_id": job['id'],
-                "company": job['company'],
-                "title": job['title'],
-                "url": job['url'],
-                "source": job.get('source', 'unknown'),
-                "score": int(job.get('match_score', 0) * 100),  # Convert 0-1 to 0-100
-                "resume_path": self._get_resume_path(job),
-                "instructions": self._generate_form_instructions(job, resume_obj.personal_info),
-                "platform_type": self._detect_platform_type(job['url']),
+                "job_id": job.id,
+                "company": job.company,
+                "title": job.title,
+                "url": job.url,
+                "source": job.source or 'unknown',
+                "score": int((job.match_score or 0) * 100),  # Convert 0-1 to 0-100
+                "resume_path": resume_path,
+                "instructions": self._generate_form_instructions(
+                    job, resume_obj.personal_info, platform, resume_path
+                ),
+                "platform_type": platform,
                 "pause_before_submit": True,  # Safety: User review before submit
                 "rate_limit_seconds": 300  # 5 min between applications
             }
@@ -112,7 +193,7 @@ class ApplicationGuideGenerator:
         # Create instruction file
         instruction_file = {
             "_metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": now.isoformat(),
                 "task_type": "apply_to_jobs",
                 "campaign_date": campaign_date,
                 "version": "1.0"
@@ -136,9 +217,8 @@ class ApplicationGuideGenerator:
         }
         
         # Save to file
-        output_path = self.output_dir / f"apply_jobs_{campaign_date}.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(instruction_file, f, indent=2)
+        output_path = ensure_dir(self.output_dir) / f"apply_jobs_{campaign_date}.json"
+        write_json(output_path, instruction_file)
         
         logger.info(f"Application guide saved to {output_path}")
         
@@ -152,172 +232,70 @@ class ApplicationGuideGenerator:
                       f"Run: antigravity run {output_path}"
         }
     
-    def _get_high_match_jobs(self, date: str) -> list:
-        """Get HIGH match jobs (decision_type='auto')."""
-        # Use get_matched_jobs with high threshold (≥85% = 0.85)
-        all_matched = self.db.get_matched_jobs(
-            min_score=0.85,
-            max_score=1.0,
-            status="matched",
-            limit=100
-        )
-
-        # Filter by date and decision_type
-        result = []
-        for job in all_matched:
-            # Check if job has decision_type='auto' and matches the date
-            if job.decision_type == 'auto':
-                # Parse date from scraped_at timestamp
-                job_date = job.scraped_at.strftime('%Y-%m-%d') if job.scraped_at else None
-                if job_date == date:
-                    result.append(job)
-
-        return result
-    
-    def _get_approved_medium_jobs(self, date: str) -> list:
-        """Get approved MEDIUM match jobs."""
-        # Use get_jobs_by_status to get approved jobs
-        all_approved = self.db.get_jobs_by_status(status="approved", limit=100)
-
-        # Filter by date and score range (60-84% = 0.60-0.84)
-        result = []
-        for job in all_approved:
-            # Check score is in medium range
-            if job.match_score and 0.60 <= job.match_score < 0.85:
-                # Parse date from scraped_at timestamp
-                job_date = job.scraped_at.strftime('%Y-%m-%d') if job.scraped_at else None
-                if job_date == date:
-                    result.append(job)
-
-        return result
-    
-    def _get_resume_path(self, job: dict) -> str:
+    def _get_resume_path(self, job: Job) -> str:
         """Generate resume path for job."""
-        company = job['company'].replace(' ', '_').replace('/', '-')[:20]
-        title = job['title'].replace(' ', '_').replace('/', '-')[:20]
+        return self._resume_path_for(job.company, job.title)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _resume_path_for(company: str, title: str) -> str:
+        """Build the sanitized resume path for a (company, title) pair."""
+        company = company.replace(' ', '_').replace('/', '-')[:20]
+        title = title.replace(' ', '_').replace('/', '-')[:20]
         return f"output/{company}_{title}.pdf"
     
     def _detect_platform_type(self, url: str) -> str:
         """Detect application platform type from URL."""
+        return self._detect_platform_type_cached(url)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _detect_platform_type_cached(url: str) -> str:
+        """Match URL against _PLATFORM_NEEDLES; memoized per URL."""
         url_lower = url.lower()
-        
-        if 'greenhouse.io' in url_lower:
-            return 'greenhouse'
-        elif 'lever.co' in url_lower:
-            return 'lever'
-        elif 'ashbyhq.com' in url_lower:
-            return 'ashby'
-        elif 'workable.com' in url_lower:
-            return 'workable'
-        elif 'linkedin.com' in url_lower:
-            return 'linkedin'
-        elif 'indeed.com' in url_lower:
-            return 'indeed'
-        elif 'glassdoor.com' in url_lower:
-            return 'glassdoor'
-        else:
-            return 'generic'
+        return next(
+            (platform for needle, platform in _PLATFORM_NEEDLES if needle in url_lower),
+            'generic'
+        )
     
     def _generate_form_instructions(
         self,
-        job: dict,
-        personal_info
+        job: Job,
+        personal_info,
+        platform: Optional[str] = None,
+        resume_path: Optional[str] = None
     ) -> str:
         """
         Generate natural language instructions for form filling.
 
         Platform-specific instructions based on URL.
+
+        Args:
+            job: Job to apply to (company, title and url are used)
+            personal_info: PersonalInfo used to fill form fields
+            platform: Pre-detected platform type (detected from URL if omitted)
+            resume_path: Pre-computed resume path (derived from job if omitted)
         """
-        url = job['url']
-        resume_path = self._get_resume_path(job)
-        platform = self._detect_platform_type(url)
+        url = job.url
+        if platform is None:
+            platform = self._detect_platform_type(url)
+        if resume_path is None:
+            resume_path = self._get_resume_path(job)
 
-        # Common fields
         name = personal_info.name
-        email = personal_info.email
-        phone = personal_info.phone
-        linkedin = personal_info.linkedin or ''
-        
-        if platform == 'greenhouse':
-            return f"""
-1. Navigate to {url}
-2. Click "Apply" or "Submit Application" button
-3. Fill form fields:
-   - First Name: {name.split()[0] if ' ' in name else name}
-   - Last Name: {name.split()[-1] if ' ' in name else ''}
-   - Email: {email}
-   - Phone: {phone}
-   - Resume: Upload file "{resume_path}"
-   - LinkedIn: {linkedin}
-4. Answer any screening questions (use best judgment or skip optional)
-5. **PAUSE at Submit button** - Wait for user confirmation
-"""
-        
-        elif platform == 'lever':
-            return f"""
-1. Navigate to {url}
-2. Click "Apply for this job" button
-3. Fill form fields:
-   - Full Name: {name}
-   - Email: {email}
-   - Phone: {phone}
-   - Resume: Upload file "{resume_path}"
-   - Additional Information: "Please see my resume for detailed experience"
-4. **PAUSE at Submit button** - Wait for user confirmation
-"""
-        
-        elif platform == 'ashby':
-            return f"""
-1. Navigate to {url}
-2. Click "Apply" button
-3. Fill form fields:
-   - Name: {name}
-   - Email: {email}
-   - Phone: {phone}
-   - Resume: Upload file "{resume_path}"
-4. Answer any required questions
-5. **PAUSE at Submit button** - Wait for user confirmation
-"""
-        
-        elif platform == 'workable':
-            return f"""
-1. Navigate to {url}
-2. Click "Apply" button
-3. Fill form fields:
-   - Full Name: {name}
-   - Email: {email}
-   - Phone: {phone}
-   - Resume: Upload file "{resume_path}"
-4. Fill any additional required fields
-5. **PAUSE at Submit button** - Wait for user confirmation
-"""
-        
-        elif platform == 'linkedin':
-            return f"""
-1. Navigate to {url}
-2. Click "Easy Apply" button (if available) or "Apply" button
-3. For Easy Apply:
-   - Resume: Upload file "{resume_path}"
-   - Answer screening questions
-   - Step through wizard
-4. For External Apply:
-   - Fill form on company website
-   - Use Email: {email}, Phone: {phone}
-5. **PAUSE at final Submit/Review step** - Wait for user confirmation
-"""
-        
-        else:  # Generic / other platforms
-            return f"""
-1. Navigate to {url}
-2. Look for "Apply" or "Submit Application" button
-3. Fill standard form fields:
-   - Name: {name}
-   - Email: {email}
-   - Phone: {phone}
-   - Resume: Upload file "{resume_path}"
-4. Complete any additional required fields
-5. **PAUSE before final submit** - Wait for user confirmation
-"""
+        # Split once; a name without a space is used whole as the first name
+        parts = name.split() if ' ' in name else [name, '']
+
+        return _FORM_TEMPLATES.get(platform, _FORM_TEMPLATES['generic']).format(
+            url=url,
+            resume_path=resume_path,
+            name=name,
+            first_name=parts[0],
+            last_name=parts[-1],
+            email=personal_info.email,
+            phone=personal_info.phone,
+            linkedin=personal_info.linkedin or '',
+        )
 
 
 # CLI support for testing
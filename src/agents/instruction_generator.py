@@ -5,12 +5,21 @@ Reads job search preferences and platform credentials to generate
 JSON instruction files for the Antigravity agent to scrape jobs.
 """
 
-import json
-import re
+import os
+import pickle
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    # Drop-in for re with better worst-case behaviour on malformed markdown
+    import regex as re
+except ImportError:  # pragma: no cover - optional dependency
+    import re
+
+from src.utils.json_io import ensure_dir, write_json
+
 from .platform_configs import (
     PLATFORM_INSTRUCTIONS,
     PLATFORM_PRIORITY,
@@ -18,6 +27,23 @@ from .platform_configs import (
     get_platform_instruction
 )
 
+# Patterns used by read_preferences / read_credentials, compiled once
+_SALARY_RE = re.compile(r'- Minimum: \$?([\d,]+)')
+
+# A platform's yaml fence must sit inside its own section: the lazy scan stops
+# at the next level 1-3 heading instead of running on through the file
+_CRED_BLOCK_RE = re.compile(
+    r'### (LinkedIn|Indeed|Wellfound|Glassdoor)(?:(?!\n#{1,3} ).)*?```yaml\n(.*?)\n```',
+    re.DOTALL
+)
+
+# Parsed-preferences cache; bump _CACHE_VERSION when the parsed shape changes
+_PREFERENCES_CACHE = 'preferences.pkl'
+_CACHE_VERSION = 1
+
+# First words that mark a bullet as a description rather than a job title
+_SKIP_FIRST_WORDS = frozenset({'your', 'focus', 'these', 'strong', 'reliable', 'broader'})
+
 
 class InstructionGenerator:
     """Generates Antigravity scraping instructions from preferences and credentials."""
@@ -26,6 +52,7 @@ class InstructionGenerator:
         self,
         preferences_path: str = "config/preferences.md",
         credentials_path: str = "config/credentials.md",
+        cache_dir: Optional[str] = ".cache",
     ):
         """
         Initialize the instruction generator.
@@ -33,109 +60,86 @@ class InstructionGenerator:
         Args:
             preferences_path: Path to preferences.md file
             credentials_path: Path to credentials.md file
+            cache_dir: Directory for the parsed-preferences cache (None disables it)
         """
         self.preferences_path = Path(preferences_path)
         self.credentials_path = Path(credentials_path)
-        self.preferences = {}
-        self.credentials = {}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    @cached_property
+    def preferences(self) -> Dict[str, Any]:
+        """Parsed preferences, read from disk on first access."""
+        return self._parse_preferences()
+
+    @cached_property
+    def credentials(self) -> Dict[str, Dict[str, str]]:
+        """Parsed credentials, read from disk on first access."""
+        return self._parse_credentials()
 
     def read_preferences(self) -> Dict[str, Any]:
         """
         Parse preferences.md to extract job search preferences.
 
         Supports new format with Primary/Secondary/Tertiary sections.
+        Always re-reads the file and refreshes the preferences property.
 
         Returns:
             Dictionary containing job titles, locations, filters, etc.
         """
-        if not self.preferences_path.exists():
-            raise FileNotFoundError(f"Preferences file not found: {self.preferences_path}")
+        self.__dict__.pop('preferences', None)
+        return self.preferences
 
-        with open(self.preferences_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def read_credentials(self) -> Dict[str, Dict[str, str]]:
+        """
+        Parse credentials.md to extract platform login credentials.
 
-        job_titles = []
+        Always re-reads the file and refreshes the credentials property.
 
-        # NEW FORMAT: ### Primary (X positions)
-        primary_match = re.search(
-            r'### Primary \(\d+ positions?\).*?\n(.*?)(?=###|\n## )',
-            content,
-            re.DOTALL
-        )
-        if primary_match:
-            job_titles.extend(self._extract_titles_from_section(primary_match.group(1)))
-
-        # NEW FORMAT: ### Secondary (X positions)
-        secondary_match = re.search(
-            r'### Secondary \(\d+ positions?\).*?\n(.*?)(?=###|\n## )',
-            content,
-            re.DOTALL
-        )
-        if secondary_match:
-            job_titles.extend(self._extract_titles_from_section(secondary_match.group(1)))
-
-        # NEW FORMAT: ### Tertiary (X positions)
-        tertiary_match = re.search(
-            r'### Tertiary \(\d+ positions?\).*?\n(.*?)(?=\n## |\Z)',
-            content,
-            re.DOTALL
+        Returns:
+            Dictionary mapping platform names to their credentials
+        """
+        self.__dict__.pop('credentials', None)
+        return self.credentials
+
+    def _parse_preferences(self) -> Dict[str, Any]:
+        """Parse preferences.md; see read_preferences."""
+        try:
+            stat = self.preferences_path.stat()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Preferences file not found: {self.preferences_path}") from e
+
+        # Reuse the last parse while the file is unchanged
+        cache_key = (
+            f"{_CACHE_VERSION}:{self.preferences_path.resolve()}:"
+            f"{stat.st_mtime_ns}:{stat.st_size}"
         )
-        if tertiary_match:
-            job_titles.extend(self._extract_titles_from_section(tertiary_match.group(1)))
+        cached = self._load_cache(_PREFERENCES_CACHE, cache_key)
+        if cached is not None:
+            return cached
+
+        content = self.preferences_path.read_text(encoding='utf-8')
+
+        sections = self._split_sections(content)
+
+        # NEW FORMAT: ### Primary / Secondary / Tertiary (X positions)
+        job_titles = []
+        for heading in ('Primary', 'Secondary', 'Tertiary'):
+            job_titles.extend(self._extract_titles_from_section(sections.get(heading, [])))
 
         # FALLBACK: Old format support
         if not job_titles:
-            # Extract job titles from Primary Interest section (old format)
-            primary_match = re.search(
-                r'### Primary Interest:.*?\n(.*?)(?=###|\n## )',
-                content,
-                re.DOTALL
-            )
-            if primary_match:
-                job_titles.extend(self._extract_titles_from_section(primary_match.group(1)))
-
-            # Extract secondary job titles (old format)
-            secondary_match = re.search(
-                r'### Secondary Interest:.*?\n(.*?)(?=###|\n## )',
-                content,
-                re.DOTALL
-            )
-            if secondary_match:
-                job_titles.extend(self._extract_titles_from_section(secondary_match.group(1)))
-
-            # Extract also consider titles (old format)
-            also_match = re.search(
-                r'### Also Consider\n(.*?)(?=\n## )',
-                content,
-                re.DOTALL
-            )
-            if also_match:
-                job_titles.extend(self._extract_titles_from_section(also_match.group(1)))
+            for heading in ('Primary Interest', 'Secondary Interest', 'Also Consider'):
+                job_titles.extend(self._extract_titles_from_section(sections.get(heading, [])))
 
         # Extract location preferences
-        locations = []
-        location_match = re.search(
-            r'### Preferred\n(.*?)(?=###)',
-            content,
-            re.DOTALL
-        )
-        if location_match:
-            loc_section = location_match.group(1)
-            lines = loc_section.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('- '):
-                    loc = line[2:].strip()
-                    # Simplify location strings
-                    if 'Remote' in loc or 'Canada' in loc:
-                        locations.append(loc)
+        locations = [
+            loc for loc in sections.get('Preferred', [])
+            if 'Remote' in loc or 'Canada' in loc
+        ]
 
         # Extract salary requirements
-        min_salary = None
-        salary_match = re.search(r'- Minimum: \$?([\d,]+)', content)
-        if salary_match:
-            salary_str = salary_match.group(1).replace(',', '')
-            min_salary = int(salary_str)
+        salary_match = _SALARY_RE.search(content)
+        min_salary = int(salary_match.group(1).replace(',', '')) if salary_match else None
 
         # Check for remote only requirement
         remote_only = False
@@ -143,28 +147,19 @@ class InstructionGenerator:
             remote_only = True
 
         # Check for visa sponsorship
+        # "Requires Visa Sponsorship: No (for Canada), Open to TN sponsorship (for US)"
+        # means visa NOT required for Canada, but open to TN for US - every
+        # answer in use maps to False, so the line is not parsed further
         visa_sponsorship_required = False
-        if 'Requires Visa Sponsorship' in content:
-            # Parse the specific requirements
-            visa_match = re.search(r'Requires Visa Sponsorship: (.+)', content)
-            if visa_match:
-                visa_text = visa_match.group(1).lower()
-                # "No (for Canada), Open to TN sponsorship (for US)"
-                # This means visa NOT required for Canada, but open to TN for US
-                visa_sponsorship_required = False
 
         # Extract enabled platforms
-        enabled_platforms = []
-        platform_section = re.search(r'### Platforms\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
-        if platform_section:
-            lines = platform_section.group(1).strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('- ') and ': enabled' in line:
-                    platform = line.split(':')[0].replace('- ', '').strip()
-                    enabled_platforms.append(platform)
+        enabled_platforms = [
+            item.split(':')[0].strip()
+            for item in sections.get('Platforms', [])
+            if ': enabled' in item
+        ]
 
-        self.preferences = {
+        preferences = {
             'job_titles': job_titles,
             'locations': locations if locations else ['Remote', 'Canada'],
             'filters': {
@@ -175,131 +170,155 @@ class InstructionGenerator:
             'enabled_platforms': enabled_platforms if enabled_platforms else ['linkedin', 'indeed', 'wellfound'],
         }
 
-        return self.preferences
-
-    def read_credentials(self) -> Dict[str, Dict[str, str]]:
-        """
-        Parse credentials.md to extract platform login credentials.
-
-        Returns:
-            Dictionary mapping platform names to their credentials
-        """
-        if not self.credentials_path.exists():
-            raise FileNotFoundError(f"Credentials file not found: {self.credentials_path}")
+        self._store_cache(_PREFERENCES_CACHE, cache_key, preferences)
+        return preferences
 
-        with open(self.credentials_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def _parse_credentials(self) -> Dict[str, Dict[str, str]]:
+        """Parse credentials.md; see read_credentials."""
+        try:
+            content = self.credentials_path.read_text(encoding='utf-8')
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Credentials file not found: {self.credentials_path}") from e
 
         credentials = {}
 
-        # Extract LinkedIn credentials
-        linkedin_match = re.search(
-            r'### LinkedIn.*?```yaml\n(.*?)\n```',
-            content,
-            re.DOTALL
-        )
-        if linkedin_match:
-            creds = self._parse_yaml_block(linkedin_match.group(1))
-            credentials['linkedin'] = {
-                'email': creds.get('email', ''),
-                'password': creds.get('password', ''),
-            }
+        # Single pass over the platform yaml blocks; first block per platform wins
+        for match in _CRED_BLOCK_RE.finditer(content):
+            platform = match.group(1).lower()
+            if platform in credentials:
+                continue
 
-        # Extract Indeed credentials
-        indeed_match = re.search(
-            r'### Indeed.*?```yaml\n(.*?)\n```',
-            content,
-            re.DOTALL
-        )
-        if indeed_match:
-            creds = self._parse_yaml_block(indeed_match.group(1))
-            credentials['indeed'] = {
+            creds = self._parse_yaml_block(match.group(2))
+            credentials[platform] = {
                 'email': creds.get('email', ''),
                 'password': creds.get('password', ''),
-                'login_method': creds.get('login_method', 'email'),
             }
+            if platform == 'indeed':
+                credentials[platform]['login_method'] = creds.get('login_method', 'email')
 
-        # Extract Wellfound credentials
-        wellfound_match = re.search(
-            r'### Wellfound.*?```yaml\n(.*?)\n```',
-            content,
-            re.DOTALL
-        )
-        if wellfound_match:
-            creds = self._parse_yaml_block(wellfound_match.group(1))
-            credentials['wellfound'] = {
-                'email': creds.get('email', ''),
-                'password': creds.get('password', ''),
-            }
+        return credentials
 
-        # Extract Glassdoor credentials
-        glassdoor_match = re.search(
-            r'### Glassdoor.*?```yaml\n(.*?)\n```',
-            content,
-            re.DOTALL
-        )
-        if glassdoor_match:
-            creds = self._parse_yaml_block(glassdoor_match.group(1))
-            credentials['glassdoor'] = {
-                'email': creds.get('email', ''),
-                'password': creds.get('password', ''),
-            }
+    def _load_cache(self, name: str, key: str) -> Optional[Any]:
+        """
+        Load cached data if the cache file exists and was stored under key.
 
-        self.credentials = credentials
-        return credentials
+        Args:
+            name: Cache file name inside cache_dir
+            key: Key identifying the source file version
+
+        Returns:
+            Cached data, or None on a miss or unreadable cache
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.cache_dir / name, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.PickleError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        return entry.get('data')
+
+    def _store_cache(self, name: str, key: str, data: Any) -> None:
+        """
+        Atomically write data to the cache under key; failures are ignored.
+
+        Args:
+            name: Cache file name inside cache_dir
+            key: Key identifying the source file version
+            data: Picklable data to cache
+        """
+        if self.cache_dir is None:
+            return
+        try:
+            path = ensure_dir(self.cache_dir) / name
+            tmp_path = path.with_suffix(path.suffix + '.tmp')
+            tmp_path.write_bytes(pickle.dumps({'key': key, 'data': data}))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
 
     def _parse_yaml_block(self, yaml_text: str) -> Dict[str, str]:
         """
         Parse a simple YAML block into a dictionary.
 
+        Values are kept as raw strings (a full YAML loader would turn numeric
+        passwords into ints and reject values starting with '*' or '&').
+        Comment lines are skipped, as in MarkdownParser._parse_yaml_block.
+
         Args:
             yaml_text: YAML formatted text
 
         Returns:
             Dictionary of key-value pairs
         """
-        result = {}
-        for line in yaml_text.strip().split('\n'):
-            line = line.strip()
-            if ':' in line:
-                key, value = line.split(':', 1)
-                result[key.strip()] = value.strip()
-        return result
-
-    def _extract_titles_from_section(self, section_text: str) -> List[str]:
+        return {
+            key.strip(): value.strip()
+            for key, sep, value in (line.partition(':') for line in yaml_text.splitlines())
+            if sep and not key.lstrip().startswith('#')
+        }
+
+    def _split_sections(self, content: str) -> Dict[str, List[str]]:
         """
-        Extract job titles from a markdown section.
+        Group markdown bullet items under their '###' heading in one pass.
 
-        Filters out description lines (lines starting with common words like
-        'Your', 'Focus', 'These', etc.).
+        A section runs from its '###' heading to the next heading line of any
+        level. Headings are keyed by their name without any ':' suffix or
+        parenthesised note, so '### Primary (5 positions)' becomes 'Primary'
+        and '### Primary Interest: AI' becomes 'Primary Interest'. Only the
+        first section with a given name is kept.
 
         Args:
-            section_text: Text content of a section
+            content: Markdown document text
 
         Returns:
-            List of job titles
+            Dictionary mapping heading names to their '- ' bullet items
         """
-        titles = []
-        skip_prefixes = (
-            'Your', 'Focus', 'These', 'Strong', 'Reliable', 'Broader',
-            'your', 'focus', 'these', 'strong', 'reliable', 'broader',
-        )
+        sections: Dict[str, List[str]] = {}
+        current: Optional[List[str]] = None
+
+        for line in content.splitlines():
+            if line.startswith('#'):
+                current = None
+                if line.startswith('### '):
+                    name = line[4:].split(':', 1)[0].split(' (', 1)[0].strip()
+                    if name not in sections:
+                        current = sections[name] = []
+                continue
+
+            if current is not None:
+                line = line.strip()
+                if line.startswith('- '):
+                    current.append(line[2:].strip())
+
+        return sections
+
+    def _extract_titles_from_section(self, items: List[str]) -> List[str]:
+        """
+        Extract job titles from a section's bullet items.
+
+        Filters out description lines (lines whose first word is one of
+        _SKIP_FIRST_WORDS, e.g. 'Your', 'Focus', 'These').
 
-        for line in section_text.strip().split('\n'):
-            line = line.strip()
-            if line.startswith('- '):
-                title = line[2:].strip()
-                # Skip description lines
-                if title and not title.startswith(skip_prefixes):
-                    titles.append(title)
+        Args:
+            items: Bullet items of a section
 
-        return titles
+        Returns:
+            List of job titles
+        """
+        return [
+            title for title in items
+            if title
+            and title.split(' ', 1)[0].rstrip(':,;.').lower() not in _SKIP_FIRST_WORDS
+        ]
 
     def generate_instructions(
         self,
         output_dir: str = "instructions",
         filename: Optional[str] = None,
         mode: str = "standard",
+        pretty: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate complete Antigravity instruction JSON file.
@@ -314,6 +333,7 @@ class InstructionGenerator:
                 - quick: 2 primary + 1 secondary (~10 min)
                 - standard: 5 primary + 4 secondary (~30 min)
                 - full: all titles including tertiary (~50 min)
+            pretty: Indent the JSON for human reading (default: compact)
 
         Returns:
             Dictionary containing the generated instructions
@@ -323,22 +343,16 @@ class InstructionGenerator:
         if mode not in valid_modes:
             raise ValueError(f"Invalid mode '{mode}'. Must be one of: {valid_modes}")
 
-        # Read preferences and credentials
-        if not self.preferences:
-            self.read_preferences()
-        if not self.credentials:
-            self.read_credentials()
-
         # Generate timestamp
-        timestamp = datetime.now().isoformat()
+        now = datetime.now()
+        timestamp = now.isoformat()
 
         # Create output directory if it doesn't exist
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = ensure_dir(output_dir)
 
         # Generate filename
         if filename is None:
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            date_str = now.strftime("%Y-%m-%d")
             filename = f"scrape_jobs_{date_str}.json"
 
         # Categorize job titles by priority based on mode
@@ -367,10 +381,15 @@ class InstructionGenerator:
         }
 
         # Generate platform-specific instructions
-        data_dir = Path("data")
-        data_dir.mkdir(parents=True, exist_ok=True)
+        data_dir = str(ensure_dir("data"))
 
         locations_str = ', '.join(self.preferences['locations'])
+        filters = self.preferences['filters']
+        remote_only = filters['remote_only']
+        min_salary = filters['min_salary']
+        visa_required = filters['visa_sponsorship_required']
+        search_tasks = instructions['search_tasks']
+        task_counts: Dict[str, int] = {}  # search tasks emitted per platform
 
         for platform in self.preferences['enabled_platforms']:
             if platform not in self.credentials:
@@ -378,21 +397,25 @@ class InstructionGenerator:
                 continue
 
             platform_creds = self.credentials[platform]
+            email = platform_creds.get('email', '')
+            password = platform_creds.get('password', '***')
 
             # Generate INDEPENDENT search task for each job title
             for priority, titles in categorized_titles.items():
                 for title in titles:
-                    task_id = f"{platform}_{title.lower().replace(' ', '_')}"
+                    slug = title.lower().replace(' ', '_')
+                    task_id = f"{platform}_{slug}"
+                    task_output = os.path.join(data_dir, f"{task_id}.json")
 
                     instruction_params = {
-                        'email': platform_creds.get('email', ''),
-                        'password': platform_creds.get('password', '***'),
+                        'email': email,
+                        'password': password,
                         'job_titles': title,  # Single title per search
                         'locations': locations_str,
-                        'remote_only': self.preferences['filters']['remote_only'],
-                        'min_salary': self.preferences['filters']['min_salary'],
-                        'visa_sponsorship_required': self.preferences['filters']['visa_sponsorship_required'],
-                        'output_file': str(data_dir / f"{platform}_{title.lower().replace(' ', '_')}.json"),
+                        'remote_only': remote_only,
+                        'min_salary': min_salary,
+                        'visa_sponsorship_required': visa_required,
+                        'output_file': task_output,
                     }
 
                     instruction_text = get_platform_instruction(platform, **instruction_params)
@@ -404,22 +427,23 @@ class InstructionGenerator:
                         'priority': priority,
                         'max_pages': 5 if priority == 'primary' else 3,  # More pages for primary
                         'instructions': instruction_text,
-                        'output_file': instruction_params['output_file'],
+                        'output_file': task_output,
                     }
 
-                    instructions['search_tasks'].append(search_task)
+                    search_tasks.append(search_task)
+                    task_counts[platform] = task_counts.get(platform, 0) + 1
 
             # Also add platform summary for backward compatibility
             platform_config = {
                 'name': platform,
                 'priority': PLATFORM_PRIORITY.get(platform, 'medium'),
-                'total_searches': len([t for t in instructions['search_tasks'] if t['platform'] == platform]),
-                'output_dir': str(data_dir),
+                'total_searches': task_counts.get(platform, 0),
+                'output_dir': data_dir,
             }
             instructions['platforms'].append(platform_config)
 
         # Generate summary
-        total_tasks = len(instructions['search_tasks'])
+        total_tasks = len(search_tasks)
         instructions['_summary'] = {
             'mode': mode,
             'total_search_tasks': total_tasks,
@@ -432,8 +456,7 @@ class InstructionGenerator:
 
         # Save to file
         output_file = output_path / filename
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(instructions, f, indent=2, ensure_ascii=False)
+        write_json(output_file, instructions, pretty=pretty)
 
         print(f"Generated instruction file: {output_file}")
         print(f"Total search tasks: {instructions['_summary']['total_search_tasks']}")
@@ -499,7 +522,8 @@ class InstructionGenerator:
         """
         return self.generate_instructions(
             output_dir=str(Path(output_file).parent),
-            filename=Path(output_file).name
+            filename=Path(output_file).name,
+            pretty=True,
         )
 
 
@@ -4,6 +4,9 @@ Platform-specific instruction templates for Antigravity agent.
 This module defines natural language instructions for scraping jobs from various platforms.
 """
 
+from string import Formatter
+from typing import Dict, Optional, Tuple
+
 PLATFORM_INSTRUCTIONS = {
     'linkedin': """
 1. Navigate to LinkedIn Jobs (https://www.linkedin.com/jobs/)
@@ -161,11 +164,36 @@ def get_platform_instruction(platform_name: str, **kwargs) -> str:
     Raises:
         KeyError: If platform_name is not found
     """
-    template = PLATFORM_INSTRUCTIONS.get(platform_name.lower())
-    if template is None:
-        raise KeyError(f"Platform '{platform_name}' not found in PLATFORM_INSTRUCTIONS")
+    key = platform_name.lower()
+    segments = _COMPILED_INSTRUCTIONS.get(key)
+    if segments is None:
+        template = PLATFORM_INSTRUCTIONS.get(key)
+        if template is None:
+            raise KeyError(f"Platform '{platform_name}' not found in PLATFORM_INSTRUCTIONS")
+        segments = _COMPILED_INSTRUCTIONS[key] = _compile_template(template)
+
+    return ''.join(
+        literal if field is None else literal + format(kwargs[field])
+        for literal, field in segments
+    )
+
+
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Split a str.format template into (literal, field name) pairs once.
+
+    The templates only use plain {name} fields (no format specs or
+    conversions), so rendering is a join over the pre-parsed segments.
+    """
+    return tuple(
+        (literal, field)
+        for literal, field, _spec, _conversion in Formatter().parse(template)
+    )
+
 
-    return template.format(**kwargs)
+# PLATFORM_INSTRUCTIONS pre-parsed on first use, so placeholders are not
+# re-scanned per call and importers that never render pay nothing
+_COMPILED_INSTRUCTIONS: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {}
 
 
 # Platform priority mapping (higher is more important)
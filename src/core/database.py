@@ -1,14 +1,373 @@
 """SQLite database module for job tracking and management."""
 
+import atexit
 import sqlite3
 import hashlib
 import json
+import queue
+import re
+import threading
 from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterator
+from datetime import date as date_type, datetime, timedelta, timezone
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# PRAGMA user_version of the current schema.
+# 1: url_hash is BLAKE2b-128 of the URL (was MD5)
+# 2: fuzzy_hash ignores punctuation and legal suffixes (see fuzzy_hash)
+# 3: jobs timestamps are INTEGER Unix epoch seconds (were ISO-8601 TEXT)
+_SCHEMA_VERSION = 3
+
+# Current time as epoch seconds in SQL; unlike unixepoch() this works on
+# SQLite builds older than 3.38
+_NOW_EPOCH_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+# jobs columns stored as epoch seconds
+_JOB_TIMESTAMP_FIELDS = ('scraped_at', 'filtered_at', 'decided_at', 'applied_at')
+
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+_LEGAL_SUFFIX_RE = re.compile(r'\b(?:inc|llc|ltd|corp|corporation|co|gmbh|plc)\b')
+
+
+def hash_url(url: str) -> str:
+    """Hash a job URL for the jobs.url_hash deduplication column."""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+def fuzzy_hash(company: str, title: str) -> str:
+    """Hash company+title for the jobs.fuzzy_hash near-duplicate column.
+
+    Case, punctuation, extra whitespace and company legal suffixes are
+    ignored, so reposts such as "Acme, Inc." / "Sr. Engineer" and
+    "ACME" / "Sr Engineer" share a hash.
+    """
+    company = _LEGAL_SUFFIX_RE.sub(' ', _NON_ALNUM_RE.sub(' ', company.lower()))
+    title = _NON_ALNUM_RE.sub(' ', title.lower())
+    key = f"{' '.join(company.split())}|{' '.join(title.split())}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a JSON TEXT column value, with orjson when it is installed."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS accepts the int/float keys json.dumps allows
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+# Parse a JSON TEXT column value (orjson.loads accepts str as well)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _to_epoch(value: Any) -> Optional[int]:
+    """Convert a datetime, ISO-8601 string or number to epoch seconds.
+
+    Naive values are taken as UTC, the same way SQLite reads timestamp text.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _from_epoch(value: Optional[int]) -> Optional[datetime]:
+    """Convert epoch seconds back to the naive UTC datetime _to_epoch took."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
+# Parameters come from Database._job_params, in column order
+_INSERT_JOB_SQL = """
+    INSERT INTO jobs (
+        external_id, url_hash, fuzzy_hash, platform, url,
+        title, company, location,
+        salary_min, salary_max, salary_currency,
+        remote_type, visa_sponsorship, easy_apply,
+        jd_markdown, jd_raw,
+        match_score, match_reasoning, key_requirements, red_flags,
+        status, decision_type,
+        source, source_priority, is_processed,
+        scraped_at, filtered_at, decided_at, applied_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Timestamp column each status stamps when a job moves into it
+_STATUS_TIMESTAMP_FIELDS = {
+    status: field
+    for field, statuses in (
+        ('filtered_at', ('filtered',)),
+        ('decided_at', ('approved', 'rejected', 'skipped')),
+        ('applied_at', ('applied',)),
+    )
+    for status in statuses
+}
+
+# update_job_status statements, keyed by the status whose timestamp they set
+_UPDATE_STATUS_GENERIC_SQL = "UPDATE jobs SET status = ?, decision_type = ? WHERE id = ?"
+_UPDATE_STATUS_SQL = {
+    status: (
+        f"UPDATE jobs SET status = ?, decision_type = ?, {field} = {_NOW_EPOCH_SQL} "
+        "WHERE id = ?"
+    )
+    for status, field in _STATUS_TIMESTAMP_FIELDS.items()
+}
+
+# update_job_after_filter: filter results, status and filtered_at in one
+# statement, plus the resulting status's own timestamp when it has one
+_UPDATE_AFTER_FILTER_SQL = f"""
+    UPDATE jobs
+    SET match_score = ?,
+        match_reasoning = ?,
+        key_requirements = ?,
+        red_flags = ?,
+        status = ?,
+        decision_type = ?,
+        filtered_at = {_NOW_EPOCH_SQL}{{extra}}
+    WHERE id = ?
+"""
+_UPDATE_AFTER_FILTER_GENERIC_SQL = _UPDATE_AFTER_FILTER_SQL.format(extra="")
+_UPDATE_AFTER_FILTER_STATUS_SQL = {
+    status: _UPDATE_AFTER_FILTER_SQL.format(extra=f",\n        {field} = {_NOW_EPOCH_SQL}")
+    for status, field in _STATUS_TIMESTAMP_FIELDS.items()
+    if field != 'filtered_at'
+}
+
+# jobs columns read into Job objects. Listing queries use the light set,
+# which leaves out the (often tens of KB) jd_markdown/jd_raw text
+_LIGHT_JOB_COLUMNS = (
+    'id', 'external_id', 'platform', 'url', 'url_hash', 'fuzzy_hash',
+    'title', 'company', 'location',
+    'salary_min', 'salary_max', 'salary_currency',
+    'remote_type', 'visa_sponsorship', 'easy_apply',
+    'match_score', 'match_reasoning', 'key_requirements', 'red_flags',
+    'status', 'decision_type', 'source', 'source_priority', 'is_processed',
+    'scraped_at', 'filtered_at', 'decided_at', 'applied_at'
+)
+_JOB_COLS_LIGHT = ', '.join(_LIGHT_JOB_COLUMNS)
+_JOB_COLS_FULL = _JOB_COLS_LIGHT + ', jd_markdown, jd_raw'
+
+# Same, but rows that hit a UNIQUE constraint are skipped instead of raising
+_INSERT_NEW_JOB_SQL = _INSERT_JOB_SQL.rstrip() + "\n    ON CONFLICT DO NOTHING\n"
+
+# Bound parameters per IN (...) lookup, well under SQLITE_MAX_VARIABLE_NUMBER
+_IN_CHUNK_SIZE = 500
+
+
+_INSERT_LOG_SQL = """
+    INSERT INTO logs (level, component, message, details)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Most log rows the background writer inserts per transaction
+_LOG_BATCH_SIZE = 500
+
+# Counters update_run_stats may set, in the order they appear in its SQL
+_RUN_STATS_FIELDS = (
+    'jobs_scraped', 'jobs_filtered', 'jobs_matched',
+    'jobs_auto_applied', 'jobs_pending_decision', 'jobs_failed'
+)
+
+
+@lru_cache(maxsize=2 ** len(_RUN_STATS_FIELDS))
+def _run_stats_sql(fields: tuple) -> str:
+    """Build the UPDATE for a subset of _RUN_STATS_FIELDS, once per subset."""
+    return f"UPDATE runs SET {', '.join(f'{field} = ?' for field in fields)} WHERE id = ?"
+
+
+# Whole schema in one script; every statement is idempotent, and the script
+# runs in a single transaction
+_SCHEMA_SQL = """
+    BEGIN;
+
+    -- Jobs table
+    CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+        -- Identification (for deduplication)
+        external_id TEXT,
+        url_hash TEXT,
+        fuzzy_hash TEXT,
+        platform TEXT NOT NULL,
+        url TEXT NOT NULL,
+
+        -- Job details
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        location TEXT,
+        salary_min INTEGER,
+        salary_max INTEGER,
+        salary_currency TEXT DEFAULT 'USD',
+        remote_type TEXT,
+        visa_sponsorship BOOLEAN,
+        easy_apply BOOLEAN DEFAULT FALSE,
+
+        -- Content
+        jd_markdown TEXT,
+        jd_raw TEXT,
+
+        -- Filtering results
+        match_score REAL,
+        match_reasoning TEXT,
+        key_requirements TEXT,
+        red_flags TEXT,
+
+        -- Status tracking
+        status TEXT DEFAULT 'new',
+        decision_type TEXT,
+
+        -- Source tracking
+        source TEXT DEFAULT 'linkedin',
+        source_priority INTEGER DEFAULT 2,
+        is_processed BOOLEAN DEFAULT 0,
+
+        -- Timestamps (Unix epoch seconds, UTC)
+        scraped_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        filtered_at INTEGER,
+        decided_at INTEGER,
+        applied_at INTEGER,
+
+        -- Constraints
+        UNIQUE(platform, external_id),
+        UNIQUE(url_hash)
+    );
+
+    -- Create indexes for jobs table
+    CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+    -- (status, match_score DESC) serves the score-ordered queries without
+    -- a sort step; it supersedes the old single-column score index
+    DROP INDEX IF EXISTS idx_jobs_match_score;
+    CREATE INDEX IF NOT EXISTS idx_jobs_status_score
+        ON jobs(status, match_score DESC);
+    CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at);
+    CREATE INDEX IF NOT EXISTS idx_jobs_platform ON jobs(platform);
+    CREATE INDEX IF NOT EXISTS idx_jobs_fuzzy_hash ON jobs(fuzzy_hash);
+    CREATE INDEX IF NOT EXISTS idx_jobs_status_scraped_at
+        ON jobs(status, scraped_at, decision_type, match_score);
+
+    -- Full-text index over jobs (external content, so text is not stored
+    -- twice); the triggers below keep it in sync
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company, jd_markdown,
+        content='jobs', content_rowid='id',
+        tokenize='porter unicode61'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, jd_markdown)
+        VALUES (new.id, new.title, new.company, new.jd_markdown);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, jd_markdown)
+        VALUES ('delete', old.id, old.title, old.company, old.jd_markdown);
+    END;
+
+    -- Only the indexed columns; status/score updates leave the index alone
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_update
+    AFTER UPDATE OF title, company, jd_markdown ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, jd_markdown)
+        VALUES ('delete', old.id, old.title, old.company, old.jd_markdown);
+        INSERT INTO jobs_fts(rowid, title, company, jd_markdown)
+        VALUES (new.id, new.title, new.company, new.jd_markdown);
+    END;
+
+    -- Applications table
+    CREATE TABLE IF NOT EXISTS applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_id INTEGER UNIQUE REFERENCES jobs(id),
+        resume_path TEXT,
+        cover_letter_path TEXT,
+        status TEXT DEFAULT 'pending',
+        error_message TEXT,
+        attempts INTEGER DEFAULT 0,
+        submitted_at TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications(job_id);
+    CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
+
+    -- Resumes table
+    CREATE TABLE IF NOT EXISTS resumes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_id INTEGER REFERENCES jobs(id),
+        pdf_path TEXT NOT NULL,
+        html_content TEXT,
+        highlights TEXT,
+        tailoring_notes TEXT,
+        generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_resumes_job_id ON resumes(job_id);
+
+    -- Runs table
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP,
+        jobs_scraped INTEGER DEFAULT 0,
+        jobs_filtered INTEGER DEFAULT 0,
+        jobs_matched INTEGER DEFAULT 0,
+        jobs_auto_applied INTEGER DEFAULT 0,
+        jobs_pending_decision INTEGER DEFAULT 0,
+        jobs_failed INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'running'
+    );
+
+    -- Blacklist table
+    CREATE TABLE IF NOT EXISTS blacklist (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        type TEXT NOT NULL,
+        value TEXT NOT NULL,
+        reason TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(type, value)
+    );
+
+    -- Logs table
+    CREATE TABLE IF NOT EXISTS logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        level TEXT,
+        component TEXT,
+        message TEXT,
+        details TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_logs_level ON logs(level);
+    CREATE INDEX IF NOT EXISTS idx_logs_component ON logs(component);
+    CREATE INDEX IF NOT EXISTS idx_logs_created_at ON logs(created_at);
+
+    -- Filter result cache (LLM scores keyed by JD + resume + preferences hash)
+    CREATE TABLE IF NOT EXISTS filter_cache (
+        key TEXT PRIMARY KEY,
+        score REAL NOT NULL,
+        reasoning TEXT,
+        key_requirements TEXT,  -- JSON array
+        red_flags TEXT,  -- JSON array
+        visa_compatible BOOLEAN,
+        remote_compatible BOOLEAN,
+        salary_compatible BOOLEAN,
+        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    );
+
+    COMMIT;
+"""
+
 
 @dataclass
 class Job:
@@ -77,171 +436,123 @@ class Database:
     def __init__(self, db_path: str = "data/jobs.db"):
         """Initialize database connection.
 
+        Writes go through self.conn, serialized by a lock. Reads use a
+        read-only connection per thread, which WAL mode lets run alongside
+        the writer instead of queueing behind it, and which no other thread
+        contends for.
+
         Args:
             db_path: Path to SQLite database file.
                      Use ":memory:" for testing.
         """
         self.db_path = db_path
+        self._write_lock = threading.RLock()
+        self._pool_lock = threading.Lock()
+        # Per-thread state: the thread's reader connection, and whether the
+        # thread is inside transaction()
+        self._local = threading.local()
+        # Every reader opened, so close() can close them from any thread
+        self._all_readers: List[sqlite3.Connection] = []
+
+        # log() rows, written in batches by a thread started on first use
+        self._log_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_thread: Optional[threading.Thread] = None
 
         # Create parent directory if it doesn't exist
         if db_path != ":memory:":
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Room for every distinct statement this class issues, so none is
+        # recompiled after being evicted from the statement cache.
+        # Autocommit: a single write commits by itself, and batches share one
+        # commit by running inside transaction()
+        self.conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=512,
+            isolation_level=None
+        )
         self.conn.row_factory = sqlite3.Row
 
-        # Enable WAL mode for better concurrent read performance
         if db_path != ":memory:":
+            # page_size only takes effect on a new database, so set it
+            # before any table exists
+            self.conn.execute("PRAGMA page_size=4096")
+            # Enable WAL mode for better concurrent read performance
             self.conn.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode NORMAL is still crash-safe and skips the fsync per commit
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+            self.conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+            # Wait for a concurrent writer instead of failing with SQLITE_BUSY
+            self.conn.execute("PRAGMA busy_timeout=60000")
+
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64MB
+        self.conn.execute("PRAGMA temp_store=MEMORY")
 
         # Enable foreign keys
         self.conn.execute("PRAGMA foreign_keys=ON")
 
+        self._migrate()
+
     # === Initialization ===
 
     def init_schema(self) -> None:
         """Create all tables if they don't exist."""
-        cursor = self.conn.cursor()
-
-        # Jobs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-
-                -- Identification (for deduplication)
-                external_id TEXT,
-                url_hash TEXT,
-                fuzzy_hash TEXT,
-                platform TEXT NOT NULL,
-                url TEXT NOT NULL,
-
-                -- Job details
-                title TEXT NOT NULL,
-                company TEXT NOT NULL,
-                location TEXT,
-                salary_min INTEGER,
-                salary_max INTEGER,
-                salary_currency TEXT DEFAULT 'USD',
-                remote_type TEXT,
-                visa_sponsorship BOOLEAN,
-                easy_apply BOOLEAN DEFAULT FALSE,
-
-                -- Content
-                jd_markdown TEXT,
-                jd_raw TEXT,
-
-                -- Filtering results
-                match_score REAL,
-                match_reasoning TEXT,
-                key_requirements TEXT,
-                red_flags TEXT,
-
-                -- Status tracking
-                status TEXT DEFAULT 'new',
-                decision_type TEXT,
-
-                -- Source tracking
-                source TEXT DEFAULT 'linkedin',
-                source_priority INTEGER DEFAULT 2,
-                is_processed BOOLEAN DEFAULT 0,
-
-                -- Timestamps
-                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                filtered_at TIMESTAMP,
-                decided_at TIMESTAMP,
-                applied_at TIMESTAMP,
-
-                -- Constraints
-                UNIQUE(platform, external_id),
-                UNIQUE(url_hash)
-            )
-        """)
-
-        # Create indexes for jobs table
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_match_score ON jobs(match_score)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_platform ON jobs(platform)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_fuzzy_hash ON jobs(fuzzy_hash)")
-
-        # Applications table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS applications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER UNIQUE REFERENCES jobs(id),
-                resume_path TEXT,
-                cover_letter_path TEXT,
-                status TEXT DEFAULT 'pending',
-                error_message TEXT,
-                attempts INTEGER DEFAULT 0,
-                submitted_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications(job_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)")
-
-        # Resumes table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS resumes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER REFERENCES jobs(id),
-                pdf_path TEXT NOT NULL,
-                html_content TEXT,
-                highlights TEXT,
-                tailoring_notes TEXT,
-                generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_job_id ON resumes(job_id)")
-
-        # Runs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP,
-                jobs_scraped INTEGER DEFAULT 0,
-                jobs_filtered INTEGER DEFAULT 0,
-                jobs_matched INTEGER DEFAULT 0,
-                jobs_auto_applied INTEGER DEFAULT 0,
-                jobs_pending_decision INTEGER DEFAULT 0,
-                jobs_failed INTEGER DEFAULT 0,
-                status TEXT DEFAULT 'running'
-            )
-        """)
-
-        # Blacklist table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS blacklist (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                type TEXT NOT NULL,
-                value TEXT NOT NULL,
-                reason TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(type, value)
-            )
-        """)
-
-        # Logs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                level TEXT,
-                component TEXT,
-                message TEXT,
-                details TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        with self._write_lock:
+            tables = {row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )}
+            self.conn.executescript(_SCHEMA_SQL)
+            if 'jobs_fts' not in tables:
+                # Index jobs stored before the full-text table existed
+                self.conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+            if 'sqlite_stat1' not in tables:
+                # Planner statistics for the indexes just created; from then
+                # on close() keeps them current with PRAGMA optimize
+                self.conn.execute("ANALYZE")
+            self.conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    def _migrate(self) -> None:
+        """Bring an existing database up to _SCHEMA_VERSION."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
 
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_level ON logs(level)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_component ON logs(component)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_created_at ON logs(created_at)")
+        has_jobs = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+        ).fetchone()
+        if not has_jobs:
+            # Fresh database; init_schema stamps the version
+            return
 
-        self.conn.commit()
+        with self.transaction():
+            if version < 1:
+                # Version 1: re-hash URLs stored with MD5
+                rows = self.conn.execute("SELECT id, url FROM jobs").fetchall()
+                self.conn.executemany(
+                    "UPDATE jobs SET url_hash = ? WHERE id = ?",
+                    [(hash_url(row['url']), row['id']) for row in rows]
+                )
+            if version < 2:
+                # Version 2: recompute fuzzy hashes with the new normalization
+                rows = self.conn.execute(
+                    "SELECT id, company, title FROM jobs WHERE fuzzy_hash IS NOT NULL"
+                ).fetchall()
+                self.conn.executemany(
+                    "UPDATE jobs SET fuzzy_hash = ? WHERE id = ?",
+                    [(fuzzy_hash(row['company'], row['title']), row['id']) for row in rows]
+                )
+            if version < 3:
+                # Version 3: ISO-8601 text timestamps to epoch seconds. The
+                # old TIMESTAMP columns have NUMERIC affinity, so integers
+                # are stored as-is without redeclaring them
+                for field in _JOB_TIMESTAMP_FIELDS:
+                    self.conn.execute(f"""
+                        UPDATE jobs SET {field} = CAST(strftime('%s', {field}) AS INTEGER)
+                        WHERE typeof({field}) = 'text'
+                    """)
+            self.conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
 
     # === Job Operations ===
 
@@ -257,60 +568,74 @@ class Database:
         Raises:
             IntegrityError: If duplicate external_id or url_hash
         """
-        # Calculate url_hash
-        url_hash = hashlib.md5(job_data['url'].encode()).hexdigest()
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute(_INSERT_JOB_SQL, self._job_params(job_data))
+            return cursor.lastrowid
 
-        # Serialize list fields to JSON
-        key_requirements_json = json.dumps(job_data.get('key_requirements')) if job_data.get('key_requirements') else None
-        red_flags_json = json.dumps(job_data.get('red_flags')) if job_data.get('red_flags') else None
+    def insert_jobs_bulk(
+        self,
+        jobs: List[Dict[str, Any]],
+        skip_duplicates: bool = False
+    ) -> int:
+        """Insert many job records in a single transaction.
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO jobs (
-                external_id, url_hash, fuzzy_hash, platform, url,
-                title, company, location,
-                salary_min, salary_max, salary_currency,
-                remote_type, visa_sponsorship, easy_apply,
-                jd_markdown, jd_raw,
-                match_score, match_reasoning, key_requirements, red_flags,
-                status, decision_type,
-                source, source_priority, is_processed,
-                scraped_at, filtered_at, decided_at, applied_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            job_data.get('external_id'),
-            url_hash,
-            job_data.get('fuzzy_hash'),
-            job_data['platform'],
-            job_data['url'],
-            job_data['title'],
-            job_data['company'],
-            job_data.get('location'),
-            job_data.get('salary_min'),
-            job_data.get('salary_max'),
-            job_data.get('salary_currency', 'USD'),
-            job_data.get('remote_type'),
-            job_data.get('visa_sponsorship'),
-            job_data.get('easy_apply', False),
-            job_data.get('jd_markdown'),
-            job_data.get('jd_raw'),
-            job_data.get('match_score'),
-            job_data.get('match_reasoning'),
-            key_requirements_json,
-            red_flags_json,
-            job_data.get('status', 'new'),
-            job_data.get('decision_type'),
-            job_data.get('source', 'linkedin'),
-            job_data.get('source_priority', 2),
-            job_data.get('is_processed', False),
-            job_data.get('scraped_at'),
-            job_data.get('filtered_at'),
-            job_data.get('decided_at'),
-            job_data.get('applied_at')
-        ))
+        Rows are bound with executemany, so the INSERT is prepared once and
+        the whole batch costs one commit instead of one per job.
+
+        Args:
+            jobs: Dictionaries with job fields from scraper
+            skip_duplicates: Drop jobs already stored (see filter_new_jobs)
+                and ignore any remaining UNIQUE conflicts instead of raising
+
+        Returns:
+            Number of jobs inserted
+
+        Raises:
+            IntegrityError: If any job is a duplicate and skip_duplicates is
+                False; no job in the batch is inserted
+        """
+        sql = _INSERT_JOB_SQL
+        if skip_duplicates:
+            jobs = self.filter_new_jobs(jobs)
+            sql = _INSERT_NEW_JOB_SQL
+        if not jobs:
+            return 0
 
-        self.conn.commit()
-        return cursor.lastrowid
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.executemany(sql, [self._job_params(jd) for jd in jobs])
+
+        return cursor.rowcount
+
+    def filter_new_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the jobs whose URL is not stored yet.
+
+        URL hashes are looked up with IN (...) queries of up to
+        _IN_CHUNK_SIZE hashes, instead of one check_duplicate per job.
+        Repeated URLs within the batch are kept once (first wins).
+
+        Args:
+            jobs: Dictionaries with job fields from scraper (url required)
+        """
+        hashes = [hash_url(job['url']) for job in jobs]
+        existing = set()
+
+        with self._read() as conn:
+            for start in range(0, len(hashes), _IN_CHUNK_SIZE):
+                chunk = hashes[start:start + _IN_CHUNK_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                existing.update(row[0] for row in conn.execute(
+                    f"SELECT url_hash FROM jobs WHERE url_hash IN ({placeholders})",
+                    chunk
+                ))
+
+        new_jobs = []
+        for job, url_hash in zip(jobs, hashes):
+            if url_hash not in existing:
+                existing.add(url_hash)
+                new_jobs.append(job)
+        return new_jobs
 
     def insert_job_if_new(self, job_data: Dict[str, Any]) -> Optional[int]:
         """Insert job only if not duplicate.
@@ -318,67 +643,244 @@ class Database:
         Returns:
             Job ID if inserted, None if duplicate
         """
-        # Check for duplicates first
-        duplicate_check = self.check_duplicate(
-            platform=job_data['platform'],
-            external_id=job_data.get('external_id'),
-            url=job_data['url']
-        )
-
-        if duplicate_check['is_duplicate']:
-            return None
-
-        try:
-            return self.insert_job(job_data)
-        except sqlite3.IntegrityError:
-            # Race condition - another process inserted it
-            return None
+        # One statement: a duplicate url_hash or (platform, external_id)
+        # inserts nothing, with no preflight SELECT and no race window
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute(_INSERT_NEW_JOB_SQL, self._job_params(job_data))
+            # lastrowid is stale when nothing was inserted; rowcount is not
+            return cursor.lastrowid if cursor.rowcount else None
 
     def get_job_by_id(self, job_id: int) -> Optional[Job]:
         """Get single job by ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-        row = cursor.fetchone()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {_JOB_COLS_FULL} FROM jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
 
-        if not row:
-            return None
+            if not row:
+                return None
 
-        return self._row_to_job(row)
+            return self._row_to_job(row)
 
     def get_jobs_by_status(
         self,
         status: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        date: Optional[str] = None,
+        include_description: bool = True
     ) -> List[Job]:
-        """Get jobs with specific status."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM jobs WHERE status = ? ORDER BY scraped_at DESC LIMIT ? OFFSET ?",
-            (status, limit, offset)
-        )
+        """Get jobs with specific status.
+
+        Args:
+            status: Job status to match
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+            min_score: Optional inclusive lower bound on match_score
+            max_score: Optional exclusive upper bound on match_score
+            date: Optional scrape date (YYYY-MM-DD)
+            include_description: Load jd_markdown and jd_raw; pass False
+                for listings, which then leave both None
+        """
+        return list(self.iter_jobs_by_status(
+            status, limit, offset,
+            min_score=min_score, max_score=max_score, date=date,
+            include_description=include_description
+        ))
+
+    def iter_jobs_by_status(
+        self,
+        status: str,
+        limit: int = -1,
+        offset: int = 0,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        date: Optional[str] = None,
+        include_description: bool = True
+    ) -> Iterator[Job]:
+        """Stream jobs with specific status, newest first.
+
+        Same filters as get_jobs_by_status, but rows are converted one at a
+        time as the caller consumes them, so exports of every job in a
+        status never hold the whole result in memory. A read connection is
+        held until the iterator is exhausted or closed.
+
+        Args:
+            limit: Maximum number of jobs to yield (-1 for no limit)
+        """
+        columns = _JOB_COLS_FULL if include_description else _JOB_COLS_LIGHT
+        query = f"SELECT {columns} FROM jobs WHERE status = ?"
+        params: List[Any] = [status]
+
+        if min_score is not None:
+            query += " AND match_score >= ?"
+            params.append(min_score)
+        if max_score is not None:
+            query += " AND match_score < ?"
+            params.append(max_score)
+        if date is not None:
+            query += " AND scraped_at >= ? AND scraped_at < ?"
+            params.extend(self._epoch_range(date))
+
+        query += " ORDER BY scraped_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._read() as conn:
+            for row in conn.execute(query, params):
+                yield self._row_to_job(row)
+
+    def get_job_summaries(
+        self,
+        status: str,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Get the listing fields of jobs with a specific status.
+
+        Lighter than get_jobs_by_status for list views: only the columns
+        below are read, and no Job is built, so the job description and the
+        JSON/timestamp fields are never loaded or parsed.
+
+        Returns:
+            Dicts with id, title, company, url, match_score,
+            match_reasoning, status and scraped_at (epoch seconds),
+            newest first
+        """
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, title, company, url, match_score, match_reasoning, status, scraped_at
+                FROM jobs
+                WHERE status = ?
+                ORDER BY scraped_at DESC
+                LIMIT ? OFFSET ?
+            """, (status, limit, offset))
+
+            return [dict(row) for row in cursor]
 
-        return [self._row_to_job(row) for row in cursor.fetchall()]
+    def search_jobs(self, q: str, limit: int = 20) -> List[Job]:
+        """Full-text search over job title, company and description.
+
+        Args:
+            q: FTS5 query, e.g. 'rust' or '"machine learning" AND remote'
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Matching jobs, most relevant (BM25) first, without jd_markdown
+            and jd_raw (use get_job_by_id for those)
+        """
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {', '.join(f'j.{col}' for col in _LIGHT_JOB_COLUMNS)}
+                FROM jobs_fts f
+                JOIN jobs j ON j.id = f.rowid
+                WHERE jobs_fts MATCH ?
+                ORDER BY bm25(jobs_fts)
+                LIMIT ?
+            """, (q, limit))
+
+            return [self._row_to_job(row) for row in cursor]
 
     def get_matched_jobs(
         self,
         min_score: float = 0.60,
         max_score: float = 1.0,
         status: str = "matched",
-        limit: int = 20
+        limit: int = 20,
+        decision_type: Optional[str] = None,
+        date: Optional[str] = None
     ) -> List[Job]:
-        """Get jobs within score range."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM jobs
+        """Get jobs within score range.
+
+        jd_markdown and jd_raw are not loaded (left None); use
+        get_job_by_id when the description is needed.
+
+        Args:
+            min_score: Inclusive lower bound on match_score
+            max_score: Inclusive upper bound on match_score
+            status: Job status to match
+            limit: Maximum number of jobs to return
+            decision_type: Optional decision type ('auto' or 'manual')
+            date: Optional scrape date (YYYY-MM-DD)
+        """
+        query = f"""
+            SELECT {_JOB_COLS_LIGHT} FROM jobs
             WHERE status = ?
             AND match_score >= ?
             AND match_score <= ?
-            ORDER BY match_score DESC
-            LIMIT ?
-        """, (status, min_score, max_score, limit))
+        """
+        params: List[Any] = [status, min_score, max_score]
+
+        if decision_type is not None:
+            query += " AND decision_type = ?"
+            params.append(decision_type)
+        if date is not None:
+            query += " AND scraped_at >= ? AND scraped_at < ?"
+            params.extend(self._epoch_range(date))
+
+        query += " ORDER BY match_score DESC LIMIT ?"
+        params.append(limit)
+
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
 
-        return [self._row_to_job(row) for row in cursor.fetchall()]
+            return [self._row_to_job(row) for row in cursor]
+
+    def get_application_candidates(
+        self,
+        date: str,
+        high_threshold: float = 0.85,
+        medium_threshold: float = 0.60,
+        limit: int = 100
+    ) -> List[Job]:
+        """Get jobs ready for application on a scrape date in one query.
+
+        Returns HIGH matches (status='matched', decision_type='auto',
+        score >= high_threshold) ordered by score, followed by approved
+        MEDIUM matches (status='approved', medium_threshold <= score <
+        high_threshold) ordered by scrape time. Each band is capped at limit.
+        jd_markdown and jd_raw are not loaded.
+
+        Args:
+            date: Scrape date (YYYY-MM-DD)
+            high_threshold: Minimum score for HIGH matches
+            medium_threshold: Minimum score for MEDIUM matches
+            limit: Maximum number of jobs per band
+        """
+        start, end = self._epoch_range(date)
+
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT * FROM (
+                    SELECT {_JOB_COLS_LIGHT} FROM jobs
+                    WHERE status = 'matched'
+                    AND decision_type = 'auto'
+                    AND match_score >= ?
+                    AND scraped_at >= ? AND scraped_at < ?
+                    ORDER BY match_score DESC
+                    LIMIT ?
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT {_JOB_COLS_LIGHT} FROM jobs
+                    WHERE status = 'approved'
+                    AND match_score >= ? AND match_score < ?
+                    AND scraped_at >= ? AND scraped_at < ?
+                    ORDER BY scraped_at DESC
+                    LIMIT ?
+                )
+            """, (
+                high_threshold, start, end, limit,
+                medium_threshold, high_threshold, start, end, limit
+            ))
+
+            return [self._row_to_job(row) for row in cursor]
 
     def update_job_status(
         self,
@@ -386,32 +888,12 @@ class Database:
         status: str,
         decision_type: Optional[str] = None
     ) -> None:
-        """Update job status."""
-        cursor = self.conn.cursor()
-
-        # Set appropriate timestamp based on status
-        timestamp_field = None
-        if status == 'filtered':
-            timestamp_field = 'filtered_at'
-        elif status in ['approved', 'rejected', 'skipped']:
-            timestamp_field = 'decided_at'
-        elif status == 'applied':
-            timestamp_field = 'applied_at'
-
-        if timestamp_field:
-            cursor.execute(f"""
-                UPDATE jobs
-                SET status = ?, decision_type = ?, {timestamp_field} = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (status, decision_type, job_id))
-        else:
-            cursor.execute("""
-                UPDATE jobs
-                SET status = ?, decision_type = ?
-                WHERE id = ?
-            """, (status, decision_type, job_id))
-
-        self.conn.commit()
+        """Update job status, stamping the timestamp that status implies."""
+        with self._write_lock:
+            self.conn.execute(
+                _UPDATE_STATUS_SQL.get(status, _UPDATE_STATUS_GENERIC_SQL),
+                (status, decision_type, job_id)
+            )
 
     def update_job_filter_results(
         self,
@@ -422,25 +904,84 @@ class Database:
         red_flags: List[str]
     ) -> None:
         """Update job with filtering results."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            UPDATE jobs
-            SET match_score = ?,
-                match_reasoning = ?,
-                key_requirements = ?,
-                red_flags = ?,
-                filtered_at = CURRENT_TIMESTAMP,
-                status = 'filtered'
-            WHERE id = ?
-        """, (
-            score,
-            reasoning,
-            json.dumps(requirements),
-            json.dumps(red_flags),
-            job_id
-        ))
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute(f"""
+                UPDATE jobs
+                SET match_score = ?,
+                    match_reasoning = ?,
+                    key_requirements = ?,
+                    red_flags = ?,
+                    filtered_at = {_NOW_EPOCH_SQL},
+                    status = 'filtered'
+                WHERE id = ?
+            """, (
+                score,
+                reasoning,
+                _json_dumps(requirements),
+                _json_dumps(red_flags),
+                job_id
+            ))
+
+    def update_job_after_filter(
+        self,
+        job_id: int,
+        score: float,
+        reasoning: str,
+        requirements: List[str],
+        red_flags: List[str],
+        status: str,
+        decision_type: Optional[str] = None
+    ) -> None:
+        """Store filtering results and the routed status in a single UPDATE.
+
+        Equivalent to update_job_filter_results followed by
+        update_job_status, but one statement (and one commit) per job.
+        """
+        with self._write_lock:
+            self.conn.execute(
+                _UPDATE_AFTER_FILTER_STATUS_SQL.get(status, _UPDATE_AFTER_FILTER_GENERIC_SQL),
+                (
+                    score,
+                    reasoning,
+                    _json_dumps(requirements),
+                    _json_dumps(red_flags),
+                    status,
+                    decision_type,
+                    job_id
+                )
+            )
+
+    def update_jobs_after_filter(self, results: List[Dict[str, Any]]) -> None:
+        """Apply many update_job_after_filter calls in a single transaction.
+
+        Rows are grouped by status so each statement is bound with
+        executemany, instead of one execute and commit per job.
+
+        Args:
+            results: Dictionaries with update_job_after_filter's arguments
+                (decision_type may be omitted)
+        """
+        by_status: Dict[str, List[tuple]] = {}
+        for r in results:
+            by_status.setdefault(r['status'], []).append((
+                r['score'],
+                r['reasoning'],
+                _json_dumps(r['requirements']),
+                _json_dumps(r['red_flags']),
+                r['status'],
+                r.get('decision_type'),
+                r['job_id']
+            ))
+        if not by_status:
+            return
 
-        self.conn.commit()
+        with self.transaction():
+            for status, rows in by_status.items():
+                self.conn.executemany(
+                    _UPDATE_AFTER_FILTER_STATUS_SQL.get(status, _UPDATE_AFTER_FILTER_GENERIC_SQL),
+                    rows
+                )
 
     # === Deduplication ===
 
@@ -459,41 +1000,41 @@ class Database:
                 "existing_job_id": int | None
             }
         """
-        cursor = self.conn.cursor()
-
-        # Check by external_id and platform
-        if platform and external_id:
-            cursor.execute(
-                "SELECT id, status FROM jobs WHERE platform = ? AND external_id = ?",
-                (platform, external_id)
-            )
-            row = cursor.fetchone()
-            if row:
-                reason = "already_applied" if row['status'] == 'applied' else "already_scraped"
-                return {
-                    "is_duplicate": True,
-                    "reason": reason,
-                    "existing_job_id": row['id']
-                }
-
-        # Check by url_hash
-        if url:
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            cursor.execute("SELECT id, status FROM jobs WHERE url_hash = ?", (url_hash,))
-            row = cursor.fetchone()
-            if row:
-                reason = "already_applied" if row['status'] == 'applied' else "already_scraped"
-                return {
-                    "is_duplicate": True,
-                    "reason": reason,
-                    "existing_job_id": row['id']
-                }
-
-        return {
-            "is_duplicate": False,
-            "reason": None,
-            "existing_job_id": None
-        }
+        with self._read() as conn:
+            cursor = conn.cursor()
+
+            # Check by external_id and platform
+            if platform and external_id:
+                cursor.execute(
+                    "SELECT id, status FROM jobs WHERE platform = ? AND external_id = ?",
+                    (platform, external_id)
+                )
+                row = cursor.fetchone()
+                if row:
+                    reason = "already_applied" if row['status'] == 'applied' else "already_scraped"
+                    return {
+                        "is_duplicate": True,
+                        "reason": reason,
+                        "existing_job_id": row['id']
+                    }
+
+            # Check by url_hash
+            if url:
+                cursor.execute("SELECT id, status FROM jobs WHERE url_hash = ?", (hash_url(url),))
+                row = cursor.fetchone()
+                if row:
+                    reason = "already_applied" if row['status'] == 'applied' else "already_scraped"
+                    return {
+                        "is_duplicate": True,
+                        "reason": reason,
+                        "existing_job_id": row['id']
+                    }
+
+            return {
+                "is_duplicate": False,
+                "reason": None,
+                "existing_job_id": None
+            }
 
     # === Application Operations ===
 
@@ -504,14 +1045,13 @@ class Database:
         cover_letter_path: Optional[str] = None
     ) -> int:
         """Create application record."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO applications (job_id, resume_path, cover_letter_path)
-            VALUES (?, ?, ?)
-        """, (job_id, resume_path, cover_letter_path))
-
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                INSERT INTO applications (job_id, resume_path, cover_letter_path)
+                VALUES (?, ?, ?)
+            """, (job_id, resume_path, cover_letter_path))
+            return cursor.lastrowid
 
     def update_application_status(
         self,
@@ -520,36 +1060,38 @@ class Database:
         error_message: Optional[str] = None
     ) -> None:
         """Update application status."""
-        cursor = self.conn.cursor()
-
-        if status == 'submitted':
-            cursor.execute("""
-                UPDATE applications
-                SET status = ?, error_message = ?, submitted_at = CURRENT_TIMESTAMP,
-                    attempts = attempts + 1
-                WHERE job_id = ?
-            """, (status, error_message, job_id))
-        else:
-            cursor.execute("""
-                UPDATE applications
-                SET status = ?, error_message = ?, attempts = attempts + 1
-                WHERE job_id = ?
-            """, (status, error_message, job_id))
-
-        self.conn.commit()
+        with self._write_lock:
+            cursor = self.conn.cursor()
+
+            if status == 'submitted':
+                cursor.execute("""
+                    UPDATE applications
+                    SET status = ?, error_message = ?, submitted_at = CURRENT_TIMESTAMP,
+                        attempts = attempts + 1
+                    WHERE job_id = ?
+                """, (status, error_message, job_id))
+            else:
+                cursor.execute("""
+                    UPDATE applications
+                    SET status = ?, error_message = ?, attempts = attempts + 1
+                    WHERE job_id = ?
+                """, (status, error_message, job_id))
 
     def get_application_count_today(self) -> int:
-        """Get number of applications submitted today."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM applications
-            WHERE status = 'submitted'
-            AND DATE(submitted_at) = DATE('now')
-        """)
+        """Get number of applications submitted today (UTC, like CURRENT_TIMESTAMP)."""
+        start, end = self._date_range(datetime.now(timezone.utc).date().isoformat())
 
-        row = cursor.fetchone()
-        return row['count'] if row else 0
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*) as count
+                FROM applications
+                WHERE status = 'submitted'
+                AND submitted_at >= ? AND submitted_at < ?
+            """, (start, end))
+
+            row = cursor.fetchone()
+            return row['count'] if row else 0
 
     # === Resume Operations ===
 
@@ -561,101 +1103,87 @@ class Database:
         tailoring_notes: str
     ) -> int:
         """Save generated resume record."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO resumes (job_id, pdf_path, highlights, tailoring_notes)
-            VALUES (?, ?, ?, ?)
-        """, (job_id, pdf_path, json.dumps(highlights), tailoring_notes))
-
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                INSERT INTO resumes (job_id, pdf_path, highlights, tailoring_notes)
+                VALUES (?, ?, ?, ?)
+            """, (job_id, pdf_path, _json_dumps(highlights), tailoring_notes))
+            return cursor.lastrowid
 
     def get_resume_for_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """Get resume info for a job."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM resumes WHERE job_id = ? ORDER BY generated_at DESC LIMIT 1",
-            (job_id,)
-        )
-
-        row = cursor.fetchone()
-        if not row:
-            return None
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM resumes WHERE job_id = ? ORDER BY generated_at DESC LIMIT 1",
+                (job_id,)
+            )
 
-        return {
-            'id': row['id'],
-            'job_id': row['job_id'],
-            'pdf_path': row['pdf_path'],
-            'html_content': row['html_content'],
-            'highlights': json.loads(row['highlights']) if row['highlights'] else None,
-            'tailoring_notes': row['tailoring_notes'],
-            'generated_at': row['generated_at']
-        }
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            return {
+                'id': row['id'],
+                'job_id': row['job_id'],
+                'pdf_path': row['pdf_path'],
+                'html_content': row['html_content'],
+                'highlights': _json_loads(row['highlights']) if row['highlights'] else None,
+                'tailoring_notes': row['tailoring_notes'],
+                'generated_at': row['generated_at']
+            }
 
     # === Run Tracking ===
 
     def start_run(self) -> int:
         """Create new run record, return run_id."""
-        cursor = self.conn.cursor()
-        cursor.execute("INSERT INTO runs DEFAULT VALUES")
-
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("INSERT INTO runs DEFAULT VALUES")
+            return cursor.lastrowid
 
     def update_run_stats(self, run_id: int, **stats) -> None:
         """Update run statistics."""
-        # Build dynamic UPDATE query based on provided stats
-        valid_fields = [
-            'jobs_scraped', 'jobs_filtered', 'jobs_matched',
-            'jobs_auto_applied', 'jobs_pending_decision', 'jobs_failed'
-        ]
-
-        updates = []
-        values = []
-        for key, value in stats.items():
-            if key in valid_fields:
-                updates.append(f"{key} = ?")
-                values.append(value)
-
-        if not updates:
+        # Unknown keys are ignored; the column order is fixed so each subset
+        # of fields maps to one cached statement
+        fields = tuple(field for field in _RUN_STATS_FIELDS if field in stats)
+        if not fields:
             return
 
+        values = [stats[field] for field in fields]
         values.append(run_id)
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            f"UPDATE runs SET {', '.join(updates)} WHERE id = ?",
-            values
-        )
-
-        self.conn.commit()
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute(_run_stats_sql(fields), values)
 
     def complete_run(self, run_id: int, status: str = "completed") -> None:
         """Mark run as complete."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            UPDATE runs
-            SET completed_at = CURRENT_TIMESTAMP, status = ?
-            WHERE id = ?
-        """, (status, run_id))
-
-        self.conn.commit()
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                UPDATE runs
+                SET completed_at = CURRENT_TIMESTAMP, status = ?
+                WHERE id = ?
+            """, (status, run_id))
 
     def get_current_run(self) -> Optional[Dict[str, Any]]:
         """Get the latest running run."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM runs
-            WHERE status = 'running'
-            ORDER BY started_at DESC
-            LIMIT 1
-        """)
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM runs
+                WHERE status = 'running'
+                ORDER BY started_at DESC
+                LIMIT 1
+            """)
 
-        row = cursor.fetchone()
-        if not row:
-            return None
+            row = cursor.fetchone()
+            if not row:
+                return None
 
-        return dict(row)
+            return dict(row)
 
     def get_daily_stats(self, date) -> dict:
         """Get comprehensive statistics for a specific date.
@@ -678,76 +1206,70 @@ class Database:
             - claude_cost: Estimated Claude API cost
             - total_cost: Total estimated cost
         """
-        cursor = self.conn.cursor()
-        date_str = date.strftime('%Y-%m-%d')
-        
-        # Get job counts by match score
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN match_score >= 0.85 THEN 1 ELSE 0 END) as high_match,
-                SUM(CASE WHEN match_score >= 0.60 AND match_score < 0.85 THEN 1 ELSE 0 END) as medium_match,
-                SUM(CASE WHEN match_score < 0.60 THEN 1 ELSE 0 END) as rejected
-            FROM jobs
-            WHERE DATE(scraped_at) = ?
-        """, (date_str,))
-        
-        job_stats = cursor.fetchone()
-        
-        # Get application counts
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_applied,
-                SUM(CASE WHEN j.decision_type = 'auto' THEN 1 ELSE 0 END) as auto_applied,
-                SUM(CASE WHEN j.decision_type = 'manual' THEN 1 ELSE 0 END) as manual_applied
-            FROM jobs j
-            WHERE DATE(j.applied_at) = ?
-            AND j.status = 'applied'
-        """, (date_str,))
-        
-        app_stats = cursor.fetchone()
-        
-        # Get failed applications
-        cursor.execute("""
-            SELECT COUNT(*) as failed
-            FROM applications a
-            JOIN jobs j ON a.job_id = j.id
-            WHERE DATE(j.applied_at) = ?
-            AND a.status = 'failed'
-        """, (date_str,))
-        
-        failed_row = cursor.fetchone()
-        
-        # Get pending decisions
-        cursor.execute("""
-            SELECT COUNT(*) as pending
-            FROM jobs
-            WHERE status = 'pending_decision'
-        """)
-        
-        pending_row = cursor.fetchone()
-        
+        start, end = self._epoch_range(date.strftime('%Y-%m-%d'))
+
+        with self._read() as conn:
+            cursor = conn.cursor()
+            # All counters in one statement: scraped jobs by match score,
+            # applications by decision type, failures and pending decisions
+            cursor.execute("""
+                SELECT
+                    j.total, j.high_match, j.medium_match, j.rejected,
+                    a.total_applied, a.auto_applied, a.manual_applied,
+                    (
+                        SELECT COUNT(*)
+                        FROM applications ap
+                        JOIN jobs fj ON ap.job_id = fj.id
+                        WHERE fj.applied_at >= :start AND fj.applied_at < :end
+                        AND ap.status = 'failed'
+                    ) AS failed,
+                    (
+                        SELECT COUNT(*)
+                        FROM jobs
+                        WHERE status = 'pending_decision'
+                    ) AS pending
+                FROM (
+                    SELECT
+                        COUNT(*) AS total,
+                        SUM(CASE WHEN match_score >= 0.85 THEN 1 ELSE 0 END) AS high_match,
+                        SUM(CASE WHEN match_score >= 0.60 AND match_score < 0.85 THEN 1 ELSE 0 END) AS medium_match,
+                        SUM(CASE WHEN match_score < 0.60 THEN 1 ELSE 0 END) AS rejected
+                    FROM jobs
+                    WHERE scraped_at >= :start AND scraped_at < :end
+                ) AS j, (
+                    SELECT
+                        COUNT(*) AS total_applied,
+                        SUM(CASE WHEN decision_type = 'auto' THEN 1 ELSE 0 END) AS auto_applied,
+                        SUM(CASE WHEN decision_type = 'manual' THEN 1 ELSE 0 END) AS manual_applied
+                    FROM jobs
+                    WHERE applied_at >= :start AND applied_at < :end
+                    AND status = 'applied'
+                ) AS a
+            """, {'start': start, 'end': end})
+
+            stats = cursor.fetchone()
+
         # Calculate success rate
-        total_applied = app_stats['total_applied'] or 0
-        failed = failed_row['failed'] or 0
+        total_applied = stats['total_applied'] or 0
+        failed = stats['failed'] or 0
         success_rate = (total_applied - failed) / total_applied if total_applied > 0 else 0.0
-        
+
         # Calculate costs (estimates)
         # GLM: $0.001 per job filtered
         # Claude: $0.01 per resume tailored/applied
-        scraped = job_stats['total'] or 0
+        scraped = stats['total'] or 0
         glm_cost = scraped * 0.001
         claude_cost = total_applied * 0.01
-        
+
         return {
             'scraped': scraped,
-            'high_match': job_stats['high_match'] or 0,
-            'medium_match': job_stats['medium_match'] or 0,
-            'rejected': job_stats['rejected'] or 0,
-            'auto_applied': app_stats['auto_applied'] or 0,
-            'manual_applied': app_stats['manual_applied'] or 0,
+            'high_match': stats['high_match'] or 0,
+            'medium_match': stats['medium_match'] or 0,
+            'rejected': stats['rejected'] or 0,
+            'auto_applied': stats['auto_applied'] or 0,
+            'manual_applied': stats['manual_applied'] or 0,
             'failed': failed,
-            'pending': pending_row['pending'] or 0,
+            'pending': stats['pending'] or 0,
             'success_rate': success_rate,
             'glm_cost': glm_cost,
             'claude_cost': claude_cost,
@@ -764,34 +1286,70 @@ class Database:
         reason: Optional[str] = None
     ) -> None:
         """Add item to blacklist."""
-        cursor = self.conn.cursor()
-        try:
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            # Already listed items are ignored
             cursor.execute("""
-                INSERT INTO blacklist (type, value, reason)
+                INSERT OR IGNORE INTO blacklist (type, value, reason)
                 VALUES (?, ?, ?)
             """, (type, value, reason))
-            self.conn.commit()
-        except sqlite3.IntegrityError:
-            # Already exists, ignore
-            pass
 
     def is_blacklisted(self, company: str) -> bool:
         """Check if company is blacklisted."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM blacklist WHERE type = 'company' AND value = ?",
-            (company,)
-        )
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) as count FROM blacklist WHERE type = 'company' AND value = ?",
+                (company,)
+            )
 
-        row = cursor.fetchone()
-        return row['count'] > 0 if row else False
+            row = cursor.fetchone()
+            return row['count'] > 0 if row else False
 
     def get_blacklist(self) -> List[Dict[str, Any]]:
         """Get all blacklist entries."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM blacklist ORDER BY created_at DESC")
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM blacklist ORDER BY created_at DESC")
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
+
+    # === Filter Cache ===
+
+    def get_cached_filter_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached filter result by key, or None if not cached."""
+        with self._read() as conn:
+            row = conn.execute("""
+                SELECT score, reasoning, key_requirements, red_flags,
+                       visa_compatible, remote_compatible, salary_compatible
+                FROM filter_cache WHERE key = ?
+            """, (key,)).fetchone()
+
+        if row is None:
+            return None
+        result = dict(row)
+        result['key_requirements'] = _json_loads(row['key_requirements'] or '[]')
+        result['red_flags'] = _json_loads(row['red_flags'] or '[]')
+        return result
+
+    def cache_filter_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Store (or replace) a filter result under key."""
+        with self._write_lock:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO filter_cache (
+                    key, score, reasoning, key_requirements, red_flags,
+                    visa_compatible, remote_compatible, salary_compatible
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                key,
+                result['score'],
+                result.get('reasoning'),
+                _json_dumps(result.get('key_requirements') or []),
+                _json_dumps(result.get('red_flags') or []),
+                result.get('visa_compatible'),
+                result.get('remote_compatible'),
+                result.get('salary_compatible')
+            ))
 
     # === Logging ===
 
@@ -802,33 +1360,248 @@ class Database:
         message: str,
         details: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Insert log entry."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO logs (level, component, message, details)
-            VALUES (?, ?, ?, ?)
-        """, (level, component, message, json.dumps(details) if details else None))
+        """Queue a log entry.
+
+        The row is inserted by a background thread, batched with other
+        queued entries into one transaction, so callers never wait on the
+        write. Call flush_logs() to wait until queued entries are stored.
+        """
+        if self._log_thread is None:
+            self._start_log_writer()
+        self._log_q.put(
+            (level, component, message, _json_dumps(details) if details else None)
+        )
+
+    def flush_logs(self) -> None:
+        """Block until every entry queued by log() so far is written.
 
-        self.conn.commit()
+        Must not be called inside transaction(): the writer thread needs the
+        write lock the caller is holding.
+        """
+        if self._log_thread is None:
+            return
+        done = threading.Event()
+        self._log_q.put(done)
+        done.wait()
+
+    def _start_log_writer(self) -> None:
+        """Start the log writer thread once."""
+        with self._pool_lock:
+            if self._log_thread is not None:
+                return
+            self._log_thread = threading.Thread(
+                target=self._log_drain, name="db-log-writer", daemon=True
+            )
+            self._log_thread.start()
+        # The thread is a daemon; write what is still queued at exit
+        atexit.register(self._stop_log_writer)
+
+    def _stop_log_writer(self) -> None:
+        """Write the remaining queued entries and stop the writer thread."""
+        if self._log_thread is None:
+            return
+        atexit.unregister(self._stop_log_writer)
+        self._log_q.put(None)
+        self._log_thread.join()
+        self._log_thread = None
+
+    def _log_drain(self) -> None:
+        """Writer thread: insert queued log rows in batches.
+
+        Blocks for the next entry, then takes whatever else is already
+        queued (up to _LOG_BATCH_SIZE rows) and inserts it in one
+        transaction. Queued Events are set once the rows before them are
+        written; None stops the thread.
+        """
+        stop = False
+        while not stop:
+            batch, waiters = [], []
+            item = self._log_q.get()
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= _LOG_BATCH_SIZE:
+                    break
+                try:
+                    item = self._log_q.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    with self.transaction():
+                        self.conn.executemany(_INSERT_LOG_SQL, batch)
+            except sqlite3.Error:
+                # A failed log write must not stop later ones
+                pass
+            finally:
+                for waiter in waiters:
+                    waiter.set()
 
     # === Utility ===
 
     @contextmanager
     def transaction(self):
-        """Context manager for transactions."""
-        try:
-            yield self.conn
-            self.conn.commit()
-        except Exception:
-            self.conn.rollback()
-            raise
+        """Context manager for transactions.
+
+        Writes made inside the block, including through the single-write
+        methods, commit together at the end or roll back on error. Nested
+        blocks join the outer transaction.
+        """
+        with self._write_lock:
+            if self.conn.in_transaction:
+                yield self.conn
+                return
+
+            self.conn.execute("BEGIN")
+            self._local.writing = True
+            try:
+                yield self.conn
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._local.writing = False
 
     def close(self) -> None:
         """Close database connection."""
+        self._stop_log_writer()
+        with self._pool_lock:
+            for reader in self._all_readers:
+                reader.close()
+            self._all_readers.clear()
+        try:
+            # Re-analyze tables whose statistics this session made stale
+            self.optimize()
+        except sqlite3.Error:
+            # Already closed, or another connection holds the write lock
+            pass
         self.conn.close()
 
+    # === Maintenance ===
+
+    def optimize(self) -> None:
+        """Run PRAGMA optimize, refreshing planner statistics where stale.
+
+        Cheap enough to run at the end of every session; close() does.
+        """
+        with self._write_lock:
+            self.conn.execute("PRAGMA optimize")
+
+    def analyze(self) -> None:
+        """Rebuild the planner statistics for every table and index."""
+        with self._write_lock:
+            self.conn.execute("ANALYZE")
+
+    def vacuum(self) -> None:
+        """Rebuild the database file, reclaiming pages freed by deletes.
+
+        Rewrites the whole file, so it is meant for maintenance runs, not
+        for the pipeline. Cannot run inside transaction().
+        """
+        self.flush_logs()
+        with self._write_lock:
+            self.conn.execute("VACUUM")
+            if self.db_path != ":memory:":
+                # Shrink the WAL the rebuild filled back to zero bytes
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     # === Private Helpers ===
 
+    @contextmanager
+    def _read(self):
+        """Get a connection for a read-only query.
+
+        Yields the calling thread's reader connection, opened on first use.
+        Yields self.conn instead for ":memory:" databases, which cannot be
+        opened twice, and inside this thread's transaction() so its own
+        uncommitted writes stay visible.
+        """
+        if self.db_path == ":memory:" or getattr(self._local, 'writing', False):
+            yield self.conn
+            return
+
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            reader = self._local.reader = self._open_reader()
+        yield reader
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the calling thread."""
+        # check_same_thread=False only so close() may run on another thread;
+        # the connection is otherwise used by its own thread alone
+        reader = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=512
+        )
+        reader.row_factory = sqlite3.Row
+        reader.execute("PRAGMA mmap_size=268435456")
+        reader.execute("PRAGMA busy_timeout=60000")
+        with self._pool_lock:
+            self._all_readers.append(reader)
+        return reader
+
+    @staticmethod
+    def _date_range(date: str) -> tuple:
+        """Return half-open [start, end) timestamp bounds for a YYYY-MM-DD date.
+
+        Comparing the raw column against string bounds keeps the predicate
+        index-friendly, unlike wrapping the column in DATE().
+        """
+        day = date_type.fromisoformat(date)
+        return day.isoformat(), (day + timedelta(days=1)).isoformat()
+
+    @staticmethod
+    def _epoch_range(date: str) -> tuple:
+        """Like _date_range, as UTC epoch seconds for the jobs timestamps."""
+        start = _to_epoch(date_type.fromisoformat(date).isoformat())
+        return start, start + 86400
+
+    @staticmethod
+    def _job_params(job_data: Dict[str, Any]) -> tuple:
+        """Build the _INSERT_JOB_SQL parameters for a scraped job dict."""
+        key_requirements = job_data.get('key_requirements')
+        red_flags = job_data.get('red_flags')
+
+        return (
+            job_data.get('external_id'),
+            hash_url(job_data['url']),
+            job_data.get('fuzzy_hash'),
+            job_data['platform'],
+            job_data['url'],
+            job_data['title'],
+            job_data['company'],
+            job_data.get('location'),
+            job_data.get('salary_min'),
+            job_data.get('salary_max'),
+            job_data.get('salary_currency', 'USD'),
+            job_data.get('remote_type'),
+            job_data.get('visa_sponsorship'),
+            job_data.get('easy_apply', False),
+            job_data.get('jd_markdown'),
+            job_data.get('jd_raw'),
+            job_data.get('match_score'),
+            job_data.get('match_reasoning'),
+            _json_dumps(key_requirements) if key_requirements else None,
+            _json_dumps(red_flags) if red_flags else None,
+            job_data.get('status', 'new'),
+            job_data.get('decision_type'),
+            job_data.get('source', 'linkedin'),
+            job_data.get('source_priority', 2),
+            job_data.get('is_processed', False),
+            _to_epoch(job_data.get('scraped_at')),
+            _to_epoch(job_data.get('filtered_at')),
+            _to_epoch(job_data.get('decided_at')),
+            _to_epoch(job_data.get('applied_at'))
+        )
+
     def _row_to_job(self, row: sqlite3.Row) -> Job:
         """Convert database row to Job dataclass."""
         # Helper to safely get values with defaults
@@ -854,21 +1627,21 @@ class Database:
             remote_type=row['remote_type'],
             visa_sponsorship=row['visa_sponsorship'],
             easy_apply=bool(row['easy_apply']),
-            jd_markdown=row['jd_markdown'],
-            jd_raw=row['jd_raw'],
+            jd_markdown=safe_get('jd_markdown'),
+            jd_raw=safe_get('jd_raw'),
             match_score=row['match_score'],
             match_reasoning=row['match_reasoning'],
-            key_requirements=json.loads(row['key_requirements']) if row['key_requirements'] else None,
-            red_flags=json.loads(row['red_flags']) if row['red_flags'] else None,
+            key_requirements=_json_loads(row['key_requirements']) if row['key_requirements'] else None,
+            red_flags=_json_loads(row['red_flags']) if row['red_flags'] else None,
             status=row['status'],
             decision_type=row['decision_type'],
             source=safe_get('source', 'linkedin'),
             source_priority=safe_get('source_priority', 2),
             is_processed=bool(safe_get('is_processed', False)),
-            scraped_at=datetime.fromisoformat(row['scraped_at']) if row['scraped_at'] else None,
-            filtered_at=datetime.fromisoformat(row['filtered_at']) if row['filtered_at'] else None,
-            decided_at=datetime.fromisoformat(row['decided_at']) if row['decided_at'] else None,
-            applied_at=datetime.fromisoformat(row['applied_at']) if row['applied_at'] else None
+            scraped_at=_from_epoch(row['scraped_at']),
+            filtered_at=_from_epoch(row['filtered_at']),
+            decided_at=_from_epoch(row['decided_at']),
+            applied_at=_from_epoch(row['applied_at'])
         )
 
 
@@ -880,8 +1653,10 @@ if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python -m src.core.database <command>")
         print("Commands:")
-        print("  init   - Initialize database schema")
-        print("  stats  - Show database statistics")
+        print("  init    - Initialize database schema")
+        print("  stats   - Show database statistics")
+        print("  analyze - Rebuild query planner statistics")
+        print("  vacuum  - Reclaim free pages and compact the database file")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -957,6 +1732,18 @@ if __name__ == "__main__":
         blacklist_count = cursor.fetchone()['count']
         print(f"\nBlacklist Entries: {blacklist_count}")
 
+    elif command == "analyze":
+        print("Analyzing database...")
+        db.analyze()
+        print("Planner statistics updated")
+
+    elif command == "vacuum":
+        path = Path(db.db_path)
+        size_before = path.stat().st_size
+        print("Vacuuming database...")
+        db.vacuum()
+        print(f"Database size: {size_before:,} -> {path.stat().st_size:,} bytes")
+
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
@@ -7,12 +7,21 @@ This module provides:
 """
 
 import asyncio
+import re
+from collections import Counter
+from itertools import islice
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
 from src.core.database import Database, Job
 from src.core.llm import GLMClient, FilterResult
+from src.core.llm_cache import FilterCache
 from src.utils.config import ConfigLoader, Preferences, Resume
 from src.utils.logger import get_logger
 
@@ -55,31 +64,54 @@ DEFAULT_REJECT_KEYWORDS = [
 ]
 
 
+# Raised by some python-hyperscan versions when a match handler stops a scan
+_HS_SCAN_TERMINATED = getattr(hyperscan, "ScanTerminated", ())
+
+
+def _chunked(items: Iterable[Job], size: int) -> Iterator[List[Job]]:
+    """Yield lists of up to size items, pulling from items only as needed."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
 class PreFilter:
     """Pre-filter jobs based on keywords and blacklists.
     
     Quick rejection before expensive LLM calls to save costs.
     """
 
+    __slots__ = ("reject_keywords", "blacklisted_companies", "_reject_re", "_hs_db")
+
     def __init__(self, preferences: Preferences):
         """Initialize pre-filter with user preferences.
         
         Args:
             preferences: User job preferences with blacklists and keywords
         """
-        self.reject_keywords = [
+        user_keywords = [
             kw.lower() 
             for kw in (preferences.keywords.reject_keywords if preferences.keywords else [])
         ]
-        # Add default keywords if not already present
-        for default_kw in DEFAULT_REJECT_KEYWORDS:
-            if default_kw not in self.reject_keywords:
-                self.reject_keywords.append(default_kw)
+        # Add default keywords if not already present (dict keeps order, O(1) dedup)
+        self.reject_keywords = list(dict.fromkeys(user_keywords + DEFAULT_REJECT_KEYWORDS))
+        
+        # One alternation over all keywords, so each JD is scanned once
+        # instead of once per keyword (None when there is nothing to match)
+        self._reject_re = re.compile(
+            "|".join(re.escape(kw) for kw in self.reject_keywords)
+        ) if self.reject_keywords else None
+        # With python-hyperscan installed the same keywords are matched by
+        # its SIMD multi-literal engine instead; the regex stays as fallback
+        self._hs_db = (
+            self._compile_hyperscan(self.reject_keywords)
+            if hyperscan is not None and self.reject_keywords else None
+        )
         
-        self.blacklisted_companies = [
+        self.blacklisted_companies = frozenset(
             c.lower() 
             for c in preferences.blacklisted_companies
-        ]
+        )
         
         logger.info(
             f"PreFilter initialized: {len(self.blacklisted_companies)} blacklisted companies, "
@@ -99,16 +131,56 @@ class PreFilter:
         if job.company and job.company.lower() in self.blacklisted_companies:
             return True, f"Blacklisted company: {job.company}"
 
-        # Check reject keywords in job description
-        jd_lower = (job.jd_markdown or "").lower()
-        for keyword in self.reject_keywords:
-            if keyword in jd_lower:
+        # Check reject keywords in job description (lowercased only when
+        # there is something to scan)
+        jd = job.jd_markdown
+        if not jd or self._reject_re is None:
+            return False, None
+        jd_lower = jd.lower()
+        if self._hs_db is not None:
+            keyword = self._scan_hyperscan(jd_lower)
+            if keyword is not None:
                 return True, f"Reject keyword found: '{keyword}'"
+            return False, None
+
+        match = self._reject_re.search(jd_lower)
+        if match:
+            return True, f"Reject keyword found: '{match.group(0)}'"
 
         return False, None
 
+    @staticmethod
+    def _compile_hyperscan(keywords: List[str]) -> "hyperscan.Database":
+        """Compile keywords into a Hyperscan block-mode database.
+        
+        Pattern ids are indexes into keywords; each pattern reports at
+        most one match, since only the first hit matters.
+        """
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[re.escape(kw).encode("utf-8") for kw in keywords],
+            ids=list(range(len(keywords))),
+            elements=len(keywords),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords)
+        )
+        return db
+
+    def _scan_hyperscan(self, jd_lower: str) -> Optional[str]:
+        """Return the first reject keyword Hyperscan finds in jd_lower."""
+        hits: List[int] = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.append(pattern_id)
+            return True  # Stop scanning at the first hit
+
+        try:
+            self._hs_db.scan(jd_lower.encode("utf-8"), match_event_handler=on_match)
+        except _HS_SCAN_TERMINATED:
+            pass
+        return self.reject_keywords[hits[0]] if hits else None
+
 
-@dataclass
+@dataclass(slots=True)
 class FilterStats:
     """Statistics from a filtering run.
     
@@ -141,6 +213,32 @@ class FilterStats:
             f"Cost: ${self.cost_usd:.4f}"
         )
 
+    @classmethod
+    def from_outcomes(
+        cls,
+        total: int,
+        outcomes: Counter,
+        cost_usd: float = 0.0
+    ) -> "FilterStats":
+        """Build run stats from per-job outcome counts.
+        
+        Args:
+            total: Jobs pulled for the run
+            outcomes: Counts of "high", "medium", "rejected",
+                "pre_filtered" and "error" outcomes
+            cost_usd: Total LLM cost of the run
+        """
+        return cls(
+            total=total,
+            high_match=outcomes["high"],
+            medium_match=outcomes["medium"],
+            # Pre-filtered jobs are rejected too, just without an LLM call
+            rejected=outcomes["rejected"] + outcomes["pre_filtered"],
+            pre_filtered=outcomes["pre_filtered"],
+            errors=outcomes["error"],
+            cost_usd=cost_usd
+        )
+
 
 class JobFilterService:
     """Service for filtering jobs using GLM.
@@ -148,7 +246,7 @@ class JobFilterService:
     Orchestrates the complete filtering pipeline:
     1. Load jobs with status='new'
     2. Pre-filter (blacklist, keywords)
-    3. LLM scoring with GLM
+    3. LLM scoring with GLM (cached results reused for repeated JDs)
     4. Update database with results
     """
 
@@ -156,7 +254,8 @@ class JobFilterService:
         self,
         db: Optional[Database] = None,
         glm_client: Optional[GLMClient] = None,
-        config: Optional[ConfigLoader] = None
+        config: Optional[ConfigLoader] = None,
+        cache: Optional[FilterCache] = None
     ):
         """Initialize filter service.
         
@@ -164,17 +263,34 @@ class JobFilterService:
             db: Database instance (defaults to new Database())
             glm_client: GLM client (defaults to new GLMClient())
             config: Config loader (defaults to new ConfigLoader())
+            cache: Filter result cache (defaults to one backed by db)
         """
         self.db = db or Database()
         self.glm = glm_client or GLMClient()
         self.config = config or ConfigLoader()
+        self.cache = cache or FilterCache(self.db)
         
         # Load preferences for pre-filter
         preferences = self.config.get_preferences()
         self.pre_filter = PreFilter(preferences)
         
+        # Prompt inputs, built on first run and kept until invalidate_preferences()
+        self._resume_cache: Optional[Resume] = None
+        self._pref_summary_cache: Optional[str] = None
+        
         logger.info("JobFilterService initialized")
 
+    def invalidate_preferences(self) -> None:
+        """Reload config files and drop everything derived from them.
+        
+        Call after resume.md or preferences.md change; the next run
+        rebuilds the pre-filter and prompt summaries from the new files.
+        """
+        self.config.reload()
+        self.pre_filter = PreFilter(self.config.get_preferences())
+        self._resume_cache = None
+        self._pref_summary_cache = None
+
     async def filter_new_jobs(
         self,
         batch_size: int = 10,
@@ -189,81 +305,187 @@ class JobFilterService:
         Returns:
             FilterStats with results summary
         """
-        stats = FilterStats()
+        total = 0
+        outcomes: Counter = Counter()
         
-        # Get new jobs from database
-        jobs = self.db.get_jobs_by_status("new", limit=limit)
-        stats.total = len(jobs)
+        # Stream new jobs from database a batch at a time, so the first
+        # batch is scored without waiting for (or holding) the whole backlog
+        batches = _chunked(self.db.iter_jobs_by_status("new", limit=limit), batch_size)
+        batch = next(batches, None)
         
-        if not jobs:
+        if batch is None:
             logger.info("No new jobs to filter")
-            return stats
-        
-        logger.info(f"Filtering {len(jobs)} new jobs (batch_size={batch_size})")
+            return FilterStats()
         
-        # Load user profile
-        resume = self.config.get_resume()
-        preferences = self.config.get_preferences()
+        logger.info(f"Filtering up to {limit} new jobs (batch_size={batch_size})")
         
-        # Build preference summary for prompt
-        pref_summary = self._build_preference_summary(preferences)
+        # Load user profile and build preference summary for prompt (once
+        # per service, see invalidate_preferences)
+        if self._resume_cache is None:
+            self._resume_cache = self.config.get_resume()
+        if self._pref_summary_cache is None:
+            self._pref_summary_cache = self._build_preference_summary(
+                self.config.get_preferences()
+            )
+        resume = self._resume_cache
+        pref_summary = self._pref_summary_cache
         
         # Process jobs in batches
-        for i in range(0, len(jobs), batch_size):
-            batch = jobs[i:i + batch_size]
+        while batch is not None:
+            total += len(batch)
             
-            # Process batch
+            # Pre-filter the batch; rejects are written in one executemany
+            # off the event loop, and only the rest go to the LLM
+            keep, rejects = [], []
             for job in batch:
+                should_reject, reason = self.pre_filter.should_reject(job)
+                if should_reject:
+                    logger.debug(f"Pre-filtered job {job.id}: {reason}")
+                    rejects.append({
+                        "job_id": job.id,
+                        "score": 0.0,
+                        "reasoning": f"Pre-filter: {reason}",
+                        "requirements": [],
+                        "red_flags": [reason],
+                        "status": "rejected"
+                    })
+                else:
+                    keep.append(job)
+            
+            if rejects:
                 try:
-                    await self._filter_single_job(job, resume, pref_summary, stats)
+                    await asyncio.to_thread(self.db.update_jobs_after_filter, rejects)
+                    outcomes["pre_filtered"] += len(rejects)
                 except Exception as e:
-                    logger.error(f"Failed to filter job {job.id} ({job.title}): {e}")
-                    stats.errors += 1
+                    logger.error(f"Failed to store {len(rejects)} pre-filter rejects: {e}")
+                    outcomes["error"] += len(rejects)
             
-            # Rate limiting between batches
-            if i + batch_size < len(jobs):
+            # Score the rest; each job yields its outcome (or exception),
+            # counted here so no task touches shared counters. A batch the
+            # pre-filter emptied never reaches the async LLM path
+            if keep:
+                results = await self._score_batch(keep, resume, pref_summary)
+                for job, result in zip(keep, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Failed to filter job {job.id} ({job.title}): {result}")
+                        outcomes["error"] += 1
+                    else:
+                        outcomes[result] += 1
+            
+            # Rate limiting between batches (only needed after LLM requests)
+            batch = next(batches, None)
+            if batch is not None and keep:
                 await asyncio.sleep(0.5)
         
-        # Update stats with total cost
-        stats.cost_usd = self.glm.total_cost
+        # Fold outcomes into stats, with total cost
+        stats = FilterStats.from_outcomes(total, outcomes, self.glm.total_cost)
         
         logger.info(f"Filtering complete: {stats}")
         return stats
 
+    async def _score_batch(
+        self,
+        jobs: List[Job],
+        resume: Resume,
+        pref_summary: str
+    ) -> List[Union[str, Exception]]:
+        """Score pre-filtered jobs, one GLM request for the whole batch.
+        
+        Jobs whose (JD, resume, preferences) result is cached skip the LLM.
+        The rest fall back to concurrent per-job requests when only one is
+        left or the batched request fails (e.g. a malformed result array).
+        
+        Args:
+            jobs: Jobs that passed the pre-filter
+            resume: User resume
+            pref_summary: Formatted preferences summary
+            
+        Returns:
+            Outcome (see _route_result) or raised exception for each
+            job, in order
+        """
+        keys = [
+            self.cache.key(job.jd_markdown or "", resume.summary, pref_summary)
+            for job in jobs
+        ]
+        outcomes: List[Union[str, Exception, None]] = [None] * len(jobs)
+        routed: Dict[int, Tuple[Dict, str]] = {}
+        fresh: List[Tuple[str, FilterResult]] = []
+        
+        # Serve cached results first; only the misses cost a GLM request
+        pending = []
+        for i, (job, key) in enumerate(zip(jobs, keys)):
+            cached = self.cache.get(key)
+            if cached is None:
+                pending.append(i)
+            else:
+                logger.debug(f"Filter cache hit for job {job.id}")
+                routed[i] = self._route_result(job, cached)
+        
+        if len(pending) > 1:
+            try:
+                filter_results = await self.glm.filter_jobs_batch(
+                    jd_markdowns=[jobs[i].jd_markdown or "" for i in pending],
+                    resume_summary=resume.summary,
+                    preferences=pref_summary
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batch filtering of {len(pending)} jobs failed, "
+                    f"falling back to per-job requests: {e}"
+                )
+            else:
+                # filter_jobs_batch returns results in input order, matched
+                # by job number, so they line up with pending
+                for i, result in zip(pending, filter_results):
+                    fresh.append((keys[i], result))
+                    routed[i] = self._route_result(jobs[i], result)
+                pending = []
+        
+        if routed:
+            # One bulk write for everything scored so far, off the event loop
+            try:
+                await asyncio.to_thread(
+                    self._store_results, [row for row, _ in routed.values()], fresh
+                )
+            except Exception as e:
+                for i in routed:
+                    outcomes[i] = e
+            else:
+                for i, (_, outcome) in routed.items():
+                    outcomes[i] = outcome
+        
+        if pending:
+            results = await asyncio.gather(
+                *(
+                    self._filter_single_job(jobs[i], resume, pref_summary, keys[i])
+                    for i in pending
+                ),
+                return_exceptions=True
+            )
+            for i, result in zip(pending, results):
+                outcomes[i] = result
+        
+        return outcomes
+
     async def _filter_single_job(
         self,
         job: Job,
         resume: Resume,
         pref_summary: str,
-        stats: FilterStats
-    ) -> None:
-        """Filter a single job and update database.
+        cache_key: str
+    ) -> str:
+        """Score a single (already pre-filtered) job and update database.
         
         Args:
             job: Job to filter
             resume: User resume
             pref_summary: Formatted preferences summary
-            stats: Stats object to update
-        """
-        # Pre-filter check
-        should_reject, reason = self.pre_filter.should_reject(job)
-        if should_reject:
-            logger.debug(f"Pre-filtered job {job.id}: {reason}")
+            cache_key: FilterCache key the result is stored under
             
-            # Update database as rejected
-            self.db.update_job_status(job.id, "rejected")
-            self.db.update_job_filter_results(
-                job_id=job.id,
-                score=0.0,
-                reasoning=f"Pre-filter: {reason}",
-                requirements=[],
-                red_flags=[reason]
-            )
-            
-            stats.pre_filtered += 1
-            stats.rejected += 1
-            return
-        
+        Returns:
+            Outcome for this job (see _route_result)
+        """
         # LLM filtering
         try:
             result = await self.glm.filter_job(
@@ -275,53 +497,71 @@ class JobFilterService:
             logger.error(f"GLM filtering failed for job {job.id}: {e}")
             raise
         
-        # Update database with results
-        self._update_job_with_result(job, result, stats)
+        # Update database with results, off the event loop
+        row, outcome = self._route_result(job, result)
+        await asyncio.to_thread(self._store_results, [row], [(cache_key, result)])
+        return outcome
 
-    def _update_job_with_result(
+    def _store_results(
         self,
-        job: Job,
-        result: FilterResult,
-        stats: FilterStats
+        rows: List[Dict],
+        fresh: List[Tuple[str, FilterResult]]
     ) -> None:
-        """Update job record with filter result.
+        """Cache new LLM results and write routed rows (blocking).
+        
+        Run through asyncio.to_thread; Database serializes writers with
+        its own lock, so concurrent calls are safe.
+        
+        Args:
+            rows: update_jobs_after_filter rows from _route_result
+            fresh: (cache key, result) pairs returned by the LLM
+        """
+        for key, result in fresh:
+            self.cache.put(key, result)
+        self.db.update_jobs_after_filter(rows)
+
+    def _route_result(
+        self,
+        job: Job,
+        result: FilterResult
+    ) -> Tuple[Dict, str]:
+        """Route a filter result to its status by score.
         
         Args:
             job: Job being filtered
-            result: FilterResult from GLM
-            stats: Stats object to update
+            result: FilterResult from GLM (or the cache)
+            
+        Returns:
+            Tuple of (update_jobs_after_filter row, outcome), where outcome
+            is "high", "medium" or "rejected"
         """
         # Determine status and decision type based on score
         if result.score >= 0.85:
             status = "matched"
             decision_type = "auto"
-            stats.high_match += 1
+            outcome = "high"
             logger.info(f"High match (score={result.score:.2f}): {job.title} at {job.company}")
         elif result.score >= 0.60:
             status = "matched"
             decision_type = "manual"
-            stats.medium_match += 1
+            outcome = "medium"
             logger.info(f"Medium match (score={result.score:.2f}): {job.title} at {job.company}")
         else:
             status = "rejected"
             decision_type = None
-            stats.rejected += 1
+            outcome = "rejected"
             logger.debug(f"Rejected (score={result.score:.2f}): {job.title} at {job.company}")
         
-        # Update database
-        self.db.update_job_filter_results(
-            job_id=job.id,
-            score=result.score,
-            reasoning=result.reasoning,
-            requirements=result.key_requirements,
-            red_flags=result.red_flags
-        )
-        
-        self.db.update_job_status(
-            job_id=job.id,
-            status=status,
-            decision_type=decision_type
-        )
+        row = {
+            "job_id": job.id,
+            "score": result.score,
+            "reasoning": result.reasoning,
+            "requirements": result.key_requirements,
+            "red_flags": result.red_flags,
+            "status": status,
+            "decision_type": decision_type
+        }
+        return row, outcome
 
     def _build_preference_summary(self, preferences: Preferences) -> str:
         """Build formatted preference summary for prompts.
@@ -571,25 +571,25 @@ Return ONLY valid JSON, no markdown or extra text."""
             status = "rejected"
             decision_type = None
 
-        # Update database
-        self.db.update_job_filter_results(
-            job_id=job_id,
-            score=match_score,
-            reasoning=reasoning,
-            requirements=[],  # Extracted from reasoning if needed
-            red_flags=[]  # Extracted from reasoning if needed
-        )
+        # Update database (one commit for all three writes)
+        with self.db.transaction():
+            self.db.update_job_filter_results(
+                job_id=job_id,
+                score=match_score,
+                reasoning=reasoning,
+                requirements=[],  # Extracted from reasoning if needed
+                red_flags=[]  # Extracted from reasoning if needed
+            )
 
-        self.db.update_job_status(job_id, status, decision_type)
+            self.db.update_job_status(job_id, status, decision_type)
 
-        # Mark as processed
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            UPDATE jobs
-            SET is_processed = 1
-            WHERE id = ?
-        """, (job_id,))
-        self.db.conn.commit()
+            # Mark as processed
+            cursor = self.db.conn.cursor()
+            cursor.execute("""
+                UPDATE jobs
+                SET is_processed = 1
+                WHERE id = ?
+            """, (job_id,))
 
     def _mark_as_duplicate(self, job_id: int, similar_job_id: int) -> None:
         """Mark job as duplicate.
@@ -598,23 +598,23 @@ Return ONLY valid JSON, no markdown or extra text."""
             job_id: Job ID to mark as duplicate
             similar_job_id: ID of similar job
         """
-        self.db.update_job_status(job_id, "rejected", decision_type=None)
-        self.db.update_job_filter_results(
-            job_id=job_id,
-            score=0.0,
-            reasoning=f"Semantic duplicate of job #{similar_job_id}",
-            requirements=[],
-            red_flags=["Duplicate job posting"]
-        )
+        with self.db.transaction():
+            self.db.update_job_status(job_id, "rejected", decision_type=None)
+            self.db.update_job_filter_results(
+                job_id=job_id,
+                score=0.0,
+                reasoning=f"Semantic duplicate of job #{similar_job_id}",
+                requirements=[],
+                red_flags=["Duplicate job posting"]
+            )
 
-        # Mark as processed
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            UPDATE jobs
-            SET is_processed = 1
-            WHERE id = ?
-        """, (job_id,))
-        self.db.conn.commit()
+            # Mark as processed
+            cursor = self.db.conn.cursor()
+            cursor.execute("""
+                UPDATE jobs
+                SET is_processed = 1
+                WHERE id = ?
+            """, (job_id,))
 
     def _get_unprocessed_jobs(self, limit: Optional[int]) -> List[Job]:
         """Get all unprocessed jobs from database.
@@ -7,13 +7,12 @@ with intelligent deduplication at two levels:
 """
 
 import json
-import hashlib
 import re
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
-from src.core.database import Database
+from src.core.database import Database, fuzzy_hash as _fuzzy_hash, hash_url
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,11 +26,9 @@ def generate_fuzzy_hash(company: str, title: str) -> str:
         title: Job title
 
     Returns:
-        MD5 hash of normalized company+title
+        Hash of normalized company+title (see src.core.database.fuzzy_hash)
     """
-    # Normalize: lowercase, strip whitespace
-    key = f"{company.lower().strip()}{title.lower().strip()}"
-    return hashlib.md5(key.encode()).hexdigest()
+    return _fuzzy_hash(company, title)
 
 
 def parse_salary(salary_str: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
@@ -205,6 +202,7 @@ class AntigravityImporter:
             'url_duplicates': 0,
             'fuzzy_duplicates_skipped': 0,
             'fuzzy_duplicates_updated': 0,
+            'errors': 0,
             'by_source': {}
         }
 
@@ -238,18 +236,27 @@ class AntigravityImporter:
                 'new': 0,
                 'url_dup': 0,
                 'fuzzy_dup_skip': 0,
-                'fuzzy_dup_update': 0
+                'fuzzy_dup_update': 0,
+                'errors': 0
             }
 
-        # Process each job
-        for job_raw in jobs_data:
-            self._process_job(job_raw, source)
+        # Process each job; the whole file is written in one transaction.
+        # A bad row is counted and skipped so it can't roll back the rest.
+        with self.db.transaction():
+            for job_raw in jobs_data:
+                try:
+                    self._process_job(job_raw, source)
+                except Exception as e:
+                    logger.error(f"Failed to import job from {path.name}: {e}")
+                    self.stats['errors'] += 1
+                    self.stats['by_source'][source]['errors'] += 1
 
         logger.info(
             f"Import complete: {self.stats['new_jobs']} new, "
             f"{self.stats['url_duplicates']} URL duplicates, "
             f"{self.stats['fuzzy_duplicates_skipped']} fuzzy skipped, "
-            f"{self.stats['fuzzy_duplicates_updated']} fuzzy updated"
+            f"{self.stats['fuzzy_duplicates_updated']} fuzzy updated, "
+            f"{self.stats['errors']} errors"
         )
 
         return self.stats
@@ -319,8 +326,7 @@ class AntigravityImporter:
         job_data = self._normalize_job_data(job_raw, source)
 
         # Check for URL exact match first
-        url_hash = hashlib.md5(job_data['url'].encode()).hexdigest()
-        existing_by_url = self._get_job_by_url_hash(url_hash)
+        existing_by_url = self._get_job_by_url_hash(hash_url(job_data['url']))
 
         if existing_by_url:
             logger.debug(f"URL duplicate found: {job_data['url']}")
@@ -364,6 +370,8 @@ class AntigravityImporter:
             self.stats['by_source'][source]['new'] += 1
         except Exception as e:
             logger.error(f"Failed to insert job: {e}", exc_info=True)
+            self.stats['errors'] += 1
+            self.stats['by_source'][source]['errors'] += 1
 
     def _normalize_job_data(self, job_raw: Dict[str, Any], source: str) -> Dict[str, Any]:
         """Normalize raw job data to database format.
@@ -431,7 +439,7 @@ class AntigravityImporter:
         """Get job by URL hash.
 
         Args:
-            url_hash: MD5 hash of URL
+            url_hash: Hash of URL (see hash_url)
 
         Returns:
             Job dictionary or None
@@ -448,7 +456,7 @@ class AntigravityImporter:
         """Get job by fuzzy hash.
 
         Args:
-            fuzzy_hash: MD5 hash of company+title
+            fuzzy_hash: Hash of normalized company+title
 
         Returns:
             Job dictionary or None
@@ -496,7 +504,6 @@ class AntigravityImporter:
             job_data['fuzzy_hash'],
             job_id
         ))
-        self.db.conn.commit()
         logger.debug(f"Updated job {job_id}")
 
     def _update_job_description(self, job_id: int, update_data: Dict[str, Any]) -> None:
@@ -516,5 +523,4 @@ class AntigravityImporter:
             update_data.get('jd_raw'),
             job_id
         ))
-        self.db.conn.commit()
         logger.debug(f"Updated description for job {job_id}")
@@ -8,6 +8,7 @@ import os
 import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional
 import httpx
 from tenacity import (
@@ -22,6 +23,46 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Scoring rubric, part of the filter system prompt
+_SCORE_GUIDELINES = """## Score Guidelines
+
+**0.9-1.0**: Perfect match
+- All key requirements met
+- Strong experience alignment
+- No red flags
+
+**0.8-0.9**: Excellent match
+- Most requirements met
+- Good experience fit
+- Minor gaps acceptable
+
+**0.7-0.8**: Good match
+- Core requirements met
+- Some transferable skills
+- Worth applying
+
+**0.6-0.7**: Moderate match
+- Partial match
+- User should review
+- May be stretch
+
+**0.5-0.6**: Weak match
+- Significant gaps
+- Likely not suitable
+
+**0.0-0.5**: Poor match
+- Major misalignment
+- Reject
+
+## Red Flags to Detect
+- Security clearance required
+- No visa sponsorship / must be authorized to work without sponsorship
+- Onsite only (if remote preferred)
+- Salary below minimum requirements
+- Excessive experience requirements (10+ years for entry-level roles)
+- Contract/staffing agency positions (W2, C2C, corp-to-corp)
+- Required skills completely misaligned"""
+
 
 @dataclass
 class FilterResult:
@@ -196,9 +237,9 @@ class GLMClient(BaseLLMClient):
             InvalidResponseError: If response cannot be parsed
             APIError: If API request fails
         """
-        prompt = self._build_filter_prompt(jd_markdown, resume_summary, preferences)
+        prompt = self._build_filter_prompt(jd_markdown)
         
-        messages = [{"role": "user", "content": prompt}]
+        messages = self._build_filter_messages(prompt, resume_summary, preferences)
         
         try:
             response = await self.chat(messages, temperature=0.3, max_tokens=500)
@@ -213,6 +254,81 @@ class GLMClient(BaseLLMClient):
             logger.error(f"Failed to parse GLM response: {response.content[:200]}")
             raise InvalidResponseError(f"Invalid JSON response: {e}") from e
 
+        return self._to_filter_result(data, response.cost_usd)
+
+    async def filter_jobs_batch(
+        self,
+        jd_markdowns: List[str],
+        resume_summary: str,
+        preferences: str
+    ) -> List[FilterResult]:
+        """Filter several job postings with a single GLM request.
+        
+        The descriptions are packed into one prompt that asks for a JSON
+        array of results tagged with their job number, so the candidate
+        profile and rubric are sent (and billed) once per batch instead of
+        once per job.
+        
+        Args:
+            jd_markdowns: Job descriptions in markdown format
+            resume_summary: Candidate's resume summary
+            preferences: Job search preferences
+            
+        Returns:
+            One FilterResult per description, in input order; the request
+            cost is split evenly between them
+            
+        Raises:
+            InvalidResponseError: If response cannot be parsed or does not
+                hold exactly one result per job number
+            APIError: If API request fails
+        """
+        if not jd_markdowns:
+            return []
+        
+        prompt = self._build_batch_filter_prompt(jd_markdowns)
+        
+        messages = self._build_filter_messages(prompt, resume_summary, preferences)
+        
+        try:
+            response = await self.chat(
+                messages, temperature=0.3, max_tokens=500 * len(jd_markdowns)
+            )
+        except Exception as e:
+            logger.error(f"GLM filter_jobs_batch request failed: {e}")
+            raise
+
+        # Parse JSON response
+        try:
+            results = self._parse_json_response(response.content)["results"]
+        except Exception as e:
+            logger.error(f"Failed to parse GLM response: {response.content[:200]}")
+            raise InvalidResponseError(f"Invalid JSON response: {e}") from e
+
+        if not isinstance(results, list) or len(results) != len(jd_markdowns):
+            raise InvalidResponseError(
+                f"Expected {len(jd_markdowns)} results, got "
+                f"{len(results) if isinstance(results, list) else type(results).__name__}"
+            )
+
+        # Match results to jobs by their "job" tag, not by array position
+        by_job: Dict[int, Dict] = {}
+        for data in results:
+            job = data.get("job") if isinstance(data, dict) else None
+            if (not isinstance(job, int) or isinstance(job, bool)
+                    or not 1 <= job <= len(jd_markdowns) or job in by_job):
+                raise InvalidResponseError(f"Invalid or duplicate job index: {job!r}")
+            by_job[job] = data
+
+        cost = response.cost_usd / len(results)
+        return [
+            self._to_filter_result(by_job[job], cost)
+            for job in range(1, len(jd_markdowns) + 1)
+        ]
+
+    @staticmethod
+    def _to_filter_result(data: Dict, cost_usd: float) -> FilterResult:
+        """Build a FilterResult from one parsed JSON result object."""
         return FilterResult(
             score=float(data.get("score", 0.0)),
             reasoning=data.get("reasoning", "No reasoning provided"),
@@ -221,7 +337,7 @@ class GLMClient(BaseLLMClient):
             visa_compatible=data.get("visa_compatible", True),
             remote_compatible=data.get("remote_compatible", True),
             salary_compatible=data.get("salary_compatible", True),
-            cost_usd=response.cost_usd
+            cost_usd=cost_usd
         )
 
     async def tailor_resume(
@@ -333,23 +449,25 @@ Return ONLY valid JSON:
   "tailoring_notes": "Brief explanation of customizations"
 }}"""
 
-    def _build_filter_prompt(
-        self,
-        jd_markdown: str,
-        resume_summary: str,
-        preferences: str
-    ) -> str:
-        """Build filtering prompt for GLM.
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _build_filter_system_prompt(resume_summary: str, preferences: str) -> str:
+        """Build the system message shared by every filter request.
+        
+        Holds everything that is constant across a filtering run (profile,
+        preferences, rubric), so each request starts with an identical
+        prefix the provider's prompt cache can reuse; memoized per
+        (resume, preferences) pair. Bump _PROMPT_VERSION in
+        src/core/llm_cache.py when changing the filter prompts.
         
         Args:
-            jd_markdown: Job description
             resume_summary: Resume summary
             preferences: User preferences
             
         Returns:
-            Formatted prompt string
+            Formatted system prompt string
         """
-        return f"""You are evaluating a job posting for a candidate.
+        return f"""You are evaluating job postings for a candidate.
 
 ## Candidate Profile
 {resume_summary}
@@ -357,7 +475,31 @@ Return ONLY valid JSON:
 ## Job Preferences
 {preferences}
 
-## Job Description
+{_SCORE_GUIDELINES}"""
+
+    def _build_filter_messages(
+        self,
+        user_prompt: str,
+        resume_summary: str,
+        preferences: str
+    ) -> List[Dict[str, str]]:
+        """Pair the cached system prompt with a per-request user prompt."""
+        return [
+            {"role": "system", "content": self._build_filter_system_prompt(resume_summary, preferences)},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _build_filter_prompt(self, jd_markdown: str) -> str:
+        """Build the per-job filtering prompt for GLM.
+        
+        Args:
+            jd_markdown: Job description
+            
+        Returns:
+            Formatted prompt string (see _build_filter_system_prompt for
+            the candidate context)
+        """
+        return f"""## Job Description
 {jd_markdown}
 
 ---
@@ -373,44 +515,44 @@ Evaluate the match and return ONLY valid JSON (no markdown, no explanation):
   "salary_compatible": true/false
 }}
 
-## Score Guidelines
-
-**0.9-1.0**: Perfect match
-- All key requirements met
-- Strong experience alignment
-- No red flags
-
-**0.8-0.9**: Excellent match
-- Most requirements met
-- Good experience fit
-- Minor gaps acceptable
-
-**0.7-0.8**: Good match
-- Core requirements met
-- Some transferable skills
-- Worth applying
+Return ONLY the JSON object, no other text."""
 
-**0.6-0.7**: Moderate match
-- Partial match
-- User should review
-- May be stretch
+    def _build_batch_filter_prompt(self, jd_markdowns: List[str]) -> str:
+        """Build a filtering prompt covering several job descriptions.
+        
+        Args:
+            jd_markdowns: Job descriptions, numbered from 1 in the prompt
+            
+        Returns:
+            Formatted prompt string (see _build_filter_system_prompt for
+            the candidate context)
+        """
+        jobs = "\n\n".join(
+            f"## Job {i}\n{jd}" for i, jd in enumerate(jd_markdowns, 1)
+        )
+        
+        return f"""Evaluate each of these {len(jd_markdowns)} jobs independently.
 
-**0.5-0.6**: Weak match
-- Significant gaps
-- Likely not suitable
+{jobs}
 
-**0.0-0.5**: Poor match
-- Major misalignment
-- Reject
+---
 
-## Red Flags to Detect
-- Security clearance required
-- No visa sponsorship / must be authorized to work without sponsorship
-- Onsite only (if remote preferred)
-- Salary below minimum requirements
-- Excessive experience requirements (10+ years for entry-level roles)
-- Contract/staffing agency positions (W2, C2C, corp-to-corp)
-- Required skills completely misaligned
+Evaluate every job and return ONLY valid JSON (no markdown, no explanation),
+with exactly one result per job, each tagged with its job number:
+{{
+  "results": [
+    {{
+      "job": 1,
+      "score": 0.0-1.0,
+      "reasoning": "Brief explanation (max 100 words)",
+      "key_requirements": ["requirement1", "requirement2", "requirement3"],
+      "red_flags": ["flag1", "flag2"],
+      "visa_compatible": true/false,
+      "remote_compatible": true/false,
+      "salary_compatible": true/false
+    }}
+  ]
+}}
 
 Return ONLY the JSON object, no other text."""
 
@@ -0,0 +1,111 @@
+"""Cache of LLM job-filter results.
+
+The same job description is often reposted across platforms under a
+different URL. Scoring it again against an unchanged resume and unchanged
+preferences would return the same answer, so results are keyed by a hash of
+all three and reused instead of paying for another GLM request.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Optional
+
+from src.core.database import Database
+from src.core.llm import FilterResult
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Part of every key; bump whenever the filter prompt or scoring rubric
+# changes so results scored under the old prompt are not reused
+_PROMPT_VERSION = "2"
+
+
+class FilterCache:
+    """Two-level (in-process dict + filter_cache table) FilterResult cache.
+
+    Entries persist in the database so they survive restarts; the dict
+    saves the round-trip for keys recently seen by this process and keeps
+    at most max_entries of them, dropping the least recently used.
+    """
+
+    def __init__(self, db: Database, max_entries: int = 1024):
+        """Initialize cache.
+
+        Args:
+            db: Database holding the filter_cache table
+            max_entries: Maximum results kept in memory (default: 1024)
+        """
+        self.db = db
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, FilterResult]" = OrderedDict()
+
+    @staticmethod
+    def key(jd_markdown: str, resume_summary: str, preferences: str) -> str:
+        """Build the cache key for one (job, resume, preferences) prompt.
+
+        Args:
+            jd_markdown: Job description
+            resume_summary: Resume summary
+            preferences: Formatted preferences summary
+
+        Returns:
+            Hex BLAKE2b-128 digest of the prompt version and the three inputs
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for part in (_PROMPT_VERSION, jd_markdown, resume_summary, preferences):
+            h.update(part.encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[FilterResult]:
+        """Get cached result for key (cost_usd is 0: nothing was spent).
+
+        Args:
+            key: Key from FilterCache.key
+
+        Returns:
+            Cached FilterResult or None on a miss
+        """
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            return result
+
+        row = self.db.get_cached_filter_result(key)
+        if row is None:
+            return None
+
+        result = FilterResult(
+            score=row['score'],
+            reasoning=row['reasoning'],
+            key_requirements=row['key_requirements'],
+            red_flags=row['red_flags'],
+            visa_compatible=bool(row['visa_compatible']),
+            remote_compatible=bool(row['remote_compatible']),
+            salary_compatible=bool(row['salary_compatible'])
+        )
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: FilterResult) -> None:
+        """Store result under key.
+
+        Args:
+            key: Key from FilterCache.key
+            result: FilterResult returned by the LLM
+        """
+        self._remember(key, FilterResult(**{**asdict(result), 'cost_usd': 0.0}))
+        try:
+            self.db.cache_filter_result(key, asdict(result))
+        except Exception as e:
+            # A lost cache entry only costs a repeat request later
+            logger.warning(f"Failed to persist filter cache entry: {e}")
+
+    def _remember(self, key: str, result: FilterResult) -> None:
+        """Add result to the in-memory LRU, evicting the oldest if full."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
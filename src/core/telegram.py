@@ -365,7 +365,7 @@ _Started: {run['started_at']}_
             update: Telegram update object
             context: Handler context
         """
-        pending = self.db.get_jobs_by_status("pending_decision", limit=10)
+        pending = self.db.get_jobs_by_status("pending_decision", limit=10, include_description=False)
 
         if not pending:
             await update.message.reply_text("No jobs pending decision.")
@@ -517,7 +517,7 @@ _Started: {run['started_at']}_
         stats = self.db.get_daily_stats(today)
 
         # Get manual pending jobs
-        manual_pending = self.db.get_jobs_by_status("manual_apply_pending")
+        manual_pending = self.db.get_jobs_by_status("manual_apply_pending", include_description=False)
         manual_section = ""
         if manual_pending:
             manual_section = "\n📝 *Ready for Manual Apply*\n"
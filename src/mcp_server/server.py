@@ -1127,16 +1127,16 @@ async def read_resource(uri: str):
         
         elif uri == "jobs://pending":
             # Get pending jobs from database
-            jobs = db.get_jobs_by_status("pending_decision", limit=50)
+            jobs = db.get_job_summaries("pending_decision", limit=50)
             
             jobs_data = [
                 {
-                    "id": job.id,
-                    "title": job.title,
-                    "company": job.company,
-                    "match_score": job.match_score,
-                    "match_reasoning": job.match_reasoning,
-                    "url": job.url
+                    "id": job["id"],
+                    "title": job["title"],
+                    "company": job["company"],
+                    "match_score": job["match_score"],
+                    "match_reasoning": job["match_reasoning"],
+                    "url": job["url"]
                 }
                 for job in jobs
             ]
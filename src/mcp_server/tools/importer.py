@@ -27,6 +27,7 @@ async def import_antigravity_results(files: Optional[List[str]] = None) -> Dict[
             "duplicates_skipped_url": 20,
             "duplicates_skipped_fuzzy": 3,
             "duplicates_updated": 2,
+            "errors": 0,
             "by_source": {
                 "linkedin": {"total": 50, "new": 40, "url_dup": 8, "fuzzy_dup_skip": 1, "fuzzy_dup_update": 1},
                 ...
@@ -52,6 +53,7 @@ async def import_antigravity_results(files: Optional[List[str]] = None) -> Dict[
             "duplicates_skipped_url": stats['url_duplicates'],
             "duplicates_skipped_fuzzy": stats['fuzzy_duplicates_skipped'],
             "duplicates_updated": stats['fuzzy_duplicates_updated'],
+            "errors": stats['errors'],
             "by_source": stats['by_source'],
             "message": (
                 f"Import complete: {stats['new_jobs']} new jobs inserted, "
@@ -90,7 +90,7 @@ class CampaignReportGenerator:
             FROM jobs
             WHERE status = 'matched'
             AND decision_type = 'auto'
-            AND DATE(scraped_at) = ?
+            AND DATE(scraped_at, 'unixepoch') = ?
             ORDER BY match_score DESC
         """, (date,))
 
@@ -106,7 +106,7 @@ class CampaignReportGenerator:
             FROM jobs
             WHERE status = 'matched'
             AND decision_type = 'manual'
-            AND DATE(scraped_at) = ?
+            AND DATE(scraped_at, 'unixepoch') = ?
             ORDER BY match_score DESC
         """, (date,))
 
@@ -121,7 +121,7 @@ class CampaignReportGenerator:
             SELECT COUNT(*) as count
             FROM jobs
             WHERE is_processed = 1
-            AND DATE(scraped_at) = ?
+            AND DATE(scraped_at, 'unixepoch') = ?
         """, (date,))
         result = cursor.fetchone()
         return result[0] if result else 0
@@ -133,7 +133,7 @@ class CampaignReportGenerator:
             SELECT COUNT(*) as count
             FROM jobs
             WHERE status = 'rejected'
-            AND DATE(scraped_at) = ?
+            AND DATE(scraped_at, 'unixepoch') = ?
         """, (date,))
         result = cursor.fetchone()
         return result[0] if result else 0
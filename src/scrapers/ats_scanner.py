@@ -410,7 +410,8 @@ class ATSScanner:
                             'new': 0,
                             'url_dup': 0,
                             'fuzzy_dup_skip': 0,
-                            'fuzzy_dup_update': 0
+                            'fuzzy_dup_update': 0,
+                            'errors': 0
                         }
 
                     # Get count before processing
@@ -2,6 +2,7 @@
 
 from .config import ConfigLoader, ConfigError, ConfigNotFoundError, ConfigParseError, ConfigValidationError
 from .logger import setup_logging, get_logger
+from .json_io import ensure_dir, write_json
 from .markdown_parser import (
     MarkdownParser,
     PersonalInfo,
@@ -25,6 +26,8 @@ __all__ = [
     "ConfigValidationError",
     "setup_logging",
     "get_logger",
+    "ensure_dir",
+    "write_json",
     "MarkdownParser",
     "PersonalInfo",
     "Education",
@@ -0,0 +1,62 @@
+"""JSON file output helpers.
+
+Uses orjson when it is installed (noticeably faster on the large instruction
+files the agents emit) and falls back to the stdlib json module otherwise.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Set, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Absolute paths of directories already created by ensure_dir in this process
+_DIRS_READY: Set[str] = set()
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """Create path (and parents) once per process and return it as a Path."""
+    path = Path(path)
+    # abspath is pure string work; resolve() would stat every component
+    key = os.path.abspath(path)
+    if key not in _DIRS_READY:
+        path.mkdir(parents=True, exist_ok=True)
+        _DIRS_READY.add(key)
+    return path
+
+
+def write_json(path: Union[str, Path], data: Any, pretty: bool = True) -> None:
+    """Write data to path as UTF-8 JSON.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable object
+        pretty: Indent with two spaces; when False write compact JSON,
+            which is smaller and faster to emit for machine-read files
+    """
+    path = Path(path)
+    try:
+        _write(path, data, pretty)
+    except FileNotFoundError:
+        # The directory was removed after ensure_dir cached it; recreate it
+        _DIRS_READY.discard(os.path.abspath(path.parent))
+        ensure_dir(path.parent)
+        _write(path, data, pretty)
+
+
+def _write(path: Path, data: Any, pretty: bool) -> None:
+    """Serialize data to path (see write_json)."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        path.write_bytes(orjson.dumps(data, option=option))
+    elif pretty:
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+    else:
+        path.write_text(
+            json.dumps(data, ensure_ascii=False, separators=(',', ':')),
+            encoding='utf-8'
+        )
@@ -0,0 +1,26 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture
+def make_filter_result():
+    """Factory building a FilterResult with the given score.
+
+    Other fields default to a clean match; pass keyword arguments to
+    override them.
+    """
+    from src.core.llm import FilterResult
+
+    def _make(score: float, **overrides) -> FilterResult:
+        fields = dict(
+            reasoning="test",
+            key_requirements=[],
+            red_flags=[],
+            visa_compatible=True,
+            remote_compatible=True,
+            salary_compatible=True
+        )
+        fields.update(overrides)
+        return FilterResult(score=score, **fields)
+    return _make
@@ -4,6 +4,7 @@ import json
 import pytest
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from src.agents.application_guide_generator import ApplicationGuideGenerator
@@ -85,8 +86,7 @@ def mock_db():
         applied_at=None
     )
 
-    db.get_matched_jobs.return_value = [high_match_job]
-    db.get_jobs_by_status.return_value = [medium_match_job]
+    db.get_application_candidates.return_value = [high_match_job, medium_match_job]
 
     return db
 
@@ -174,8 +174,7 @@ def test_generate_application_guide_success(mock_db, mock_config, tmp_path):
 def test_generate_application_guide_no_jobs(mock_db, mock_config):
     """Test when no approved jobs are found."""
     # Setup - return empty lists
-    mock_db.get_matched_jobs.return_value = []
-    mock_db.get_jobs_by_status.return_value = []
+    mock_db.get_application_candidates.return_value = []
 
     generator = ApplicationGuideGenerator(db=mock_db, config_loader=mock_config)
 
@@ -212,12 +211,12 @@ def test_form_instructions_greenhouse(mock_config):
     """Test Greenhouse-specific form instructions."""
     generator = ApplicationGuideGenerator(config_loader=mock_config)
 
-    job = {
-        'id': 1,
-        'company': 'TestCo',
-        'title': 'Engineer',
-        'url': 'https://jobs.greenhouse.io/testco/engineer'
-    }
+    job = SimpleNamespace(
+        id=1,
+        company='TestCo',
+        title='Engineer',
+        url='https://jobs.greenhouse.io/testco/engineer'
+    )
 
     personal_info = PersonalInfo(
         name="John Doe",
@@ -241,12 +240,12 @@ def test_form_instructions_lever(mock_config):
     """Test Lever-specific form instructions."""
     generator = ApplicationGuideGenerator(config_loader=mock_config)
 
-    job = {
-        'id': 1,
-        'company': 'Scribd',
-        'title': 'AI Engineer',
-        'url': 'https://jobs.lever.co/scribd/ai-engineer'
-    }
+    job = SimpleNamespace(
+        id=1,
+        company='Scribd',
+        title='AI Engineer',
+        url='https://jobs.lever.co/scribd/ai-engineer'
+    )
 
     personal_info = PersonalInfo(
         name="Jane Smith",
@@ -267,12 +266,12 @@ def test_form_instructions_linkedin_easy_apply(mock_config):
     """Test LinkedIn Easy Apply instructions."""
     generator = ApplicationGuideGenerator(config_loader=mock_config)
 
-    job = {
-        'id': 1,
-        'company': 'LinkedIn',
-        'title': 'Developer',
-        'url': 'https://www.linkedin.com/jobs/view/12345'
-    }
+    job = SimpleNamespace(
+        id=1,
+        company='LinkedIn',
+        title='Developer',
+        url='https://www.linkedin.com/jobs/view/12345'
+    )
 
     personal_info = PersonalInfo(
         name="Bob Johnson",
@@ -292,10 +291,10 @@ def test_resume_path_generation():
     """Test resume path generation."""
     generator = ApplicationGuideGenerator()
 
-    job = {
-        'company': 'Test Company With Spaces',
-        'title': 'Senior Software Engineer / Developer'
-    }
+    job = SimpleNamespace(
+        company='Test Company With Spaces',
+        title='Senior Software Engineer / Developer'
+    )
 
     path = generator._get_resume_path(job)
 
@@ -311,13 +310,13 @@ def test_default_date():
     """Test that default date is today."""
     generator = ApplicationGuideGenerator()
 
-    with patch.object(generator.db, 'get_matched_jobs', return_value=[]):
-        with patch.object(generator.db, 'get_jobs_by_status', return_value=[]):
-            result = generator.generate_application_guide()
+    with patch.object(generator.db, 'get_application_candidates', return_value=[]) as mock_get:
+        result = generator.generate_application_guide()
 
-            # Should use today's date
-            today = datetime.now().strftime('%Y-%m-%d')
-            assert result["status"] == "no_jobs"
+        # Should use today's date
+        today = datetime.now().strftime('%Y-%m-%d')
+        mock_get.assert_called_once_with(today)
+        assert result["status"] == "no_jobs"
 
 
 def test_rate_limiting_in_output(mock_db, mock_config, tmp_path):
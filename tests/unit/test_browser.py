@@ -9,11 +9,15 @@ Tests cover:
 """
 
 import asyncio
+import gzip
+import json
+import shutil
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch, ANY
 
 import pytest
 
+import src.core.browser as browser_module
 from src.core.browser import (
     BrowserManager,
     PageUtils,
@@ -30,6 +34,14 @@ from src.core.browser import (
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_browsers():
+    """Keep the process-wide shared browser from leaking between tests."""
+    browser_module._shared_browsers.clear()
+    yield
+    browser_module._shared_browsers.clear()
+
+
 @pytest.fixture
 def tmp_data_dir(tmp_path):
     """Temporary data directory for tests."""
@@ -50,6 +62,21 @@ async def browser_manager(tmp_data_dir):
         pass
 
 
+def mock_page(element):
+    """Mock page whose locator(...).first resolves to element."""
+    page = AsyncMock()
+    page.locator = MagicMock(return_value=MagicMock(first=element))
+    return page
+
+
+def missing_element():
+    """Mock locator whose actions time out as if nothing matched."""
+    element = AsyncMock()
+    for action in ("click", "fill", "inner_text", "bounding_box"):
+        getattr(element, action).side_effect = Exception("Not found")
+    return element
+
+
 @pytest.fixture
 def mock_playwright():
     """Mock Playwright instance."""
@@ -64,7 +91,7 @@ def mock_playwright():
         playwright.chromium.launch = AsyncMock(return_value=browser)
         browser.new_context = AsyncMock(return_value=context)
         context.new_page = AsyncMock(return_value=page)
-        context.storage_state = AsyncMock()
+        context.storage_state = AsyncMock(return_value={"cookies": [], "origins": []})
         context.add_init_script = AsyncMock()
 
         yield {
@@ -125,6 +152,21 @@ class TestBrowserManager:
         # Should only call launch once
         assert mock_playwright["playwright"].chromium.launch.call_count == 1
 
+    async def test_launch_shares_browser_between_managers(self, tmp_data_dir, mock_playwright):
+        """Test that managers share one browser and the last one closes it."""
+        first = BrowserManager(headless=True, data_dir=tmp_data_dir)
+        second = BrowserManager(headless=True, data_dir=tmp_data_dir)
+
+        assert await first.launch() is await second.launch()
+        assert mock_playwright["playwright"].chromium.launch.call_count == 1
+
+        await first.close()
+        mock_playwright["browser"].close.assert_not_called()
+
+        await second.close()
+        mock_playwright["browser"].close.assert_called_once()
+        mock_playwright["playwright"].stop.assert_called_once()
+
     async def test_launch_browser_error(self, browser_manager, mock_playwright):
         """Test browser launch error handling."""
         mock_playwright["playwright"].chromium.launch.side_effect = Exception("Launch failed")
@@ -156,6 +198,22 @@ class TestBrowserManager:
         # Should only call new_context once
         assert mock_playwright["browser"].new_context.call_count == 1
 
+    async def test_get_context_evicts_least_recently_used(self, tmp_data_dir, mock_playwright):
+        """Test that contexts beyond max_contexts are saved and closed."""
+        contexts = [AsyncMock(), AsyncMock(), AsyncMock()]
+        mock_playwright["browser"].new_context = AsyncMock(side_effect=contexts)
+        manager = BrowserManager(headless=True, data_dir=tmp_data_dir, max_contexts=2)
+
+        await manager.get_context("linkedin")
+        await manager.get_context("indeed")
+        await manager.get_context("linkedin")  # indeed is now least recently used
+        await manager.get_context("wellfound")
+
+        assert list(manager._contexts) == ["linkedin", "wellfound"]
+        contexts[1].storage_state.assert_called_once()
+        contexts[1].close.assert_called_once()
+        contexts[0].close.assert_not_called()
+
     async def test_get_context_with_session(self, browser_manager, mock_playwright, tmp_data_dir):
         """Test loading saved session."""
         # Create fake session file
@@ -170,6 +228,34 @@ class TestBrowserManager:
         assert "storage_state" in call_kwargs
         assert call_kwargs["storage_state"] == str(session_path)
 
+    async def test_get_context_with_compressed_session(self, browser_manager, mock_playwright, tmp_data_dir):
+        """Test loading a gzip-compressed saved session."""
+        session_path = Path(tmp_data_dir) / "linkedin" / "state.json.gz"
+        session_path.parent.mkdir(parents=True, exist_ok=True)
+        session_path.write_bytes(gzip.compress(b'{"cookies": [{"name": "li_at"}]}'))
+
+        await browser_manager.get_context("linkedin", load_session=True)
+
+        call_kwargs = mock_playwright["browser"].new_context.call_args[1]
+        assert call_kwargs["storage_state"] == {"cookies": [{"name": "li_at"}]}
+
+    async def test_get_context_reuses_parsed_session(self, browser_manager, mock_playwright, tmp_data_dir):
+        """Test that an unchanged session file is parsed only once."""
+        session_dir = Path(tmp_data_dir) / "linkedin"
+        session_dir.mkdir()
+        state = {"cookies": [{"name": "li_at"}], "origins": []}
+        (session_dir / "state.json.gz").write_bytes(gzip.compress(json.dumps(state).encode()))
+
+        assert browser_manager._load_session_state("linkedin") == state
+        with patch("src.core.browser.gzip.decompress") as decompress:
+            assert browser_manager._load_session_state("linkedin") == state
+            decompress.assert_not_called()
+
+        # A rewritten file is read again
+        state = {"cookies": [{"name": "li_at"}, {"name": "JSESSIONID"}], "origins": []}
+        (session_dir / "state.json.gz").write_bytes(gzip.compress(json.dumps(state).encode()))
+        assert browser_manager._load_session_state("linkedin") == state
+
     async def test_get_context_with_proxy(self, tmp_data_dir, mock_playwright):
         """Test context creation with proxy."""
         manager = BrowserManager(
@@ -205,10 +291,57 @@ class TestBrowserManager:
         # Save session
         await browser_manager.save_session("linkedin")
 
-        # Verify storage_state was called
+        # Verify storage_state was read and written to the compressed session file
         mock_playwright["context"].storage_state.assert_called_once()
-        session_path = Path(tmp_data_dir) / "linkedin" / "state.json"
-        assert mock_playwright["context"].storage_state.call_args[1]["path"] == str(session_path)
+        session_path = Path(tmp_data_dir) / "linkedin" / "state.json.gz"
+        assert json.loads(gzip.decompress(session_path.read_bytes())) == {"cookies": [], "origins": []}
+        assert not session_path.with_suffix(".gz.tmp").exists()
+
+    async def test_save_session_skips_unchanged_state(self, browser_manager, mock_playwright, tmp_data_dir):
+        """Test that re-saving an unchanged session does not rewrite the file."""
+        await browser_manager.get_context("linkedin")
+        session_path = Path(tmp_data_dir) / "linkedin" / "state.json.gz"
+
+        await browser_manager.save_session("linkedin")
+        session_path.write_text("marker")  # would be overwritten by a real save
+        await browser_manager.save_session("linkedin")
+
+        assert session_path.read_text() == "marker"
+        assert mock_playwright["context"].storage_state.call_count == 2
+
+    async def test_save_session_recreates_removed_dir(self, browser_manager, mock_playwright, tmp_data_dir):
+        """Test that a save after the platform directory is deleted still lands."""
+        await browser_manager.get_context("linkedin")
+        session_path = Path(tmp_data_dir) / "linkedin" / "state.json.gz"
+
+        await browser_manager.save_session("linkedin")
+        shutil.rmtree(session_path.parent)
+        await browser_manager.save_session("linkedin")
+
+        assert json.loads(gzip.decompress(session_path.read_bytes())) == {"cookies": [], "origins": []}
+
+    async def test_save_session_platforms_in_parallel(self, browser_manager, mock_playwright):
+        """Test that saves for different platforms do not wait on each other."""
+        await browser_manager.get_context("linkedin")
+        await browser_manager.get_context("indeed")
+        in_flight = []
+        both_started = asyncio.Event()
+
+        async def storage_state():
+            in_flight.append(1)
+            if len(in_flight) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return {"cookies": [], "origins": []}
+
+        mock_playwright["context"].storage_state = AsyncMock(side_effect=storage_state)
+
+        await asyncio.gather(
+            browser_manager.save_session("linkedin"),
+            browser_manager.save_session("indeed"),
+        )
+
+        assert both_started.is_set()
 
     async def test_save_session_nonexistent_context(self, browser_manager, mock_playwright):
         """Test saving session for nonexistent context."""
@@ -290,6 +423,12 @@ class TestBrowserManager:
         # Should have multiple different user agents
         assert len(user_agents) > 1
 
+    async def test_get_user_agent_stable_per_platform(self, browser_manager):
+        """Test that a platform keeps the user agent it was first given."""
+        ua = browser_manager._get_user_agent("linkedin")
+
+        assert all(browser_manager._get_user_agent("linkedin") == ua for _ in range(20))
+
 
 # ============================================================================
 # PageUtils Tests
@@ -308,34 +447,50 @@ class TestPageUtils:
 
         assert 0.1 <= elapsed <= 0.3  # Allow some tolerance
 
+    async def test_random_delay_zero(self):
+        """Test that a zero delay returns without sleeping."""
+        with patch("src.core.browser.asyncio.sleep") as sleep:
+            await PageUtils.random_delay(0, 0)
+
+        sleep.assert_not_called()
+
     async def test_human_type(self):
         """Test human-like typing."""
-        page = AsyncMock()
         element = AsyncMock()
-        page.wait_for_selector = AsyncMock(return_value=element)
+        page = mock_page(element)
         page.keyboard.type = AsyncMock()
 
-        await PageUtils.human_type(page, "#input", "test")
+        await PageUtils.human_type(page, "#input", "test input")
 
         # Verify element was clicked
         element.click.assert_called_once()
 
-        # Verify each character was typed
-        assert page.keyboard.type.call_count == 4  # "test" = 4 chars
-        calls = [call[0][0] for call in page.keyboard.type.call_args_list]
-        assert calls == ["t", "e", "s", "t"]
+        # Verify text was typed in order, in three non-empty chunks
+        chunks = [call[0][0] for call in page.keyboard.type.call_args_list]
+        assert "".join(chunks) == "test input"
+        assert len(chunks) == 3
+        assert all(chunks)
+        assert all(50 <= call[1]["delay"] <= 150 for call in page.keyboard.type.call_args_list)
+
+    async def test_human_type_fast(self):
+        """Test filling text without per-key events."""
+        element = AsyncMock()
+        page = mock_page(element)
+
+        await PageUtils.human_type(page, "#input", "cover letter", realistic=False)
+
+        element.fill.assert_called_once_with("cover letter")
+        page.keyboard.type.assert_not_called()
 
     async def test_human_type_element_not_found(self):
         """Test human_type with missing element."""
-        page = AsyncMock()
-        page.wait_for_selector = AsyncMock(side_effect=Exception("Not found"))
+        page = mock_page(missing_element())
 
         with pytest.raises(ElementNotFoundError, match="Not found"):
             await PageUtils.human_type(page, "#missing", "text")
 
     async def test_human_click_with_bounding_box(self):
         """Test human-like click with bounding box."""
-        page = AsyncMock()
         element = AsyncMock()
         element.bounding_box = AsyncMock(return_value={
             "x": 100,
@@ -343,7 +498,7 @@ class TestPageUtils:
             "width": 50,
             "height": 30
         })
-        page.wait_for_selector = AsyncMock(return_value=element)
+        page = mock_page(element)
         page.mouse.click = AsyncMock()
 
         await PageUtils.human_click(page, ".button")
@@ -356,10 +511,9 @@ class TestPageUtils:
 
     async def test_human_click_without_bounding_box(self):
         """Test human-like click fallback."""
-        page = AsyncMock()
         element = AsyncMock()
         element.bounding_box = AsyncMock(return_value=None)
-        page.wait_for_selector = AsyncMock(return_value=element)
+        page = mock_page(element)
 
         await PageUtils.human_click(page, ".button")
 
@@ -368,8 +522,7 @@ class TestPageUtils:
 
     async def test_human_click_element_not_found(self):
         """Test human_click with missing element."""
-        page = AsyncMock()
-        page.wait_for_selector = AsyncMock(side_effect=Exception("Not found"))
+        page = mock_page(missing_element())
 
         with pytest.raises(ElementNotFoundError, match="Not found"):
             await PageUtils.human_click(page, "#missing")
@@ -377,40 +530,55 @@ class TestPageUtils:
     async def test_scroll_to_bottom(self):
         """Test scrolling to bottom."""
         page = AsyncMock()
-        # Simulate page growing then staying same
-        heights = [1000, 1500, 2000, 2000]
-        page.evaluate = AsyncMock(side_effect=heights)
+        page.evaluate = AsyncMock(return_value=7)
 
         await PageUtils.scroll_to_bottom(page, step=500, delay=0.01)
 
-        # Should scroll 3 times (until height stops changing)
-        scroll_calls = [call for call in page.evaluate.call_args_list
-                       if "scrollBy" in str(call)]
-        assert len(scroll_calls) == 3
+        # The whole scroll loop runs in the page in a single call
+        page.evaluate.assert_called_once()
+        script, args = page.evaluate.call_args[0]
+        assert "scrollBy" in script
+        assert args == [500, 10, 3, 100]
 
-    async def test_wait_for_navigation_networkidle(self):
-        """Test waiting for navigation (networkidle)."""
+    async def test_scroll_to_bottom_capped(self):
+        """Test a page script that never settles is abandoned at the cap."""
+        page = AsyncMock()
+
+        async def never_settles(*args):
+            await asyncio.Event().wait()
+
+        page.evaluate = AsyncMock(side_effect=never_settles)
+
+        with patch.object(browser_module, "_SCROLL_TIMEOUT_SLACK", 0.05):
+            await asyncio.wait_for(
+                PageUtils.scroll_to_bottom(page, step=500, delay=0.01, max_scrolls=5),
+                timeout=1.0
+            )
+
+        script, args = page.evaluate.call_args[0]
+        assert "max" in script
+        assert args == [500, 10, 3, 5]
+
+    async def test_wait_for_navigation_domcontentloaded(self):
+        """Test waiting for navigation (domcontentloaded by default)."""
         page = AsyncMock()
         page.wait_for_load_state = AsyncMock()
 
         await PageUtils.wait_for_navigation(page, timeout=5000)
 
-        page.wait_for_load_state.assert_called_once_with("networkidle", timeout=5000)
+        page.wait_for_load_state.assert_called_once_with("domcontentloaded", timeout=5000)
 
-    async def test_wait_for_navigation_fallback(self):
-        """Test waiting for navigation with fallback."""
+    async def test_wait_for_navigation_strict(self):
+        """Test waiting for navigation with networkidle in strict mode."""
         page = AsyncMock()
-        # First call fails, second succeeds
-        page.wait_for_load_state = AsyncMock(
-            side_effect=[Exception("Timeout"), None]
-        )
+        page.wait_for_load_state = AsyncMock()
 
-        await PageUtils.wait_for_navigation(page, timeout=5000)
+        await PageUtils.wait_for_navigation(page, timeout=5000, strict=True)
 
-        # Should try networkidle then domcontentloaded
+        # Should wait for domcontentloaded, then networkidle
         assert page.wait_for_load_state.call_count == 2
         calls = [call[0][0] for call in page.wait_for_load_state.call_args_list]
-        assert calls == ["networkidle", "domcontentloaded"]
+        assert calls == ["domcontentloaded", "networkidle"]
 
     async def test_wait_for_navigation_timeout(self):
         """Test navigation timeout error."""
@@ -422,9 +590,8 @@ class TestPageUtils:
 
     async def test_safe_click_success(self):
         """Test safe click when element exists."""
-        page = AsyncMock()
         element = AsyncMock()
-        page.wait_for_selector = AsyncMock(return_value=element)
+        page = mock_page(element)
 
         result = await PageUtils.safe_click(page, ".button", timeout=1000)
 
@@ -433,8 +600,7 @@ class TestPageUtils:
 
     async def test_safe_click_not_found(self):
         """Test safe click when element doesn't exist."""
-        page = AsyncMock()
-        page.wait_for_selector = AsyncMock(side_effect=Exception("Not found"))
+        page = mock_page(missing_element())
 
         result = await PageUtils.safe_click(page, ".missing")
 
@@ -442,10 +608,9 @@ class TestPageUtils:
 
     async def test_get_text_success(self):
         """Test getting element text."""
-        page = AsyncMock()
         element = AsyncMock()
         element.inner_text = AsyncMock(return_value="Hello World")
-        page.wait_for_selector = AsyncMock(return_value=element)
+        page = mock_page(element)
 
         text = await PageUtils.get_text(page, ".text")
 
@@ -453,8 +618,7 @@ class TestPageUtils:
 
     async def test_get_text_not_found(self):
         """Test getting text with default fallback."""
-        page = AsyncMock()
-        page.wait_for_selector = AsyncMock(side_effect=Exception("Not found"))
+        page = mock_page(missing_element())
 
         text = await PageUtils.get_text(page, ".missing", default="N/A")
 
@@ -462,8 +626,7 @@ class TestPageUtils:
 
     async def test_get_text_default_empty(self):
         """Test getting text with empty default."""
-        page = AsyncMock()
-        page.wait_for_selector = AsyncMock(side_effect=Exception("Not found"))
+        page = mock_page(missing_element())
 
         text = await PageUtils.get_text(page, ".missing")
 
@@ -534,10 +697,9 @@ class TestIntegration:
         # Save session
         await browser_manager.save_session("linkedin")
 
-        # Verify session file path
-        session_path = Path(tmp_data_dir) / "linkedin" / "state.json"
-        call_kwargs = mock_playwright["context"].storage_state.call_args[1]
-        assert call_kwargs["path"] == str(session_path)
+        # Verify session file was written
+        session_path = Path(tmp_data_dir) / "linkedin" / "state.json.gz"
+        assert session_path.exists()
 
         # Close
         await browser_manager.close()
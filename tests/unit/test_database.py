@@ -52,6 +52,27 @@ class TestDatabaseInitialization:
         expected_tables = ['applications', 'blacklist', 'jobs', 'logs', 'resumes', 'runs']
         assert tables == expected_tables
 
+    def test_maintenance_commands(self, tmp_path, sample_job_data):
+        """Test ANALYZE on first init, and analyze/vacuum/optimize afterwards."""
+        db = Database(str(tmp_path / "maint.db"))
+        db.init_schema()
+        assert db.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+
+        for i in range(50):
+            db.insert_job({**sample_job_data, 'external_id': f'job{i}', 'url': f'https://linkedin.com/jobs/{i}'})
+        db.analyze()
+        assert db.conn.execute(
+            "SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'jobs'"
+        ).fetchone()[0] > 0
+
+        db.conn.execute("DELETE FROM jobs")
+        db.vacuum()
+        db.optimize()
+        db.close()
+        db.close()  # Closing twice is harmless
+
     def test_wal_mode_enabled(self):
         """Test that WAL mode is enabled for file-based databases."""
         # Note: WAL mode is not enabled for :memory: databases
@@ -74,6 +95,69 @@ class TestDatabaseInitialization:
         if os.path.exists("data/test_wal.db-shm"):
             os.remove("data/test_wal.db-shm")
 
+    def test_file_database_pragmas(self, tmp_path):
+        """Test the connection tuning applied to file-based databases."""
+        db = Database(str(tmp_path / "pragmas.db"))
+
+        cursor = db.conn.cursor()
+        assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert cursor.execute("PRAGMA busy_timeout").fetchone()[0] == 60000
+        assert cursor.execute("PRAGMA cache_size").fetchone()[0] == -65536
+        assert cursor.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        db.close()
+
+    def test_reads_use_thread_local_connections(self, tmp_path, sample_job_data):
+        """Test that file databases read through per-thread read-only connections."""
+        import threading
+        db = Database(str(tmp_path / "pool.db"))
+        db.init_schema()
+        job_id = db.insert_job(sample_job_data)
+
+        assert db.get_job_by_id(job_id).title == 'Senior Python Developer'
+        assert db.get_jobs_by_status('new')[0].id == job_id
+        # Reads on one thread reuse its connection
+        assert len(db._all_readers) == 1
+
+        titles = []
+        thread = threading.Thread(target=lambda: titles.append(db.get_job_by_id(job_id).title))
+        thread.start()
+        thread.join()
+        assert titles == ['Senior Python Developer']
+        assert len(db._all_readers) == 2
+
+        with db._read() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM jobs")
+
+        # While the writer has an open transaction, reads see its changes
+        with pytest.raises(ValueError):
+            with db.transaction():
+                db.conn.execute("UPDATE jobs SET title = 'Changed' WHERE id = ?", (job_id,))
+                assert db.get_job_by_id(job_id).title == 'Changed'
+                # ...but other threads do not
+                thread = threading.Thread(
+                    target=lambda: titles.append(db.get_job_by_id(job_id).title)
+                )
+                thread.start()
+                thread.join()
+                assert titles[-1] == 'Senior Python Developer'
+                raise ValueError("roll back")
+        assert db.get_job_by_id(job_id).title == 'Senior Python Developer'
+        db.close()
+
+    def test_matched_jobs_query_uses_status_score_index(self, db):
+        """Test that score-ordered status queries need no sort step."""
+        plan = db.conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT * FROM jobs
+            WHERE status = ? AND match_score >= ? AND match_score <= ?
+            ORDER BY match_score DESC LIMIT ?
+        """, ('matched', 0.6, 1.0, 20)).fetchall()
+        details = " ".join(row['detail'] for row in plan)
+
+        assert "idx_jobs_status_score" in details
+        assert "TEMP B-TREE" not in details
+
     def test_foreign_keys_enabled(self, db):
         """Test that foreign keys are enabled."""
         cursor = db.conn.cursor()
@@ -106,9 +190,75 @@ class TestJobOperations:
         job = db.get_job_by_id(job_id)
 
         import hashlib
-        expected_hash = hashlib.md5(sample_job_data['url'].encode()).hexdigest()
+        expected_hash = hashlib.blake2b(sample_job_data['url'].encode(), digest_size=16).hexdigest()
         assert job.url_hash == expected_hash
 
+    def test_md5_url_hashes_migrated(self, tmp_path, sample_job_data):
+        """Test that URL hashes from before BLAKE2b are rehashed on connect."""
+        import hashlib
+        db_path = str(tmp_path / "old.db")
+        db = Database(db_path)
+        db.init_schema()
+        job_id = db.insert_job(sample_job_data)
+        db.conn.execute(
+            "UPDATE jobs SET url_hash = ? WHERE id = ?",
+            (hashlib.md5(sample_job_data['url'].encode()).hexdigest(), job_id)
+        )
+        db.conn.execute("PRAGMA user_version=0")
+        db.conn.commit()
+        db.close()
+
+        db = Database(db_path)
+        assert db.check_duplicate(url=sample_job_data['url'])['existing_job_id'] == job_id
+        assert db.conn.execute("PRAGMA user_version").fetchone()[0] == 3
+        db.close()
+
+    def test_fuzzy_hash_ignores_punctuation_and_suffixes(self):
+        """Test that reposts with cosmetic company/title differences share a hash."""
+        from src.core.database import fuzzy_hash
+        assert fuzzy_hash('Acme, Inc.', 'Sr. Engineer') == fuzzy_hash('ACME', 'sr engineer')
+        assert fuzzy_hash('Acme', 'Engineer') != fuzzy_hash('Acme', 'Sr Engineer')
+
+    def test_fuzzy_hashes_migrated(self, tmp_path, sample_job_data):
+        """Test that fuzzy hashes from schema version 1 are recomputed on connect."""
+        from src.core.database import fuzzy_hash
+        db_path = str(tmp_path / "v1.db")
+        db = Database(db_path)
+        db.init_schema()
+        job_id = db.insert_job({**sample_job_data, 'fuzzy_hash': 'stale'})
+        db.conn.execute("PRAGMA user_version=1")
+        db.conn.commit()
+        db.close()
+
+        db = Database(db_path)
+        job = db.get_job_by_id(job_id)
+        assert job.fuzzy_hash == fuzzy_hash(job.company, job.title)
+        assert db.conn.execute("PRAGMA user_version").fetchone()[0] == 3
+        db.close()
+
+    def test_text_timestamps_migrated(self, tmp_path, sample_job_data):
+        """Test that ISO-8601 timestamps from schema version 2 become epoch seconds."""
+        db_path = str(tmp_path / "v2.db")
+        db = Database(db_path)
+        db.init_schema()
+        job_id = db.insert_job(sample_job_data)
+        db.conn.execute(
+            "UPDATE jobs SET scraped_at = '2026-01-29T10:30:00', applied_at = NULL WHERE id = ?",
+            (job_id,)
+        )
+        db.conn.execute("PRAGMA user_version=2")
+        db.conn.commit()
+        db.close()
+
+        db = Database(db_path)
+        row = db.conn.execute(
+            "SELECT typeof(scraped_at), applied_at FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        assert tuple(row) == ('integer', None)
+        assert db.get_job_by_id(job_id).scraped_at == datetime(2026, 1, 29, 10, 30)
+        assert [job.id for job in db.get_jobs_by_status('new', date='2026-01-29')] == [job_id]
+        db.close()
+
     def test_insert_duplicate_job_raises_error(self, db, sample_job_data):
         """Test that inserting duplicate job raises IntegrityError."""
         db.insert_job(sample_job_data)
@@ -130,6 +280,44 @@ class TestJobOperations:
 
         assert job_id is None
 
+    def test_insert_job_if_new_returns_none_for_same_external_id(self, db, sample_job_data):
+        """Test that a (platform, external_id) collision is also skipped."""
+        db.insert_job(sample_job_data)
+        job_id = db.insert_job_if_new({**sample_job_data, 'url': 'https://linkedin.com/jobs/other'})
+
+        assert job_id is None
+        assert len(db.get_jobs_by_status('new')) == 1
+
+    def test_insert_jobs_bulk(self, db, sample_job_data):
+        """Test inserting a batch of jobs in one call."""
+        jobs = [
+            {**sample_job_data, 'external_id': f'job{i}', 'url': f'https://linkedin.com/jobs/{i}'}
+            for i in range(5)
+        ]
+
+        assert db.insert_jobs_bulk(jobs) == 5
+        assert len(db.get_jobs_by_status('new')) == 5
+        assert db.insert_jobs_bulk([]) == 0
+
+    def test_insert_jobs_bulk_duplicate_rolls_back(self, db, sample_job_data):
+        """Test that a duplicate in the batch inserts nothing."""
+        other = {**sample_job_data, 'external_id': 'job456', 'url': 'https://linkedin.com/jobs/456'}
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.insert_jobs_bulk([sample_job_data, other, sample_job_data])
+
+        assert db.get_jobs_by_status('new') == []
+
+    def test_insert_jobs_bulk_skip_duplicates(self, db, sample_job_data):
+        """Test that stored, repeated and conflicting jobs are skipped."""
+        db.insert_job(sample_job_data)
+        new = {**sample_job_data, 'external_id': 'job456', 'url': 'https://linkedin.com/jobs/456'}
+        same_id = {**sample_job_data, 'url': 'https://linkedin.com/jobs/other'}
+
+        assert db.filter_new_jobs([sample_job_data, new, new]) == [new]
+        assert db.insert_jobs_bulk([sample_job_data, new, new, same_id], skip_duplicates=True) == 1
+        assert len(db.get_jobs_by_status('new')) == 2
+
     def test_get_job_by_id_not_found(self, db):
         """Test getting non-existent job returns None."""
         job = db.get_job_by_id(999)
@@ -169,6 +357,66 @@ class TestJobOperations:
         jobs = db.get_jobs_by_status('new', limit=3)
         assert len(jobs) == 3
 
+    def test_listing_queries_skip_description(self, db, sample_job_data):
+        """Test that listing queries leave the job description unloaded."""
+        job_id = db.insert_job(sample_job_data)
+        db.update_job_filter_results(job_id, 0.9, 'Great', [], [])
+        db.update_job_status(job_id, 'matched', decision_type='auto')
+
+        assert db.get_job_by_id(job_id).jd_markdown == sample_job_data['jd_markdown']
+        assert db.get_jobs_by_status('matched')[0].jd_markdown == sample_job_data['jd_markdown']
+
+        light = db.get_jobs_by_status('matched', include_description=False)[0]
+        assert light.jd_markdown is None and light.jd_raw is None
+        assert light.title == 'Senior Python Developer'
+        assert db.get_matched_jobs()[0].jd_markdown is None
+        assert db.search_jobs('python')[0].jd_markdown is None
+
+    def test_iter_jobs_by_status(self, db, sample_job_data):
+        """Test streaming jobs by status without a limit."""
+        for i in range(3):
+            db.insert_job({**sample_job_data, 'external_id': f'job{i}', 'url': f'https://linkedin.com/jobs/{i}'})
+
+        jobs = db.iter_jobs_by_status('new')
+
+        assert not isinstance(jobs, list)
+        assert len(list(jobs)) == 3
+        assert [job.id for job in db.iter_jobs_by_status('new', limit=1, offset=2)] == [
+            job.id for job in db.get_jobs_by_status('new', limit=1, offset=2)
+        ]
+
+    def test_get_job_summaries(self, db, sample_job_data):
+        """Test getting listing fields without building Job objects."""
+        job_id = db.insert_job(sample_job_data)
+
+        summaries = db.get_job_summaries('new')
+
+        assert len(summaries) == 1
+        assert summaries[0]['id'] == job_id
+        assert summaries[0]['title'] == 'Senior Python Developer'
+        assert 'jd_markdown' not in summaries[0]
+        assert db.get_job_summaries('matched') == []
+
+    def test_search_jobs(self, db, sample_job_data):
+        """Test full-text search with stemming, and that edits reindex."""
+        job_id = db.insert_job(sample_job_data)
+        db.insert_job({
+            **sample_job_data,
+            'external_id': 'rust-1',
+            'url': 'https://example.com/rust-1',
+            'title': 'Rust Engineer',
+            'jd_markdown': 'Build services in Rust'
+        })
+
+        assert [job.title for job in db.search_jobs('rust')] == ['Rust Engineer']
+        assert [job.id for job in db.search_jobs('developers')] == [job_id]
+
+        db.conn.execute("UPDATE jobs SET title = 'Go Developer' WHERE title = 'Rust Engineer'")
+        db.conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        db.conn.commit()
+        assert [job.title for job in db.search_jobs('go')] == ['Go Developer']
+        assert db.search_jobs('python') == []
+
     def test_update_job_status(self, db, sample_job_data):
         """Test updating job status."""
         job_id = db.insert_job(sample_job_data)
@@ -179,6 +427,21 @@ class TestJobOperations:
         assert job.decision_type == 'auto'
         assert job.filtered_at is not None
 
+    def test_update_job_status_timestamps(self, db, sample_job_data):
+        """Test that each status stamps only its own timestamp."""
+        job_id = db.insert_job(sample_job_data)
+
+        db.update_job_status(job_id, 'matched', decision_type='manual')
+        job = db.get_job_by_id(job_id)
+        assert (job.filtered_at, job.decided_at, job.applied_at) == (None, None, None)
+
+        db.update_job_status(job_id, 'skipped')
+        assert db.get_job_by_id(job_id).decided_at is not None
+
+        db.update_job_status(job_id, 'applied', decision_type='manual')
+        job = db.get_job_by_id(job_id)
+        assert job.applied_at is not None and job.filtered_at is None
+
     def test_update_job_filter_results(self, db, sample_job_data):
         """Test updating job with filter results."""
         job_id = db.insert_job(sample_job_data)
@@ -201,6 +464,40 @@ class TestJobOperations:
         assert job.red_flags == red_flags
         assert job.status == 'filtered'
 
+    def test_update_job_after_filter(self, db, sample_job_data):
+        """Test storing filter results and routed status in one update."""
+        job_id = db.insert_job(sample_job_data)
+
+        db.update_job_after_filter(
+            job_id, 0.9, 'Great', ['Python'], [], status='matched', decision_type='auto'
+        )
+        job = db.get_job_by_id(job_id)
+        assert (job.match_score, job.key_requirements) == (0.9, ['Python'])
+        assert (job.status, job.decision_type) == ('matched', 'auto')
+        assert job.filtered_at is not None and job.decided_at is None
+
+        db.update_job_after_filter(job_id, 0.0, 'Pre-filter', [], ['x'], status='rejected')
+        job = db.get_job_by_id(job_id)
+        assert (job.status, job.red_flags) == ('rejected', ['x'])
+        assert job.decided_at is not None
+
+    def test_update_jobs_after_filter(self, db, sample_job_data):
+        """Test applying several filter results in one call."""
+        first = db.insert_job(sample_job_data)
+        second = db.insert_job({**sample_job_data, 'external_id': 'job2', 'url': 'https://linkedin.com/jobs/2'})
+
+        db.update_jobs_after_filter([
+            {'job_id': first, 'score': 0.0, 'reasoning': 'Pre-filter', 'requirements': [],
+             'red_flags': ['clearance'], 'status': 'rejected'},
+            {'job_id': second, 'score': 0.7, 'reasoning': 'Good', 'requirements': ['Go'],
+             'red_flags': [], 'status': 'matched', 'decision_type': 'manual'},
+        ])
+
+        assert db.get_job_by_id(first).status == 'rejected'
+        assert db.get_job_by_id(first).decided_at is not None
+        job = db.get_job_by_id(second)
+        assert (job.status, job.decision_type, job.match_score) == ('matched', 'manual', 0.7)
+
     def test_get_matched_jobs(self, db, sample_job_data):
         """Test getting matched jobs by score."""
         # Insert jobs with different scores
@@ -225,6 +522,71 @@ class TestJobOperations:
         assert len(matched) == 2
         assert matched[0].match_score == 0.9  # Sorted by score DESC
 
+    def test_get_matched_jobs_by_decision_type_and_date(self, db, sample_job_data):
+        """Test filtering matched jobs by decision type and scrape date."""
+        sample_job_data['scraped_at'] = datetime(2026, 1, 29, 10, 30)
+        job_id1 = db.insert_job(sample_job_data)
+        db.update_job_filter_results(job_id1, 0.9, 'Great', [], [])
+        db.update_job_status(job_id1, 'matched', decision_type='auto')
+
+        sample_job_data['url'] = 'https://linkedin.com/jobs/124'
+        sample_job_data['external_id'] = 'job124'
+        job_id2 = db.insert_job(sample_job_data)
+        db.update_job_filter_results(job_id2, 0.9, 'Great', [], [])
+        db.update_job_status(job_id2, 'matched', decision_type='manual')
+
+        sample_job_data['url'] = 'https://linkedin.com/jobs/125'
+        sample_job_data['external_id'] = 'job125'
+        sample_job_data['scraped_at'] = datetime(2026, 1, 30, 0, 0)
+        job_id3 = db.insert_job(sample_job_data)
+        db.update_job_filter_results(job_id3, 0.9, 'Great', [], [])
+        db.update_job_status(job_id3, 'matched', decision_type='auto')
+
+        matched = db.get_matched_jobs(
+            min_score=0.85, decision_type='auto', date='2026-01-29'
+        )
+        assert [job.id for job in matched] == [job_id1]
+
+    def test_get_jobs_by_status_with_score_and_date(self, db, sample_job_data):
+        """Test filtering jobs by status, half-open score range and date."""
+        sample_job_data['scraped_at'] = datetime(2026, 1, 29, 23, 59)
+        for i, score in enumerate([0.6, 0.84, 0.85, 0.5]):
+            sample_job_data['url'] = f'https://linkedin.com/jobs/{i}'
+            sample_job_data['external_id'] = f'job{i}'
+            job_id = db.insert_job(sample_job_data)
+            db.update_job_filter_results(job_id, score, 'Ok', [], [])
+            db.update_job_status(job_id, 'approved')
+
+        jobs = db.get_jobs_by_status(
+            'approved', min_score=0.60, max_score=0.85, date='2026-01-29'
+        )
+        assert sorted(job.match_score for job in jobs) == [0.6, 0.84]
+
+        assert db.get_jobs_by_status('approved', date='2026-01-28') == []
+
+    def test_get_application_candidates(self, db, sample_job_data):
+        """Test fetching HIGH auto matches and approved MEDIUM jobs together."""
+        sample_job_data['scraped_at'] = datetime(2026, 1, 29, 9, 0)
+        cases = [
+            (0.92, 'matched', 'auto'),     # HIGH match
+            (0.95, 'matched', 'manual'),   # Not auto
+            (0.70, 'approved', 'manual'),  # Approved MEDIUM
+            (0.90, 'approved', 'manual'),  # Approved but HIGH score
+            (0.50, 'approved', 'manual'),  # Below MEDIUM
+        ]
+        ids = []
+        for i, (score, status, decision_type) in enumerate(cases):
+            sample_job_data['url'] = f'https://linkedin.com/jobs/{i}'
+            sample_job_data['external_id'] = f'job{i}'
+            job_id = db.insert_job(sample_job_data)
+            db.update_job_filter_results(job_id, score, 'Ok', [], [])
+            db.update_job_status(job_id, status, decision_type=decision_type)
+            ids.append(job_id)
+
+        candidates = db.get_application_candidates('2026-01-29')
+        assert [job.id for job in candidates] == [ids[0], ids[2]]
+        assert db.get_application_candidates('2026-01-30') == []
+
 
 
     def test_get_daily_stats(self, db, sample_job_data):
@@ -256,6 +618,31 @@ class TestJobOperations:
         assert stats['rejected'] == 1    # Score 0.5
         assert stats['medium_match'] == 0 # No medium match inserted
 
+    def test_get_daily_stats_applications(self, db, sample_job_data):
+        """Test application counters in daily statistics."""
+        from datetime import timezone
+        for i, (decision, app_status) in enumerate(
+            [('auto', 'submitted'), ('auto', 'failed'), ('manual', 'submitted')]
+        ):
+            job_id = db.insert_job({
+                **sample_job_data,
+                'external_id': f'job{i}',
+                'url': f'https://linkedin.com/jobs/{i}'
+            })
+            db.insert_application(job_id, f'resume{i}.pdf')
+            db.update_application_status(job_id, app_status)
+            db.update_job_status(job_id, 'applied', decision_type=decision)
+        db.update_job_status(db.insert_job(sample_job_data), 'pending_decision')
+
+        # applied_at is set from CURRENT_TIMESTAMP, which is UTC
+        stats = db.get_daily_stats(datetime.now(timezone.utc))
+
+        assert stats['auto_applied'] == 2
+        assert stats['manual_applied'] == 1
+        assert stats['failed'] == 1
+        assert stats['pending'] == 1
+        assert stats['success_rate'] == pytest.approx(2 / 3)
+
 
 class TestDeduplication:
     """Tests for duplicate detection."""
@@ -516,6 +903,7 @@ class TestLogging:
     def test_log_simple(self, db):
         """Test simple log entry."""
         db.log('info', 'scraper', 'Job scraped successfully')
+        db.flush_logs()
 
         cursor = db.conn.cursor()
         cursor.execute("SELECT * FROM logs ORDER BY id DESC LIMIT 1")
@@ -530,6 +918,7 @@ class TestLogging:
         """Test log entry with details."""
         details = {'job_id': 123, 'platform': 'linkedin'}
         db.log('error', 'applier', 'Application failed', details=details)
+        db.flush_logs()
 
         cursor = db.conn.cursor()
         cursor.execute("SELECT * FROM logs ORDER BY id DESC LIMIT 1")
@@ -542,6 +931,32 @@ class TestLogging:
         assert json.loads(log['details']) == details
 
 
+    def test_log_details_with_non_string_keys(self, db):
+        """Test that details serialize like json.dumps, int keys included."""
+        db.log('info', 'filter', 'Scores', details={1: 0.9, 'note': 'caf\u00e9'})
+        db.flush_logs()
+
+        import json
+        details = db.conn.execute("SELECT details FROM logs").fetchone()[0]
+        assert json.loads(details) == {'1': 0.9, 'note': 'caf\u00e9'}
+
+    def test_log_batches_in_background(self, tmp_path):
+        """Test that queued entries are written by the writer thread and on close."""
+        db = Database(str(tmp_path / "logs.db"))
+        db.init_schema()
+        for i in range(1200):
+            db.log('info', 'scraper', f'event {i}')
+        db.flush_logs()
+        assert db.conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0] == 1200
+
+        db.log('info', 'scraper', 'last')
+        db.close()
+
+        db = Database(str(tmp_path / "logs.db"))
+        assert db.conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0] == 1201
+        db.close()
+
+
 class TestTransactions:
     """Tests for transaction support."""
 
@@ -570,6 +985,24 @@ class TestTransactions:
         count = cursor.fetchone()['count']
         assert count == 0
 
+    def test_nested_transaction_joins_outer(self, db, sample_job_data):
+        """Test that writes in a nested block commit or roll back with the outer one."""
+        with pytest.raises(ValueError):
+            with db.transaction():
+                db.add_to_blacklist('company', 'BadCorp')
+                with db.transaction():
+                    db.insert_job(sample_job_data)
+                assert db.conn.in_transaction
+                raise ValueError("Test error")
+
+        assert db.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+        assert db.get_blacklist() == []
+
+        with db.transaction():
+            db.insert_job(sample_job_data)
+        assert not db.conn.in_transaction
+        assert db.get_jobs_by_status('new')[0].title == 'Senior Python Developer'
+
 
 class TestJobDataclassParsing:
     """Tests for Job dataclass JSON field parsing."""
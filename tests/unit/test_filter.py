@@ -8,6 +8,7 @@ Tests cover:
 """
 
 import pytest
+from collections import Counter
 from unittest.mock import AsyncMock, MagicMock, patch
 from dataclasses import dataclass
 
@@ -18,7 +19,7 @@ from src.core.filter import (
     DEFAULT_REJECT_KEYWORDS
 )
 from src.core.database import Job
-from src.core.llm import FilterResult
+from src.core.llm import FilterResult, InvalidResponseError
 from src.utils.config import Preferences
 from src.utils.markdown_parser import KeywordFilters
 
@@ -39,6 +40,46 @@ class MockPreferences:
             self.blacklisted_companies = ["Revature", "Infosys"]
 
 
+@pytest.fixture
+def mock_db():
+    """Mock database with an empty filter cache."""
+    db = MagicMock()
+    db.get_cached_filter_result.return_value = None
+    return db
+
+
+@pytest.fixture
+def mock_glm():
+    """Mock GLM client with no spend and unconfigured filter calls."""
+    glm = MagicMock()
+    glm.total_cost = 0.0
+    glm.filter_jobs_batch = AsyncMock()
+    glm.filter_job = AsyncMock()
+    return glm
+
+
+@pytest.fixture
+def mock_config():
+    """Mock config loader with test preferences and resume."""
+    config = MagicMock()
+    config.get_preferences.return_value = MockPreferences()
+    config.get_resume.return_value = MagicMock(summary="Python developer")
+    return config
+
+
+@pytest.fixture
+def make_service(mock_db, mock_glm, mock_config):
+    """Build a JobFilterService over the mocks that yields the given jobs."""
+    def _make(jobs, **kwargs):
+        mock_db.iter_jobs_by_status.side_effect = lambda *a, **k: iter(jobs)
+        service = JobFilterService(
+            db=mock_db, glm_client=mock_glm, config=mock_config, **kwargs
+        )
+        service._build_preference_summary = MagicMock(return_value="")
+        return service
+    return _make
+
+
 class TestPreFilter:
     """Test PreFilter class."""
 
@@ -93,6 +134,30 @@ class TestPreFilter:
         assert should_reject is False
         assert reason is None
 
+    def test_should_reject_keyword_is_literal(self):
+        """Test keywords match literally, not as regex patterns."""
+        prefs = MockPreferences(keywords=KeywordFilters(reject_keywords=["C++ only"], prefer_keywords=[]))
+        pre_filter = PreFilter(prefs)
+        
+        job = MagicMock(company="Good Corp", jd_markdown="Strictly c++ only shop")
+        assert pre_filter.should_reject(job) == (True, "Reject keyword found: 'c++ only'")
+        
+        job = MagicMock(company="Good Corp", jd_markdown="Ccc only")
+        assert pre_filter.should_reject(job) == (False, None)
+
+    def test_hyperscan_matches_regex(self):
+        """Test the Hyperscan scan agrees with the regex fallback."""
+        pytest.importorskip("hyperscan")
+        pre_filter = PreFilter(MockPreferences())
+        assert pre_filter._hs_db is not None
+        
+        for jd in ["Requires TS/SCI clearance", "Remote Python role", "No Sponsorship."]:
+            job = MagicMock(company="Good Corp", jd_markdown=jd)
+            hs_result = pre_filter.should_reject(job)
+            pre_filter._hs_db = None
+            assert pre_filter.should_reject(job) == hs_result
+            pre_filter._hs_db = pre_filter._compile_hyperscan(pre_filter.reject_keywords)
+
 
 class TestFilterStats:
     """Test FilterStats dataclass."""
@@ -136,6 +201,16 @@ class TestFilterStats:
         assert "High: 10" in stats_str
         assert "Cost: $0.0523" in stats_str
 
+    def test_filter_stats_from_outcomes(self):
+        """Test building stats from per-job outcome counts."""
+        outcomes = Counter(high=2, medium=1, rejected=3, pre_filtered=4, error=1)
+        stats = FilterStats.from_outcomes(11, outcomes, cost_usd=0.02)
+        
+        assert (stats.total, stats.high_match, stats.medium_match) == (11, 2, 1)
+        # Pre-filtered jobs count as rejected as well
+        assert (stats.rejected, stats.pre_filtered, stats.errors) == (7, 4, 1)
+        assert stats.cost_usd == 0.02
+
 
 class TestJobFilterService:
     """Test JobFilterService class."""
@@ -145,13 +220,109 @@ class TestJobFilterService:
         """Test filtering when no new jobs."""
         # Mock database with no jobs
         mock_db = MagicMock()
-        mock_db.get_jobs_by_status.return_value = []
+        mock_db.iter_jobs_by_status.return_value = iter([])
         
         service = JobFilterService(db=mock_db)
         stats = await service.filter_new_jobs()
         
         assert stats.total == 0
 
+    @pytest.mark.asyncio
+    async def test_filter_new_jobs_concurrent_batch(self, mock_db, mock_glm, make_service, make_filter_result):
+        """Test batch results are folded into stats and failures counted."""
+        service = make_service([
+            MagicMock(id=1, title="ML Engineer", company="Acme", jd_markdown="Python ML"),
+            MagicMock(id=2, title="AI Engineer", company="Beta", jd_markdown="LLM agents"),
+            MagicMock(id=3, title="Data Engineer", company="Gamma", jd_markdown="Spark"),
+            MagicMock(id=4, title="Java Developer", company="Revature", jd_markdown="Java"),
+        ])
+        # A failed batched request falls back to one request per job
+        mock_glm.filter_jobs_batch.side_effect = InvalidResponseError("bad array")
+        mock_glm.filter_job.side_effect = [
+            make_filter_result(0.9),
+            RuntimeError("API down"),
+            make_filter_result(0.3),
+        ]
+
+        stats = await service.filter_new_jobs(batch_size=4)
+
+        assert stats.total == 4
+        assert stats.high_match == 1
+        assert stats.pre_filtered == 1
+        assert stats.rejected == 2
+        assert stats.errors == 1
+        assert mock_glm.filter_job.await_count == 3
+        
+        # Pre-filter rejects are written together, without an LLM call
+        (rejects,), _ = mock_db.update_jobs_after_filter.call_args_list[0]
+        assert [r["job_id"] for r in rejects] == [4]
+
+    @pytest.mark.asyncio
+    async def test_filter_new_jobs_all_pre_filtered(self, mock_db, mock_glm, make_service):
+        """Test batches emptied by the pre-filter skip the LLM and rate limit."""
+        service = make_service([
+            MagicMock(id=i, title="Java Developer", company="Revature", jd_markdown="Java")
+            for i in range(4)
+        ])
+
+        with patch("src.core.filter.asyncio.sleep", AsyncMock()) as sleep:
+            stats = await service.filter_new_jobs(batch_size=2)
+
+        assert (stats.total, stats.pre_filtered, stats.rejected) == (4, 4, 4)
+        assert mock_db.update_jobs_after_filter.call_count == 2
+        mock_glm.filter_jobs_batch.assert_not_awaited()
+        mock_glm.filter_job.assert_not_awaited()
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_filter_new_jobs_batched_request(self, mock_glm, make_service, make_filter_result):
+        """Test a batch is scored with one GLM request when it succeeds."""
+        service = make_service([
+            MagicMock(id=1, title="ML Engineer", company="Acme", jd_markdown="Python ML"),
+            MagicMock(id=2, title="AI Engineer", company="Beta", jd_markdown="LLM agents"),
+        ])
+        mock_glm.filter_jobs_batch.return_value = [make_filter_result(0.9), make_filter_result(0.65)]
+
+        stats = await service.filter_new_jobs(batch_size=2)
+
+        assert (stats.high_match, stats.medium_match, stats.errors) == (1, 1, 0)
+        mock_glm.filter_jobs_batch.assert_awaited_once()
+        mock_glm.filter_job.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_filter_new_jobs_uses_cached_result(self, mock_db, mock_glm, make_service, make_filter_result):
+        """Test a cached result is reused instead of calling GLM."""
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = make_filter_result(0.7)
+        service = make_service([
+            MagicMock(id=1, title="ML Engineer", company="Acme", jd_markdown="Python ML"),
+        ], cache=mock_cache)
+
+        stats = await service.filter_new_jobs()
+
+        assert stats.medium_match == 1
+        mock_glm.filter_job.assert_not_awaited()
+        (rows,), _ = mock_db.update_jobs_after_filter.call_args
+        assert [(r["job_id"], r["status"], r["decision_type"]) for r in rows] == [(1, "matched", "manual")]
+
+    @pytest.mark.asyncio
+    async def test_preference_summary_memoized(self, mock_glm, mock_config, make_service, make_filter_result):
+        """Test the preference summary is built once until invalidated."""
+        service = make_service([
+            MagicMock(id=1, title="ML Engineer", company="Acme", jd_markdown="Python ML"),
+        ])
+        mock_glm.filter_job.return_value = make_filter_result(0.3)
+        build = service._build_preference_summary
+
+        await service.filter_new_jobs()
+        await service.filter_new_jobs()
+        assert build.call_count == 1
+
+        service.invalidate_preferences()
+        await service.filter_new_jobs()
+        assert build.call_count == 2
+        mock_config.reload.assert_called_once()
+
     def test_score_routing_high_match(self):
         """Test routing for high score (>= 0.85)."""
         # Test that scores >= 0.85 become status='matched', decision_type='auto'
@@ -365,6 +365,32 @@ def test_import_process():
     print("\n?All tests passed!")
 
 
+def test_import_skips_bad_rows(tmp_path):
+    """A row that fails to normalize is counted, not fatal to the file."""
+    jobs = [
+        {"title": "Backend Engineer", "company": "Acme",
+         "description": "Python services.", "url": "https://linkedin.com/jobs/acme-1"},
+        {"title": "Data Engineer", "company": "Globex",
+         "description": "Spark pipelines.", "url": "https://linkedin.com/jobs/globex-2"},
+        {"title": "Frontend Engineer", "company": "Initech",
+         "description": "React apps."},
+    ]
+    json_path = tmp_path / "linkedin_scraped.json"
+    json_path.write_text(json.dumps(jobs), encoding='utf-8')
+
+    db = Database(":memory:")
+    db.init_schema()
+    stats = AntigravityImporter(db=db).import_json_file(str(json_path))
+
+    cursor = db.conn.cursor()
+    cursor.execute("SELECT COUNT(*) as count FROM jobs")
+    assert cursor.fetchone()['count'] == 2
+    assert stats['total_jobs'] == 3
+    assert stats['new_jobs'] == 2
+    assert stats['errors'] == 1
+    assert stats['by_source']['linkedin']['errors'] == 1
+
+
 def cleanup_test_files():
     """Remove test JSON files."""
     data_dir = Path("data")
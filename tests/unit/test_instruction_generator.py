@@ -30,7 +30,7 @@ def test_read_preferences():
     print_section("Test 1: Reading Preferences")
 
     try:
-        generator = InstructionGenerator()
+        generator = InstructionGenerator(cache_dir=None)
         preferences = generator.read_preferences()
 
         print(f"\nJob Titles ({len(preferences['job_titles'])} found):")
@@ -64,7 +64,7 @@ def test_read_credentials():
     print_section("Test 2: Reading Credentials")
 
     try:
-        generator = InstructionGenerator()
+        generator = InstructionGenerator(cache_dir=None)
         credentials = generator.read_credentials()
 
         print(f"\nPlatforms with credentials ({len(credentials)} found):")
@@ -92,7 +92,7 @@ def test_generate_instructions():
     print_section("Test 3: Generating Instructions")
 
     try:
-        generator = InstructionGenerator()
+        generator = InstructionGenerator(cache_dir=None)
 
         # Generate instructions to a test directory
         test_output_dir = project_root / "instructions" / "test"
@@ -222,7 +222,7 @@ def test_generate_sample():
     print_section("Test 5: Generating Sample/Example File")
 
     try:
-        generator = InstructionGenerator()
+        generator = InstructionGenerator(cache_dir=None)
 
         # Generate the example file
         result = generator.generate_sample()
@@ -249,6 +249,105 @@ def test_generate_sample():
         return False
 
 
+def test_read_preferences_sections(tmp_path):
+    """Test section parsing for the new and old preferences formats."""
+    new_format = tmp_path / "new.md"
+    new_format.write_text(
+        "## Target Positions\n\n"
+        "### Primary (2 positions)\n"
+        "- AI Engineer\n"
+        "- Focus on production systems\n"
+        "- ML Engineer\n\n"
+        "### Secondary (1 position)\n"
+        "- SDET\n\n"
+        "## Location Requirements\n\n"
+        "### Preferred\n"
+        "- Remote (fully remote)\n"
+        "- United States (onsite)\n\n"
+        "### Platforms\n"
+        "- linkedin: enabled\n"
+        "- indeed: disabled\n",
+        encoding="utf-8"
+    )
+    preferences = InstructionGenerator(
+        str(new_format), cache_dir=str(tmp_path / "cache")
+    ).read_preferences()
+    assert preferences['job_titles'] == ['AI Engineer', 'ML Engineer', 'SDET']
+    assert preferences['locations'] == ['Remote (fully remote)']
+    assert preferences['enabled_platforms'] == ['linkedin']
+
+    old_format = tmp_path / "old.md"
+    old_format.write_text(
+        "### Primary Interest: AI\n"
+        "- Applied Scientist\n"
+        "### Also Consider\n"
+        "- DevOps Engineer\n"
+        "- Broader platform roles\n\n"
+        "## Salary\n\n"
+        "- Minimum: $95,000\n",
+        encoding="utf-8"
+    )
+    preferences = InstructionGenerator(
+        str(old_format), cache_dir=str(tmp_path / "cache")
+    ).read_preferences()
+    assert preferences['job_titles'] == ['Applied Scientist', 'DevOps Engineer']
+    assert preferences['filters']['min_salary'] == 95000
+    assert preferences['locations'] == ['Remote', 'Canada']
+
+
+def test_read_credentials_stay_in_section(tmp_path):
+    """Test that a platform without a yaml block does not take the next one."""
+    creds = tmp_path / "creds.md"
+    creds.write_text(
+        "### LinkedIn\n"
+        "Not configured yet\n\n"
+        "### Indeed (Google SSO)\n"
+        "```yaml\n"
+        "email: me@example.com\n"
+        "password: a:b:c\n"
+        "login_method: google\n"
+        "```\n",
+        encoding="utf-8"
+    )
+    credentials = InstructionGenerator(
+        credentials_path=str(creds), cache_dir=str(tmp_path / "cache")
+    ).read_credentials()
+    assert credentials == {
+        'indeed': {'email': 'me@example.com', 'password': 'a:b:c', 'login_method': 'google'}
+    }
+
+
+def test_read_preferences_cache(tmp_path):
+    """Test that parsed preferences are reused until the file changes."""
+    prefs = tmp_path / "prefs.md"
+    prefs.write_text("### Primary (1 position)\n- AI Engineer\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    first = InstructionGenerator(str(prefs), cache_dir=str(cache_dir)).read_preferences()
+    assert (cache_dir / "preferences.pkl").exists()
+
+    generator = InstructionGenerator(str(prefs), cache_dir=str(cache_dir))
+    generator._split_sections = None  # a cache hit must not re-parse
+    assert generator.read_preferences() == first
+
+    prefs.write_text("### Primary (1 position)\n- MLOps Engineer\n", encoding="utf-8")
+    changed = InstructionGenerator(str(prefs), cache_dir=str(cache_dir)).read_preferences()
+    assert changed['job_titles'] == ['MLOps Engineer']
+
+
+def test_extract_titles_skips_punctuated_descriptions(tmp_path):
+    """Test that skip words still match with trailing punctuation."""
+    generator = InstructionGenerator(cache_dir=str(tmp_path))
+    titles = generator._extract_titles_from_section([
+        "AI Engineer",
+        "Focus: production ML systems",
+        "Your, team's priorities",
+        "These. are notes",
+        "ML Engineer",
+    ])
+    assert titles == ['AI Engineer', 'ML Engineer']
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 80)
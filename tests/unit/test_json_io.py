@@ -0,0 +1,27 @@
+"""Unit tests for the JSON output helpers."""
+
+import json
+import shutil
+
+from src.utils import json_io
+from src.utils.json_io import ensure_dir, write_json
+
+
+def test_ensure_dir_caches_absolute_path(tmp_path, monkeypatch):
+    """Test relative and absolute spellings of a directory share one entry."""
+    monkeypatch.chdir(tmp_path)
+    before = set(json_io._DIRS_READY)
+    ensure_dir("out")
+    ensure_dir(tmp_path / "out")
+
+    assert json_io._DIRS_READY - before == {str(tmp_path / "out")}
+
+
+def test_write_json_recreates_removed_dir(tmp_path):
+    """Test a directory deleted after ensure_dir cached it is created again."""
+    out_dir = ensure_dir(tmp_path / "out")
+    shutil.rmtree(out_dir)
+
+    write_json(out_dir / "data.json", {"a": 1})
+
+    assert json.loads((out_dir / "data.json").read_text(encoding="utf-8")) == {"a": 1}
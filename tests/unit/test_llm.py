@@ -94,6 +94,76 @@ class TestGLMClient:
             except (RateLimitError, tenacity.RetryError):
                 pass  # Expected
 
+    @pytest.mark.asyncio
+    async def test_filter_jobs_batch(self):
+        """Test batched filtering maps the result array back in order."""
+        client = GLMClient(api_key="test")
+        response = MagicMock(
+            content='{"results": [{"job": 1, "score": 0.9, "reasoning": "A"}, '
+                    '{"job": 2, "score": 0.4, "reasoning": "B"}]}',
+            cost_usd=0.002
+        )
+        
+        with patch.object(client, "chat", AsyncMock(return_value=response)) as chat:
+            results = await client.filter_jobs_batch(["JD one", "JD two"], "Resume", "Prefs")
+        
+        assert [r.score for r in results] == [0.9, 0.4]
+        assert results[1].reasoning == "B"
+        assert results[0].cost_usd == pytest.approx(0.001)
+        prompt = chat.call_args[0][0][1]["content"]
+        assert "## Job 1\nJD one" in prompt and "## Job 2\nJD two" in prompt
+
+    @pytest.mark.asyncio
+    async def test_filter_job_shares_system_prompt(self):
+        """Test profile and preferences go in one system message reused per job."""
+        client = GLMClient(api_key="test")
+        response = MagicMock(content='{"score": 0.5}', cost_usd=0.0)
+        
+        with patch.object(client, "chat", AsyncMock(return_value=response)) as chat:
+            await client.filter_job("JD one", "Resume", "Prefs")
+            await client.filter_job("JD two", "Resume", "Prefs")
+        
+        first, second = (call[0][0] for call in chat.call_args_list)
+        assert first[0]["role"] == "system" and "Resume" in first[0]["content"]
+        assert first[0] == second[0]
+        assert "JD one" in first[1]["content"] and "JD one" not in first[0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_filter_jobs_batch_out_of_order(self):
+        """Test results are matched to jobs by their job number."""
+        client = GLMClient(api_key="test")
+        response = MagicMock(
+            content='{"results": [{"job": 2, "score": 0.4}, {"job": 1, "score": 0.9}]}',
+            cost_usd=0.0
+        )
+        
+        with patch.object(client, "chat", AsyncMock(return_value=response)):
+            results = await client.filter_jobs_batch(["JD one", "JD two"], "Resume", "Prefs")
+        
+        assert [r.score for r in results] == [0.9, 0.4]
+
+    @pytest.mark.asyncio
+    async def test_filter_jobs_batch_bad_job_index_raises(self):
+        """Test a missing, duplicated or out-of-range job number is rejected."""
+        client = GLMClient(api_key="test")
+        
+        for results in ('[{"job": 1}, {"job": 1}]', '[{"job": 1}, {"job": 3}]',
+                        '[{"job": 1}, {"score": 0.5}]'):
+            response = MagicMock(content=f'{{"results": {results}}}', cost_usd=0.0)
+            with patch.object(client, "chat", AsyncMock(return_value=response)):
+                with pytest.raises(InvalidResponseError, match="job index"):
+                    await client.filter_jobs_batch(["JD one", "JD two"], "Resume", "Prefs")
+
+    @pytest.mark.asyncio
+    async def test_filter_jobs_batch_count_mismatch_raises(self):
+        """Test a result array of the wrong length is rejected."""
+        client = GLMClient(api_key="test")
+        response = MagicMock(content='{"results": [{"score": 0.9}]}', cost_usd=0.0)
+        
+        with patch.object(client, "chat", AsyncMock(return_value=response)):
+            with pytest.raises(InvalidResponseError, match="Expected 2 results"):
+                await client.filter_jobs_batch(["JD one", "JD two"], "Resume", "Prefs")
+
     def test_parse_json_response_clean(self):
         """Test parsing clean JSON response."""
         client = GLMClient(api_key="test")
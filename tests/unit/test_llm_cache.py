@@ -0,0 +1,71 @@
+"""Unit tests for the filter result cache."""
+
+import pytest
+
+from src.core.database import Database
+import src.core.llm_cache as llm_cache
+from src.core.llm_cache import FilterCache
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory database for testing."""
+    database = Database(":memory:")
+    database.init_schema()
+    yield database
+    database.close()
+
+
+class TestFilterCache:
+    """Test FilterCache class."""
+
+    def test_key_depends_on_every_input(self):
+        """Test that changing the JD, resume or preferences changes the key."""
+        key = FilterCache.key("jd", "resume", "prefs")
+
+        assert key == FilterCache.key("jd", "resume", "prefs")
+        assert key != FilterCache.key("jd2", "resume", "prefs")
+        assert key != FilterCache.key("jd", "resume2", "prefs")
+        assert key != FilterCache.key("jd", "resume", "prefs2")
+        # Inputs are delimited, so shifting text between them is a new key
+        assert FilterCache.key("ab", "c", "") != FilterCache.key("a", "bc", "")
+
+    def test_key_depends_on_prompt_version(self, monkeypatch):
+        """Test that bumping the prompt version invalidates old keys."""
+        key = FilterCache.key("jd", "resume", "prefs")
+        monkeypatch.setattr(llm_cache, "_PROMPT_VERSION", "next")
+
+        assert FilterCache.key("jd", "resume", "prefs") != key
+
+    def test_get_miss_returns_none(self, db):
+        """Test a key never stored is a miss."""
+        assert FilterCache(db).get(FilterCache.key("jd", "r", "p")) is None
+
+    def test_put_persists_across_instances(self, db, make_filter_result):
+        """Test stored results are read back from the database."""
+        key = FilterCache.key("jd", "r", "p")
+        result = make_filter_result(
+            0.8, key_requirements=["Python"], remote_compatible=False, cost_usd=0.001
+        )
+        FilterCache(db).put(key, result)
+
+        cached = FilterCache(db).get(key)
+
+        assert cached.score == 0.8
+        assert cached.key_requirements == ["Python"]
+        assert cached.remote_compatible is False
+        # Reusing a result costs nothing
+        assert cached.cost_usd == 0.0
+
+    def test_memory_evicts_least_recently_used(self, db, make_filter_result):
+        """Test the in-memory layer keeps at most max_entries results."""
+        cache = FilterCache(db, max_entries=2)
+        cache.put("a", make_filter_result(0.1))
+        cache.put("b", make_filter_result(0.2))
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("c", make_filter_result(0.3))
+
+        assert list(cache._memory) == ["a", "c"]
+        # An evicted entry is still served from the database
+        assert cache.get("b").score == 0.2
+        assert list(cache._memory) == ["c", "b"]